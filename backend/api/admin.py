@@ -4,12 +4,18 @@ Admin endpoints - Management tasks and data refresh triggers
 
 from fastapi import APIRouter, Header, HTTPException, status
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
-import uuid
-from datetime import datetime
+from typing import Optional, Dict, Any, List
 import logging
 
 from core.config import settings
+from services.readers import data_reader
+from services.cache import cache_manager
+from services.caching import endpoint_stats
+from services.snapshots import snapshot_store
+from services.live import live_scoreboard
+from services.export import export_limiter
+from services.jobs import job_manager
+from services.scheduler import refresh_scheduler
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -22,6 +28,12 @@ class JobRequest(BaseModel):
     params: Optional[Dict[str, Any]] = None
 
 
+class CacheInvalidateRequest(BaseModel):
+    """Request body for cache invalidation"""
+
+    tags: List[str]  # e.g. table:injuries, schedules:team:KC, play_by_play:game:<id>
+
+
 class JobResponse(BaseModel):
     """Response from job trigger"""
 
@@ -29,6 +41,7 @@ class JobResponse(BaseModel):
     status: str
     action: str
     created_at: str
+    deduplicated: bool = False
 
 
 @router.post("/admin/jobs")
@@ -41,9 +54,10 @@ async def trigger_job(
     Requires X-API-Key header with admin API key
 
     - **action**: Job action (refresh_season_stats, refresh_power_ratings, load_schedules, etc.)
-    - **params**: Optional parameters for job
+    - **params**: Optional parameters for job (season, force)
 
-    Returns: job_id and status
+    Returns: job_id and status. If the same action with the same params is
+    already queued or running, that job is returned with deduplicated=true.
 
     Example:
     ```
@@ -71,40 +85,18 @@ async def trigger_job(
                 detail="Invalid API key",
             )
 
-        # Validate action
-        valid_actions = [
-            "refresh_season_stats",
-            "refresh_power_ratings",
-            "load_schedules",
-            "load_player_stats",
-            "load_pbp",
-            "load_injuries",
-            "load_depth_charts",
-            "refresh_all",
-        ]
-
-        if job_request.action not in valid_actions:
-            logger.warning(f"Invalid job action: {job_request.action}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid action. Valid actions: {', '.join(valid_actions)}",
-            )
-
-        # Generate job ID
-        job_id = str(uuid.uuid4())
-
-        logger.info(
-            f"Job triggered: {job_request.action} (job_id={job_id}, params={job_request.params})"
-        )
-
-        # TODO: Enqueue job to background worker (RQ/Celery/etc)
-        # For now, just return acknowledgment
+        try:
+            job, deduplicated = await job_manager.submit(job_request.action, job_request.params)
+        except ValueError as e:
+            logger.warning(f"Invalid job request: {job_request.action} ({e})")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
         return JobResponse(
-            job_id=job_id,
-            status="queued",
-            action=job_request.action,
-            created_at=datetime.utcnow().isoformat(),
+            job_id=job["job_id"],
+            status=job["status"],
+            action=job["action"],
+            created_at=job["created_at"],
+            deduplicated=deduplicated,
         )
 
     except HTTPException:
@@ -126,7 +118,8 @@ async def get_job_status(job_id: str, x_api_key: str = Header(None)) -> dict:
 
     - **job_id**: Job ID returned from job trigger
 
-    Returns: job status (queued, running, completed, failed, etc.)
+    Returns: job status (queued, running, completed or failed), progress
+    (percent of stages finished), per-stage status, timings and the ETL result
     """
     try:
         # Validate API key
@@ -135,16 +128,13 @@ async def get_job_status(job_id: str, x_api_key: str = Header(None)) -> dict:
                 status_code=status.HTTP_403_FORBIDDEN, detail="Invalid API key"
             )
 
-        # TODO: Get job status from background worker
-        # For now, return placeholder
+        job = await job_manager.get(job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found"
+            )
 
-        return {
-            "job_id": job_id,
-            "status": "completed",
-            "action": "refresh_season_stats",
-            "progress": 100,
-            "message": "Job completed successfully",
-        }
+        return job
 
     except HTTPException:
         raise
@@ -154,3 +144,73 @@ async def get_job_status(job_id: str, x_api_key: str = Header(None)) -> dict:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error fetching job status",
         )
+
+
+@router.get("/admin/stats")
+async def get_runtime_stats(x_api_key: str = Header(None)) -> dict:
+    """
+    Get runtime metrics (database pool usage, query timings, cache hit ratios)
+
+    Requires X-API-Key header
+    """
+    try:
+        # Validate API key
+        if x_api_key != settings.API_KEY:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Invalid API key"
+            )
+
+        return {
+            "database": data_reader.pool_stats(),
+            "cache": cache_manager.stats(),
+            "endpoints": endpoint_stats(),
+            "snapshots": snapshot_store.stats(),
+            "live": live_scoreboard.stats(),
+            "exports": export_limiter.stats(),
+            "jobs": job_manager.stats(),
+            "scheduler": refresh_scheduler.stats(),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching runtime stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching runtime stats",
+        )
+
+
+@router.post("/admin/cache/invalidate")
+async def invalidate_cache(
+    invalidate_request: CacheInvalidateRequest, x_api_key: str = Header(None)
+) -> dict:
+    """
+    Invalidate every cached entry registered under the given tags
+
+    Requires X-API-Key header
+
+    - **tags**: Cache tags (e.g. table:injuries, schedules:team:KC, play_by_play:game:<id>)
+
+    Returns: number of invalidated keys
+    """
+    try:
+        # Validate API key
+        if x_api_key != settings.API_KEY:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Invalid API key"
+            )
+
+        invalidated = await cache_manager.invalidate_tags(*invalidate_request.tags)
+        logger.info(f"Cache invalidated via admin: {invalidate_request.tags} ({invalidated} keys)")
+
+        return {"tags": invalidate_request.tags, "invalidated": invalidated}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error invalidating cache: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error invalidating cache",
+        )
@@ -7,17 +7,27 @@ from typing import Optional, List
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager
+from services.cache import cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/depth_charts")
+@cached(
+    key=lambda team, season, week, fields: f"depth_charts:{team}:{season}:{week}:{fields}",
+    ttl_seconds=300,
+    stale_ttl_seconds=900,
+    tags=lambda team, season, week: cache_tags("depth_charts", season, week, team),
+)
 async def get_depth_charts(
     team: str = Query(..., description="Team abbreviation (e.g., KC)"),
     season: int = Query(2025, description="Season year"),
     week: Optional[int] = Query(None, description="Week number"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. player_id,position,depth_rank)"
+    ),
 ) -> List[dict]:
     """
     Get depth chart for team
@@ -25,28 +35,13 @@ async def get_depth_charts(
     - **team**: Team abbreviation (e.g., KC, BUF, DAL)
     - **season**: Season year (e.g., 2025)
     - **week**: Optional week number (gets latest if not specified)
+    - **fields**: Optional comma-separated columns to return
 
     Returns: sorted list of players by position and depth rank
-    Cache: 5 minutes (changes weekly, sometimes mid-week)
+    Cache: 5 minutes (changes weekly, sometimes mid-week), served stale for 15 more
     """
-    try:
-        cache_key = f"depth_charts:{team}:{season}:{week}"
+    columns = parse_fields(fields, "depth_charts")
+    depth = await data_reader.read_depth_charts(team, season, week, columns)
 
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: depth_charts {team} {season} week {week}")
-            return cached
-
-        # Query database
-        depth = await data_reader.read_depth_charts(team, season, week)
-
-        # Cache for 5 minutes (changes mid-week sometimes)
-        await cache_manager.set(cache_key, depth, ttl_seconds=300)
-
-        logger.debug(f"Returned {len(depth)} depth chart entries")
-        return depth
-
-    except Exception as e:
-        logger.error(f"Error fetching depth charts for {team}: {e}")
-        return {"status": "error", "message": str(e)}
+    logger.debug(f"Read {len(depth)} depth chart entries")
+    return depth
@@ -0,0 +1,110 @@
+"""
+Export endpoints - Stream whole tables (or large slices) for analytics jobs
+"""
+
+from fastapi import APIRouter, Path, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from typing import Optional, List, Dict, Any, AsyncIterator
+import logging
+
+from core.config import settings
+from services.readers import data_reader, EXPORT_KEYS, export_columns, export_filters
+from services.caching import canonicalize, parse_fields
+from services.export import EXPORT_FORMATS, export_limiter, ndjson_stream, arrow_stream
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/export/{table}")
+async def export_table(
+    table: str = Path(..., description=f"Table to export ({', '.join(EXPORT_KEYS)})"),
+    format: str = Query("ndjson", description="ndjson or arrow (Arrow IPC stream)"),
+    season: Optional[int] = Query(None, description="Season year"),
+    week: Optional[int] = Query(None, description="Week number"),
+    team: Optional[str] = Query(None, description="Team abbreviation"),
+    game_id: Optional[str] = Query(None, description="Game ID"),
+    player_id: Optional[str] = Query(None, description="Player ID"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to export"),
+) -> Response:
+    """
+    Stream a table as NDJSON or an Arrow IPC stream
+
+    - **table**: schedules, player_stats, injuries, depth_charts or play_by_play
+    - **format**: `ndjson` (one JSON object per line) or `arrow`
+      (Arrow IPC stream format, e.g. `pyarrow.ipc.open_stream`)
+    - **season**, **week**, **team**, **game_id**, **player_id**: Optional
+      equality filters (where the table has the column)
+    - **fields**: Optional comma-separated columns (the table's key is always included)
+
+    Rows are read through a server-side cursor (Postgres backend) or keyset
+    pages (Supabase backend) and sent EXPORT_BATCH_SIZE rows at a time, ordered
+    by the table's key - memory use does not grow with the export.
+    Not cached. At most EXPORT_MAX_CONCURRENT exports run at once (429 beyond).
+    """
+    def error(message: str, status_code: int = 200) -> JSONResponse:
+        return JSONResponse({"status": "error", "message": message}, status_code=status_code)
+
+    if table not in EXPORT_KEYS:
+        return error(f"Cannot export {table} (one of: {', '.join(EXPORT_KEYS)})")
+    if format not in EXPORT_FORMATS:
+        return error(f"Unknown format {format} (one of: {', '.join(EXPORT_FORMATS)})")
+
+    try:
+        columns = export_columns(table, parse_fields(canonicalize("fields", fields), table))
+        filters = export_filters(
+            table,
+            {
+                "season": season,
+                "week": week,
+                "team": canonicalize("team", team),
+                "game_id": canonicalize("game_id", game_id),
+                "player_id": canonicalize("player_id", player_id),
+            },
+        )
+    except ValueError as e:
+        return error(str(e))
+
+    if not export_limiter.try_acquire():
+        return error("Too many exports running - retry shortly", status_code=429)
+
+    batches = data_reader.iter_rows(table, filters, columns, settings.EXPORT_BATCH_SIZE)
+
+    async def rows() -> AsyncIterator[List[Dict[str, Any]]]:
+        try:
+            async for batch in batches:
+                export_limiter.rows += len(batch)
+                yield batch
+        finally:
+            await batches.aclose()
+            export_limiter.release()
+
+    stream = ndjson_stream(rows()) if format == "ndjson" else arrow_stream(rows(), columns)
+    try:
+        # Produce the first chunk before committing to a 200 response - this
+        # also starts the generator, so its cleanup runs even if the client
+        # disconnects before the body is sent
+        head = await stream.__anext__()
+    except StopAsyncIteration:
+        head = b""
+    except Exception as e:
+        export_limiter.failed += 1
+        logger.error(f"Export of {table} failed: {e}")
+        return error(f"Export of {table} failed", status_code=500)
+
+    async def body() -> AsyncIterator[bytes]:
+        yield head
+        try:
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            # Headers are already sent - the client sees a truncated stream
+            export_limiter.failed += 1
+            logger.error(f"Export of {table} failed mid-stream: {e}")
+            raise
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
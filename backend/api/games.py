@@ -2,45 +2,71 @@
 Games endpoints - Full game details
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse, Response
+from typing import List
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager
+from services.cache import cache_key_game, cache_tags
+from services.caching import cached, parse_ids, get_or_load_many, batch_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/games/{game_id}")
-async def get_game_details(game_id: str) -> dict:
+def game_tags(game_id: str) -> List[str]:
+    """Tags of cached game details (schedule row + PBP sample)"""
+    return cache_tags("schedules", game_id=game_id) + cache_tags("play_by_play", game_id=game_id)
+
+
+@router.get("/games")
+async def get_games(
+    ids: str = Query(..., description="Comma-separated game IDs (max 100)"),
+) -> Response:
     """
-    Get full game details including schedule, PBP sample, teams
+    Get details of several games in one request
 
-    - **game_id**: Game ID (format: YYYYMMDD_AWAYTEAM_HOMETEAM)
+    - **ids**: Comma-separated game IDs
 
-    Returns: full game object with schedule info and PBP sample
+    Returns: {"games": [games in request order], "missing": [unknown ids]}
+    Cache: shares the per-game entries of /games/{game_id} - one cache
+    multi-get, then one batched read for the misses only
     """
     try:
-        cache_key = f"game:{game_id}"
+        game_ids = parse_ids(ids)
+        found = await get_or_load_many(
+            game_ids,
+            cache_key_game,
+            data_reader.read_games,
+            ttl_seconds=60,
+            stale_ttl_seconds=300,
+            tags=game_tags,
+        )
+        return batch_response("games", game_ids, found)
 
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: game {game_id}")
-            return cached
-
-        # Query database
-        game = await data_reader.read_game(game_id)
+    except ValueError as e:
+        return JSONResponse({"status": "error", "message": str(e), "games": [], "missing": []})
+    except Exception as e:
+        logger.error(f"Error fetching games {ids}: {e}")
+        return JSONResponse({"status": "error", "message": str(e), "games": [], "missing": []})
 
-        if not game:
-            return {"status": "error", "message": f"Game {game_id} not found"}
 
-        # Cache for 60 seconds
-        await cache_manager.set(cache_key, game, ttl_seconds=60)
+@router.get("/games/{game_id}")
+@cached(
+    key=cache_key_game,
+    ttl_seconds=60,
+    stale_ttl_seconds=300,
+    tags=game_tags,
+    not_found=lambda game_id: f"Game {game_id} not found",
+)
+async def get_game_details(game_id: str) -> dict:
+    """
+    Get full game details including schedule, PBP sample, teams
 
-        return game
+    - **game_id**: Game ID (format: YYYYMMDD_AWAYTEAM_HOMETEAM)
 
-    except Exception as e:
-        logger.error(f"Error fetching game {game_id}: {e}")
-        return {"status": "error", "message": str(e)}
+    Returns: full game object with schedule info and PBP sample
+    Cache: 60 seconds, served stale for 5 more minutes (not-found is not cached)
+    """
+    return await data_reader.read_game(game_id) or None
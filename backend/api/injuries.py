@@ -7,17 +7,28 @@ from typing import Optional, List
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager
+from services.cache import cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/injuries")
+@cached(
+    key=lambda season, week, team, fields: f"injuries:{season}:{week}:{team}:{fields}",
+    ttl_seconds=60,
+    stale_ttl_seconds=300,
+    tags=lambda season, week, team: cache_tags("injuries", season, week, team),
+    table=lambda injuries: injuries,
+)
 async def get_injuries(
     season: int = Query(2025, description="Season year"),
     week: Optional[int] = Query(None, description="Week number"),
     team: Optional[str] = Query(None, description="Team abbreviation"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. player_id,report_status)"
+    ),
 ) -> List[dict]:
     """
     Get injury reports for season/week/team
@@ -25,28 +36,14 @@ async def get_injuries(
     - **season**: Season year (e.g., 2025)
     - **week**: Optional week number filter
     - **team**: Optional team abbreviation filter
+    - **fields**: Optional comma-separated columns to return
+    - **format**: json (default), arrow or parquet - also negotiated from Accept
 
     Returns: list of injured players with status
-    Cache: 60 seconds (updated frequently)
+    Cache: 60 seconds (updated frequently), served stale for 5 more minutes
     """
-    try:
-        cache_key = f"injuries:{season}:{week}:{team}"
+    columns = parse_fields(fields, "injuries")
+    injuries = await data_reader.read_injuries(season, week, team, columns)
 
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: injuries {season}/{week}/{team}")
-            return cached
-
-        # Query database
-        injuries = await data_reader.read_injuries(season, week, team)
-
-        # Cache for 60 seconds (updated weekly, some changes during week)
-        await cache_manager.set(cache_key, injuries, ttl_seconds=60)
-
-        logger.debug(f"Returned {len(injuries)} injury reports")
-        return injuries
-
-    except Exception as e:
-        logger.error(f"Error fetching injuries: {e}")
-        return {"status": "error", "message": str(e)}
+    logger.debug(f"Read {len(injuries)} injury reports")
+    return injuries
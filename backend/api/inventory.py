@@ -3,11 +3,55 @@ Data Inventory endpoints - Metadata about available datasets
 """
 
 from fastapi import APIRouter
+from typing import Optional, Any, Dict
+import asyncio
 import logging
 
+from core.config import settings
+from services.readers import data_reader, INVENTORY_TABLES
+from services.cache import cache_manager, cache_key_inventory
+from services.jobs import JOB_ACTIONS
+from services.scheduler import refresh_scheduler, REFRESH_POLICIES
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+TABLE_DESCRIPTIONS = {
+    "schedules": "Game schedules",
+    "teams": "NFL team metadata",
+    "season_stats": "Weekly team statistics",
+    "power_ratings": "ELO ratings for all teams",
+    "players": "Player roster data",
+    "player_stats": "Individual player statistics",
+    "injuries": "Injury reports by week",
+    "depth_charts": "Team depth charts by week",
+    "play_by_play": "Play-by-play data with EPA",
+}
+
+# table -> scheduled job action that refreshes it
+REFRESH_ACTIONS = {
+    dataset: action
+    for action, (datasets, _) in JOB_ACTIONS.items()
+    if datasets and action in REFRESH_POLICIES
+    for dataset in datasets
+}
+
+
+async def table_inventory(table: str) -> Optional[Dict[str, Any]]:
+    """
+    A table's statistics, cached until its next ETL load
+
+    The ETL invalidates "inventory:{table}" after each load, so only the
+    tables that were loaded are read again.
+    """
+    return await cache_manager.get_or_set(
+        cache_key_inventory(table),
+        lambda: data_reader.read_table_stats(table),
+        ttl_seconds=settings.INVENTORY_TTL,
+        stale_ttl_seconds=settings.INVENTORY_TTL,
+        tags=[f"inventory:{table}", f"table:{table}"],
+    )
+
 
 @router.get("/data/inventory")
 async def get_data_inventory() -> dict:
@@ -15,84 +59,55 @@ async def get_data_inventory() -> dict:
     Get data inventory and availability
 
     Returns: metadata about available datasets, last updates, coverage
-    Cache: 1 hour (static metadata)
+    Row counts are planner/statistics-collector estimates (no count(*) scans);
+    last_loaded and high_water (latest season and week loaded) are recorded
+    by the ETL.
+    Cache: per table, until the table's next load (at most INVENTORY_TTL)
     """
     try:
-        # Hardcoded inventory based on your context
-        # In production, this could be read from a metadata table
+        stats = await asyncio.gather(*(table_inventory(table) for table in INVENTORY_TABLES))
 
-        inventory = {
-            "season": 2025,
-            "total_datasets": 9,
-            "tables": {
-                "schedules": {
-                    "records": 272,
-                    "description": "Game schedules for 2025",
-                    "updated": "daily",
-                },
-                "teams": {
-                    "records": 32,
-                    "description": "NFL team metadata",
-                    "updated": "static",
-                },
-                "season_stats": {
-                    "records": 576,
-                    "description": "Weekly team statistics for 2025",
-                    "updated": "weekly",
-                },
-                "power_ratings": {
-                    "records": 32,
-                    "description": "ELO ratings for all teams",
-                    "updated": "weekly",
+        tables = {}
+        for table, table_stats in zip(INVENTORY_TABLES, stats):
+            table_stats = table_stats or {}
+            tables[table] = {
+                "records": table_stats.get("records"),
+                "description": TABLE_DESCRIPTIONS[table],
+                "updated": table_stats.get("loaded_at"),
+                "refresh": REFRESH_ACTIONS.get(table),
+                "high_water": {
+                    "season": table_stats.get("high_season"),
+                    "week": table_stats.get("high_week"),
                 },
-                "players": {
-                    "records": 3076,
-                    "description": "Player roster data for 2025",
-                    "updated": "weekly",
-                },
-                "player_stats": {
-                    "records": 4950,
-                    "description": "Individual player statistics for 2025",
-                    "updated": "weekly",
-                },
-                "injuries": {
-                    "records": "updating",
-                    "description": "Injury reports by week for 2025",
-                    "updated": "daily_wed_fri",
-                },
-                "depth_charts": {
-                    "records": 160774,
-                    "description": "Team depth charts by week for 2025",
-                    "updated": "weekly",
-                },
-                "play_by_play": {
-                    "records": 12473,
-                    "description": "Play-by-play data with EPA for 2025",
-                    "updated": "weekly",
-                },
-            },
+                "rows_changed": table_stats.get("rows_changed"),
+                "last_analyzed": table_stats.get("last_analyzed"),
+            }
+
+        loaded = [table["updated"] for table in tables.values() if table["updated"]]
+        last_updated = max(loaded) if loaded else None
+        games = tables["schedules"]["high_water"]
+        plays = tables["play_by_play"]["high_water"]
+
+        return {
+            "season": settings.CURRENT_SEASON,
+            "total_datasets": len(tables),
+            "tables": tables,
             "summary": {
-                "total_records": 188429,
-                "last_updated": "2025-10-06T00:00:00Z",
-                "coverage": "2025 season (6 games played)",
-                "data_freshness": "Updated through October 6, 2025",
-                "refresh_cadence": {
-                    "daily": ["schedules", "play_by_play"],
-                    "weekly": [
-                        "season_stats",
-                        "power_ratings",
-                        "players",
-                        "player_stats",
-                        "injuries",
-                        "depth_charts",
-                    ],
-                    "static": ["teams"],
-                },
+                "total_records": sum(table["records"] or 0 for table in tables.values()),
+                "records_estimated": True,
+                "last_updated": last_updated,
+                "coverage": (
+                    f"{games['season']} season, schedule through week {games['week']}"
+                    if games["season"] else None
+                ),
+                "data_freshness": (
+                    f"Play-by-play through week {plays['week']} of {plays['season']}"
+                    if plays["season"] else None
+                ),
+                "refresh_cadence": refresh_scheduler.cadence(),
             },
         }
 
-        return inventory
-
     except Exception as e:
         logger.error(f"Error fetching inventory: {e}")
         return {"status": "error", "message": str(e)}
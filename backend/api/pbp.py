@@ -3,20 +3,37 @@ Play-by-play endpoints - Detailed game plays and statistics
 """
 
 from fastapi import APIRouter, Query
+from typing import Optional
+import asyncio
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager, cache_key_pbp
+from services.cache import cache_manager, cache_key_pbp, cache_key_pbp_count, cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/pbp")
+@cached(
+    key=cache_key_pbp,
+    ttl_seconds=60,
+    stale_ttl_seconds=300,
+    tags=lambda game_id: cache_tags("play_by_play", game_id=game_id),
+    error_body={"total": 0, "plays": []},
+    table=lambda page: page["plays"],
+)
 async def get_pbp(
     game_id: str = Query(..., description="Game ID"),
     limit: int = Query(100, ge=1, le=500, description="Results limit (1-500)"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (ignored with cursor)"),
+    cursor: Optional[int] = Query(
+        None, ge=0, description="Return plays after this play_index (next_cursor of the previous page)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. play_type,epa); play_index is always included"
+    ),
 ) -> dict:
     """
     Get play-by-play data for a game (paginated)
@@ -24,28 +41,34 @@ async def get_pbp(
     - **game_id**: Game ID to fetch plays for
     - **limit**: Number of plays per page (default 100, max 500)
     - **offset**: Pagination offset
+    - **cursor**: Keyset pagination - pass the previous page's next_cursor
+    - **fields**: Column projection
+    - **format**: json (default), arrow or parquet - also negotiated from Accept
 
-    Returns: paginated plays with EPA, yards gained, etc.
-    Cache: 60 seconds (expensive query - cached heavily)
+    Returns: paginated plays with EPA, yards gained, etc., plus next_cursor
+    (null on the last page)
+    Cache: 60 seconds (expensive query - cached heavily), served stale for 5 more minutes.
+    The per-game total is counted once and cached separately.
     """
-    try:
-        cache_key = cache_key_pbp(game_id, limit, offset)
+    columns = parse_fields(fields, "play_by_play")
 
-        # Try cache (expensive query - cache longer)
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: pbp {game_id} limit={limit} offset={offset}")
-            return cached
+    total, plays = await asyncio.gather(
+        cache_manager.get_or_set(
+            cache_key_pbp_count(game_id),
+            lambda: data_reader.read_pbp_count(game_id),
+            ttl_seconds=300,
+            stale_ttl_seconds=3600,
+            tags=cache_tags("play_by_play", game_id=game_id),
+        ),
+        data_reader.read_pbp(game_id, limit, offset, after=cursor, columns=columns),
+    )
 
-        # Query database with pagination
-        pbp_data = await data_reader.read_pbp(game_id, limit, offset)
-
-        # Cache for 60 seconds
-        await cache_manager.set(cache_key, pbp_data, ttl_seconds=60)
-
-        logger.debug(f"Returned {len(pbp_data.get('plays', []))} plays")
-        return pbp_data
-
-    except Exception as e:
-        logger.error(f"Error fetching PBP for {game_id}: {e}")
-        return {"status": "error", "message": str(e), "total": 0, "plays": []}
+    logger.debug(f"Read {len(plays)} plays")
+    return {
+        "total": total or 0,
+        "plays": plays,
+        "limit": limit,
+        "offset": offset if cursor is None else None,
+        "cursor": cursor,
+        "next_cursor": plays[-1]["play_index"] if len(plays) == limit else None,
+    }
@@ -3,55 +3,90 @@ Players endpoints - Player profiles and statistics
 """
 
 from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse, Response
 from typing import Optional, List
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager
+from services.cache import cache_key_player, cache_tags
+from services.caching import cached, parse_ids, parse_fields, get_or_load_many, batch_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/players/{player_id}")
-async def get_player(player_id: str) -> dict:
-    """
-    Get player profile and career stats
+def player_tags(player_id: str) -> List[str]:
+    """Tags of a cached player profile"""
+    return cache_tags("players", player_id=player_id)
 
-    - **player_id**: Player ID (GSIS, NFL ID, or ESPN ID)
 
-    Returns: player metadata, position, stats history
+@router.get("/players")
+async def get_players(
+    ids: str = Query(..., description="Comma-separated player IDs (max 100)"),
+) -> Response:
     """
-    try:
-        cache_key = f"player:{player_id}"
+    Get several player profiles in one request
 
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: player {player_id}")
-            return cached
+    - **ids**: Comma-separated player IDs
 
-        # Query database
-        player = await data_reader.read_player(player_id)
+    Returns: {"players": [profiles in request order], "missing": [unknown ids]}
+    Cache: shares the per-player entries of /players/{player_id} - one cache
+    multi-get, then a single query for the misses only
+    """
+    try:
+        player_ids = parse_ids(ids)
+        found = await get_or_load_many(
+            player_ids,
+            cache_key_player,
+            data_reader.read_players,
+            ttl_seconds=3600,
+            stale_ttl_seconds=3600,
+            tags=player_tags,
+        )
+        return batch_response("players", player_ids, found)
+
+    except ValueError as e:
+        return JSONResponse({"status": "error", "message": str(e), "players": [], "missing": []})
+    except Exception as e:
+        logger.error(f"Error fetching players {ids}: {e}")
+        return JSONResponse({"status": "error", "message": str(e), "players": [], "missing": []})
 
-        if not player:
-            return {"status": "error", "message": f"Player {player_id} not found"}
 
-        # Cache for 1 hour (player data rarely changes)
-        await cache_manager.set(cache_key, player, ttl_seconds=3600)
+@router.get("/players/{player_id}")
+@cached(
+    key=cache_key_player,
+    ttl_seconds=3600,
+    stale_ttl_seconds=3600,
+    tags=player_tags,
+    not_found=lambda player_id: f"Player {player_id} not found",
+)
+async def get_player(player_id: str) -> dict:
+    """
+    Get player profile and career stats
 
-        return player
+    - **player_id**: Player ID (GSIS, NFL ID, or ESPN ID)
 
-    except Exception as e:
-        logger.error(f"Error fetching player {player_id}: {e}")
-        return {"status": "error", "message": str(e)}
+    Returns: player metadata, position, stats history
+    Cache: 1 hour (player data rarely changes), not-found is not cached
+    """
+    return await data_reader.read_player(player_id) or None
 
 
 @router.get("/player_stats")
+@cached(
+    key=lambda season, team, position, fields: f"player_stats:{season}:{team}:{position}:{fields}",
+    ttl_seconds=300,
+    stale_ttl_seconds=900,
+    tags=lambda season, team: cache_tags("player_stats", season, team=team),
+    table=lambda stats: stats,
+)
 async def get_player_stats(
     season: int = Query(2025, description="Season year"),
     team: Optional[str] = Query(None, description="Team abbreviation filter"),
     position: Optional[str] = Query(None, description="Position filter (QB, RB, WR, etc.)"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. player_id,passing_yards)"
+    ),
 ) -> List[dict]:
     """
     Get player statistics for season
@@ -59,27 +94,14 @@ async def get_player_stats(
     - **season**: Season year (e.g., 2025)
     - **team**: Optional team abbreviation filter
     - **position**: Optional position filter (QB, RB, WR, TE, etc.)
+    - **fields**: Optional comma-separated columns to return
+    - **format**: json (default), arrow or parquet - also negotiated from Accept
 
     Returns: list of player stats with yards, touchdowns, etc.
+    Cache: 5 minutes, served stale for 15 more while refreshing
     """
-    try:
-        cache_key = f"player_stats:{season}:{team}:{position}"
-
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: player_stats {season} {team} {position}")
-            return cached
-
-        # Query database
-        stats = await data_reader.read_player_stats(season, team, position)
+    columns = parse_fields(fields, "player_stats")
+    stats = await data_reader.read_player_stats(season, team, position, columns)
 
-        # Cache for 5 minutes
-        await cache_manager.set(cache_key, stats, ttl_seconds=300)
-
-        logger.debug(f"Returned {len(stats)} player stats")
-        return stats
-
-    except Exception as e:
-        logger.error(f"Error fetching player stats: {e}")
-        return {"status": "error", "message": str(e)}
+    logger.debug(f"Read {len(stats)} player stats")
+    return stats
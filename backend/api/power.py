@@ -3,46 +3,45 @@ Power Ratings endpoints - Team strength ratings (ELO)
 """
 
 from fastapi import APIRouter, Query
-from typing import List
+from typing import Optional, List
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager, cache_key_power_ratings
+from services.snapshots import snapshot_store
+from services.cache import cache_key_power_ratings, cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/power_ratings")
+@cached(
+    key=cache_key_power_ratings,
+    ttl_seconds=3600,
+    stale_ttl_seconds=3600,
+    tags=lambda season: cache_tags("power_ratings", season),
+)
 async def get_power_ratings(
     season: int = Query(2025, description="Season year"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. team,elo_rating,elo_rank)"
+    ),
 ) -> List[dict]:
     """
     Get power ratings (ELO) for all teams
 
     - **season**: Season year (e.g., 2025)
+    - **fields**: Optional comma-separated columns to return
 
     Returns: sorted list of teams by ELO rating with ranks
-    Cache: 1 hour (weekly updates)
+    Served from the in-memory power ratings snapshot (database if not loaded)
+    Cache: 1 hour (weekly updates), served stale for 1 more while refreshing
     """
-    try:
-        cache_key = cache_key_power_ratings(season)
+    columns = parse_fields(fields, "power_ratings")
+    ratings = snapshot_store.power_ratings(season, columns)
+    if ratings is None:
+        ratings = await data_reader.read_power_ratings(season, columns)
 
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: power_ratings {season}")
-            return cached
-
-        # Query database
-        ratings = await data_reader.read_power_ratings(season)
-
-        # Cache for 1 hour (ratings updated weekly)
-        await cache_manager.set(cache_key, ratings, ttl_seconds=3600)
-
-        logger.debug(f"Returned {len(ratings)} power ratings")
-        return ratings
-
-    except Exception as e:
-        logger.error(f"Error fetching power ratings: {e}")
-        return {"status": "error", "message": str(e)}
+    logger.debug(f"Read {len(ratings)} power ratings")
+    return ratings
@@ -7,17 +7,29 @@ from typing import Optional, List
 import logging
 
 from services.readers import data_reader
-from services.cache import cache_manager, cache_key_schedules
+from services.snapshots import snapshot_store
+from services.cache import cache_key_schedules, cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/schedules")
+@cached(
+    key=cache_key_schedules,
+    ttl_seconds=60,
+    stale_ttl_seconds=300,
+    tags=lambda season, week, team: cache_tags("schedules", season, week, team),
+    table=lambda games: games,
+)
 async def get_schedules(
     season: int = Query(2025, description="NFL season year"),
     week: Optional[int] = Query(None, description="Week number (1-18)"),
     team: Optional[str] = Query(None, description="Team abbreviation (e.g., KC, BUF)"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. game_id,home_score,away_score)"
+    ),
 ) -> List[dict]:
     """
     Get NFL game schedules with optional filters
@@ -25,33 +37,21 @@ async def get_schedules(
     - **season**: NFL season (e.g., 2025)
     - **week**: Week number (optional, 1-18)
     - **team**: Team abbreviation (optional, filters home or away)
+    - **fields**: Optional comma-separated columns to return
+    - **format**: json (default), arrow or parquet - also negotiated from Accept
 
     Returns list of games with schedules, spreads, totals
+    Served from the in-memory schedules snapshot (database if not loaded)
+    Cache: 60 seconds, served stale for 5 more minutes while refreshing
     """
-    try:
-        # Validate season - only 2025 supported
-        if season != 2025:
-            logger.warning(f"Requested season {season} not available. Only 2025 data is available.")
-            return {"status": "error", "message": f"Only 2025 season data is available. Requested: {season}"}
+    # Validate season - only 2025 supported
+    if season != 2025:
+        raise ValueError(f"Only 2025 season data is available. Requested: {season}")
 
-        # Build cache key
-        cache_key = cache_key_schedules(season, week, team)
+    columns = parse_fields(fields, "schedules")
+    schedules = snapshot_store.schedules(season, week, team, columns)
+    if schedules is None:
+        schedules = await data_reader.read_schedules(season, week, team, columns)
 
-        # Try cache first
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: schedules for {season}/{week}/{team}")
-            return cached
-
-        # Query database
-        schedules = await data_reader.read_schedules(season, week, team)
-
-        # Cache for 60 seconds
-        await cache_manager.set(cache_key, schedules, ttl_seconds=60)
-
-        logger.debug(f"Returned {len(schedules)} schedules")
-        return schedules
-
-    except Exception as e:
-        logger.error(f"Error fetching schedules: {e}")
-        return {"status": "error", "message": str(e)}
+    logger.debug(f"Read {len(schedules)} schedules")
+    return schedules
@@ -2,47 +2,110 @@
 Scoreboard endpoints - Live game scores and status
 """
 
-from fastapi import APIRouter, Query
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from typing import Optional, List, AsyncIterator
 from datetime import date
 import logging
 
+import orjson
+
+from core.config import settings
+from services.live import live_scoreboard
+
 from services.readers import data_reader
-from services.cache import cache_manager, cache_key_scoreboard
+from services.snapshots import snapshot_store
+from services.cache import cache_key_scoreboard, cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def parse_date(value: str) -> str:
+    """A date= parameter as YYYY-MM-DD (400 if it is not a date)"""
+    try:
+        return date.fromisoformat(value.strip()).isoformat()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid date: {value} (expected YYYY-MM-DD)",
+        )
+
+
 @router.get("/scoreboard")
+@cached(
+    key=lambda date_param, fields: cache_key_scoreboard(date_param, fields),
+    ttl_seconds=10,
+    stale_ttl_seconds=20,
+    tags=lambda date_param: cache_tags("schedules", gameday=date_param),
+)
 async def get_scoreboard(
-    date_param: str = Query(..., alias="date", description="Date (YYYY-MM-DD)")
+    date_param: str = Query(..., alias="date", description="Date (YYYY-MM-DD)"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. game_id,home_score,away_score)"
+    ),
 ) -> List[dict]:
     """
     Get games for a specific date (live scoreboard)
 
     - **date**: Date in YYYY-MM-DD format (e.g., 2025-10-15)
+    - **fields**: Optional comma-separated columns to return
 
     Returns: games for that date with live scores and status
-    Cache: 10 seconds (updates frequently)
+    Served from the in-memory schedules snapshot (database if not loaded)
+    Cache: 10 seconds (updates frequently), served stale for 20 more while refreshing
     """
-    try:
-        cache_key = cache_key_scoreboard(date_param)
+    date_param = parse_date(date_param)
+    columns = parse_fields(fields, "schedules")
+    games = snapshot_store.scoreboard(date_param, columns)
+    if games is None:
+        games = await data_reader.read_scoreboard(date_param, columns)
+    return games
+
 
-        # Try cache (short TTL for real-time updates)
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: scoreboard {date_param}")
-            return cached
+def sse_event(event: str, payload: dict) -> bytes:
+    """Format one Server-Sent Event"""
+    return b"event: %s\nid: %d\ndata: %s\n\n" % (
+        event.encode(), payload["version"], orjson.dumps(payload)
+    )
 
-        # Query database
-        scoreboard = await data_reader.read_scoreboard(date_param)
 
-        # Cache for 10 seconds (live updates)
-        await cache_manager.set(cache_key, scoreboard, ttl_seconds=10)
+@router.get("/scoreboard/stream")
+async def stream_scoreboard(
+    request: Request,
+    date_param: str = Query(..., alias="date", description="Date (YYYY-MM-DD)"),
+) -> StreamingResponse:
+    """
+    Stream a date's scoreboard as Server-Sent Events
+
+    - **date**: Date in YYYY-MM-DD format (e.g., 2025-10-15)
+
+    Events:
+    - `snapshot`: {date, version, games} - sent on connect, and again if the
+      client falls too far behind to apply diffs
+    - `diff`: {date, version, changed: [{game_id, fields}], added, removed}
+
+    One server-side poller per date serves every viewer (reads every
+    LIVE_POLL_INTERVAL seconds).
+    """
+    date_param = parse_date(date_param)
 
-        return scoreboard
+    async def events() -> AsyncIterator[bytes]:
+        # Subscribed here, so a stream that never starts never holds a poller
+        subscriber = await live_scoreboard.subscribe(date_param)
+        try:
+            while not await request.is_disconnected():
+                item = await subscriber.next(settings.LIVE_HEARTBEAT_INTERVAL)
+                if item is None:
+                    yield b": ping\n\n"
+                else:
+                    yield sse_event(*item)
+        finally:
+            live_scoreboard.unsubscribe(date_param, subscriber)
 
-    except Exception as e:
-        logger.error(f"Error fetching scoreboard for {date_param}: {e}")
-        return {"status": "error", "message": str(e)}
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,48 +2,59 @@
 Teams endpoints - Team info, stats, profiles
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Path, Query
 from typing import Optional, List
+import asyncio
 import logging
 
+from api.power import get_power_ratings
+from api.schedules import get_schedules
 from services.readers import data_reader
-from services.cache import cache_manager, cache_key_teams, cache_key_team_stats
+from services.snapshots import snapshot_store
+from services.cache import cache_key_teams, cache_key_team_stats, cache_key_team_profile, cache_tags
+from services.caching import cached, parse_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/teams")
-async def get_teams() -> List[dict]:
+@cached(
+    key=cache_key_teams,
+    ttl_seconds=300,
+    stale_ttl_seconds=3600,
+    tags=lambda: cache_tags("teams"),
+)
+async def get_teams(
+    fields: Optional[str] = Query(
+        None, description="Comma-separated columns to return (e.g. team,team_name,primary_color)"
+    ),
+) -> List[dict]:
     """
     Get all NFL teams
 
+    - **fields**: Optional comma-separated columns to return
+
     Returns list of teams with metadata (colors, location, etc.)
+    Served from the in-memory teams snapshot (database if not loaded)
+    Cache: 5 minutes (teams rarely change), served stale for 1 hour while refreshing
     """
-    try:
-        # Check cache
-        cache_key = cache_key_teams()
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug("Cache HIT: teams list")
-            return cached
-
-        # Query database
-        teams = await data_reader.read_teams()
-
-        # Cache for 5 minutes (teams rarely change)
-        await cache_manager.set(cache_key, teams, ttl_seconds=300)
-
-        return teams
-
-    except Exception as e:
-        logger.error(f"Error fetching teams: {e}")
-        return {"status": "error", "message": str(e)}
+    columns = parse_fields(fields, "teams")
+    teams = snapshot_store.teams(columns)
+    if teams is None:
+        teams = await data_reader.read_teams(columns)
+    return teams
 
 
 @router.get("/teams/{team}/stats")
+@cached(
+    key=cache_key_team_stats,
+    ttl_seconds=60,
+    stale_ttl_seconds=300,
+    tags=lambda team, season, week: cache_tags("season_stats", season, week, team),
+)
 async def get_team_stats(
-    team: str = Query(..., description="Team abbreviation (e.g., KC)"),
+    team: str = Path(..., description="Team abbreviation (e.g., KC)"),
     season: int = Query(2025, description="Season year"),
     week: Optional[int] = Query(None, description="Week number (if not specified, uses latest)"),
 ) -> dict:
@@ -55,33 +66,31 @@ async def get_team_stats(
     - **week**: Week number (optional - gets latest if not specified)
 
     Returns: wins, losses, EPA metrics, ATS record, etc.
+    Cache: 60 seconds (updates weekly), served stale for 5 more minutes
     """
-    try:
-        # Build cache key
-        cache_key = cache_key_team_stats(team, season, week)
+    return await data_reader.read_team_stats(team, season, week)
 
-        # Try cache
-        cached = await cache_manager.get(cache_key)
-        if cached:
-            logger.debug(f"Cache HIT: team stats {team} {season} week {week}")
-            return cached
 
-        # Query database
-        stats = await data_reader.read_team_stats(team, season, week)
-
-        # Cache for 60 seconds (updates weekly)
-        await cache_manager.set(cache_key, stats, ttl_seconds=60)
-
-        return stats
-
-    except Exception as e:
-        logger.error(f"Error fetching team stats for {team}: {e}")
-        return {"status": "error", "message": str(e)}
+def team_profile_tags(team: str, season: int) -> List[str]:
+    """A profile is invalidated whenever any of its components is"""
+    return [
+        *cache_tags("teams"),
+        *cache_tags("season_stats", season, team=team),
+        *cache_tags("power_ratings", season),
+        *cache_tags("schedules", season, team=team),
+    ]
 
 
 @router.get("/teams/{team}/profile")
+@cached(
+    key=cache_key_team_profile,
+    ttl_seconds=60,
+    stale_ttl_seconds=300,
+    tags=team_profile_tags,
+    not_found=lambda team: f"Team {team} not found",
+)
 async def get_team_profile(
-    team: str = Query(..., description="Team abbreviation"),
+    team: str = Path(..., description="Team abbreviation"),
     season: int = Query(2025, description="Season year"),
 ) -> dict:
     """
@@ -92,36 +101,24 @@ async def get_team_profile(
     - Season statistics
     - Power rating (ELO)
     - Schedule for season
-    """
-    try:
-        # For profile, skip cache initially to allow complex query
 
-        # Get team metadata
-        teams = await data_reader.read_teams()
-        team_info = next((t for t in teams if t.get("team") == team.upper()), None)
-
-        if not team_info:
-            return {"status": "error", "message": f"Team {team} not found"}
-
-        # Get stats
-        stats = await data_reader.read_team_stats(team, season)
-
-        # Get power rating
-        ratings = await data_reader.read_power_ratings(season)
-        power_rating = next((r for r in ratings if r.get("team") == team.upper()), None)
-
-        # Get schedule
-        schedule = await data_reader.read_schedules(season, team=team)
-
-        profile = {
-            "team_info": team_info,
-            "stats": stats,
-            "power_rating": power_rating,
-            "schedule": schedule,
-        }
-
-        return profile
-
-    except Exception as e:
-        logger.error(f"Error fetching team profile for {team}: {e}")
-        return {"status": "error", "message": str(e)}
+    Components are fetched concurrently through their own endpoint caches.
+    Cache: 60 seconds, served stale for 5 more minutes; invalidated with any component
+    """
+    teams, stats, ratings, schedule = await asyncio.gather(
+        get_teams.load(),
+        get_team_stats.load(team=team, season=season, week=None),
+        get_power_ratings.load(season=season),
+        get_schedules.load(season=season, week=None, team=team),
+    )
+
+    team_info = next((t for t in teams or [] if t.get("team") == team), None)
+    if not team_info:
+        return None
+
+    return {
+        "team_info": team_info,
+        "stats": stats,
+        "power_rating": next((r for r in ratings or [] if r.get("team") == team), None),
+        "schedule": schedule,
+    }
@@ -9,9 +9,15 @@ from contextlib import asynccontextmanager
 import logging
 
 from core.config import settings
+from services.cache import cache_manager
+from services.readers import data_reader
+from services.snapshots import snapshot_store
+from services.live import live_scoreboard
+from services.jobs import job_manager
+from services.scheduler import refresh_scheduler
 
 # Import route modules
-from api import schedules, teams, games, scoreboard, pbp, players, power, injuries, depth, inventory, admin
+from api import schedules, teams, games, scoreboard, pbp, players, power, injuries, depth, inventory, export, admin
 
 # Configure logging
 logging.basicConfig(level=settings.LOG_LEVEL)
@@ -28,12 +34,23 @@ async def lifespan(app: FastAPI):
     logger.info(f"   Season: {settings.CURRENT_SEASON}")
     logger.info(f"   Supabase: {settings.SUPABASE_URL}")
     logger.info(f"   Redis: {settings.REDIS_URL}")
+    logger.info(f"   Data backend: {settings.DATA_BACKEND}")
     logger.info("=" * 80)
+    await cache_manager.connect()
+    await data_reader.connect()
+    await snapshot_store.connect()
+    await refresh_scheduler.start()
     yield
     # Shutdown
     logger.info("=" * 80)
     logger.info("🛑 FastAPI NFL Backend shutting down...")
     logger.info("=" * 80)
+    await refresh_scheduler.close()
+    await job_manager.close()
+    await live_scoreboard.close()
+    await snapshot_store.close()
+    await data_reader.close()
+    await cache_manager.close()
 
 
 # Create FastAPI app
@@ -51,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 
@@ -141,6 +159,13 @@ app.include_router(
     tags=["inventory"],
 )
 
+# Streaming Exports
+app.include_router(
+    export.router,
+    prefix="/v1",
+    tags=["export"],
+)
+
 # Admin (Manual Jobs)
 app.include_router(
     admin.router,
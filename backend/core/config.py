@@ -24,8 +24,69 @@ class Settings(BaseSettings):
     SUPABASE_SERVICE_KEY: str = ""
     DATABASE_URL: str
 
+    # Data backend: "supabase" (PostgREST client) or "postgres" (async pool on DATABASE_URL)
+    DATA_BACKEND: str = "supabase"
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free connection
+    DB_QUERY_TIMEOUT: float = 5.0  # Client-side per-query timeout (seconds)
+    DB_STATEMENT_TIMEOUT_MS: int = 10000  # Server-side statement_timeout (0 = off)
+    DB_PREPARED_STATEMENTS: bool = True  # Disable behind a transaction-mode pooler
+    DB_PREPARE_THRESHOLD: int = 2  # Executions before a query is prepared
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 2.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
+
+    # In-process L1 cache (in front of Redis)
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_ENTRIES: int = 2048
+    CACHE_L1_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_L1_MAX_TTL: int = 30  # Seconds - bounds staleness across workers
+
+    # Cache miss coalescing across workers (Redis lock per rebuilding key)
+    CACHE_DISTRIBUTED_LOCKS: bool = False
+    CACHE_LOCK_TIMEOUT: float = 10.0  # Seconds - lock expiry / max wait for another worker
+    CACHE_LOCK_POLL_INTERVAL: float = 0.05
+
+    # Cached response bodies: "gzip", "zstd" (needs zstandard) or "none"
+    CACHE_COMPRESSION: str = "gzip"
+    CACHE_COMPRESSION_MIN_BYTES: int = 1024  # Smaller bodies are stored uncompressed
+    CACHE_COMPRESSION_LEVEL: int = 6
+
+    # In-memory snapshots of schedules, teams and power ratings (services/snapshots.py)
+    SNAPSHOTS_ENABLED: bool = True
+    SNAPSHOT_REFRESH_INTERVAL: int = 15  # Seconds - also bounds live score lag
+
+    # Live scoreboard stream (/v1/scoreboard/stream)
+    LIVE_POLL_INTERVAL: int = 5  # Seconds between scoreboard reads per date
+    LIVE_SUBSCRIBER_QUEUE_SIZE: int = 32  # Events buffered per client before resync
+    LIVE_HEARTBEAT_INTERVAL: int = 15  # Seconds - keeps idle connections open
+
+    # ETL (services/etl.py)
+    ETL_CONCURRENCY: int = 3  # Dataset loaders running at once (each holds a connection)
+
+    # Admin jobs (services/jobs.py)
+    JOB_MAX_WORKERS: int = 2  # Jobs running at once per API worker
+    JOB_PROCESS_WORKERS: int = 1  # Processes for CPU-heavy jobs (recomputes, refresh_all)
+    JOB_TTL: int = 86400  # Seconds job records are kept in Redis
+    JOB_LEASE_TTL: int = 60  # Seconds a job survives its worker before it is marked failed
+
+    # Gameday-aware refresh scheduler (services/scheduler.py)
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_TICK: int = 30  # Seconds between due checks
+    SCHEDULER_LEADER_TIMEOUT: int = 90  # Seconds before a dead leader's lock expires
+    SCHEDULER_GAMEDAY_WINDOW: int = 43200  # Seconds around a kickoff counted as gameday
+    SCHEDULER_JITTER: float = 0.1  # Intervals vary by up to +/- 10%
+
+    # Data inventory (/v1/data/inventory) - also refreshed after each table's ETL load
+    INVENTORY_TTL: int = 21600  # Seconds
+
+    # Streaming exports (/v1/export/{table})
+    EXPORT_BATCH_SIZE: int = 5000  # Rows fetched and serialized per chunk
+    EXPORT_MAX_CONCURRENT: int = 4  # Each running export holds a database connection
 
     # Security
     API_KEY: str
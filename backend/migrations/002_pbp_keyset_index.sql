@@ -0,0 +1,8 @@
+-- Keyset pagination for /v1/pbp
+-- Serves "WHERE game_id = ? AND play_index > ? ORDER BY play_index LIMIT ?"
+-- (and the per-game count) from one index range scan
+
+CREATE INDEX IF NOT EXISTS idx_pbp_game_play ON play_by_play(game_id, play_index);
+
+-- Covered by the composite index above
+DROP INDEX IF EXISTS idx_pbp_game;
@@ -0,0 +1,13 @@
+-- Natural keys for bulk loads (services/etl.py copy_parquet)
+-- The COPY loader merges staged rows with INSERT ... ON CONFLICT, which needs
+-- a unique index on the conflict columns
+
+-- One row per play; also serves /v1/pbp keyset pagination
+CREATE UNIQUE INDEX IF NOT EXISTS uq_pbp_game_play ON play_by_play(game_id, play_index);
+
+-- Covered by the unique index above
+DROP INDEX IF EXISTS idx_pbp_game_play;
+
+-- One row per player slot per week (week is NULL for season-level charts - PG 15+)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_depth_chart_slot
+  ON depth_charts(season, week, team, position, player_id) NULLS NOT DISTINCT;
@@ -0,0 +1,11 @@
+-- ETL manifest: the source file of each dataset's last successful load
+-- services/etl.py skips a load when the file's name, size and mtime match
+
+CREATE TABLE IF NOT EXISTS etl_manifest (
+  dataset TEXT PRIMARY KEY,
+  file_name TEXT NOT NULL,
+  file_size BIGINT NOT NULL,
+  file_mtime DOUBLE PRECISION NOT NULL,
+  rows_loaded INT,
+  loaded_at TIMESTAMP DEFAULT NOW()
+);
@@ -0,0 +1,9 @@
+-- Columns and natural keys for the remaining ETL datasets (services/etl.py)
+
+-- /v1/player_stats filters on team and position
+ALTER TABLE player_stats ADD COLUMN IF NOT EXISTS team TEXT;
+ALTER TABLE player_stats ADD COLUMN IF NOT EXISTS position TEXT;
+CREATE INDEX IF NOT EXISTS idx_player_stats_season_team ON player_stats(season, team);
+
+-- One injury report per player per week (conflict key of the injuries load)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_injury_report ON injuries(season, week, player_id);
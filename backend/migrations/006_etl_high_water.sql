@@ -0,0 +1,13 @@
+-- ETL high-water marks: what each dataset's last load contained
+-- /v1/data/inventory reads these (plus planner statistics) instead of count(*)
+-- Derived datasets (season_stats, power_ratings) are recorded without a source file
+
+ALTER TABLE etl_manifest
+  ADD COLUMN IF NOT EXISTS high_season INT,
+  ADD COLUMN IF NOT EXISTS high_week INT,
+  ADD COLUMN IF NOT EXISTS rows_changed INT;
+
+ALTER TABLE etl_manifest
+  ALTER COLUMN file_name DROP NOT NULL,
+  ALTER COLUMN file_size DROP NOT NULL,
+  ALTER COLUMN file_mtime DROP NOT NULL;
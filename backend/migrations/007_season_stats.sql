@@ -0,0 +1,40 @@
+-- Season stats aggregation (services/season_stats.py, etl.compute_season_stats)
+
+-- Turnover flags of a play (nflverse interception, fumble_lost)
+ALTER TABLE play_by_play
+  ADD COLUMN IF NOT EXISTS interception INT,
+  ADD COLUMN IF NOT EXISTS fumble_lost INT;
+
+-- One row per team and week played, season-to-date through that week
+ALTER TABLE season_stats
+  ADD COLUMN IF NOT EXISTS turnovers INT,
+  ADD COLUMN IF NOT EXISTS takeaways INT;
+
+-- Per team and week play-by-play sums the season_stats rows are built from
+CREATE TABLE IF NOT EXISTS team_week_totals (
+  team TEXT NOT NULL REFERENCES teams(team),
+  season INT NOT NULL,
+  week INT NOT NULL,
+  games INT,
+  plays_off INT,
+  epa_off DOUBLE PRECISION,
+  successes_off INT,
+  pass_yards INT,
+  rush_yards INT,
+  plays_def INT,
+  epa_def DOUBLE PRECISION,
+  successes_def INT,
+  turnovers INT,
+  takeaways INT,
+  updated_at TIMESTAMP DEFAULT NOW(),
+  PRIMARY KEY (team, season, week)
+);
+
+-- Weeks whose rows changed since a derived dataset last consumed them
+CREATE TABLE IF NOT EXISTS etl_changes (
+  dataset TEXT NOT NULL,
+  season INT NOT NULL,
+  week INT NOT NULL,
+  changed_at TIMESTAMP NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (dataset, season, week)
+);
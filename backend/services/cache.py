@@ -1,88 +1,808 @@
 """
 Redis caching layer for expensive queries
+Uses the asyncio Redis client so cache I/O never blocks the event loop
+
+Two tiers:
+- L1: in-process TTL/LRU cache (zero network hops, per worker)
+- L2: Redis (shared by all workers)
+
+Invalidation is tag based: each entry is registered under tags (see
+cache_tags) and invalidate_tags() drops exactly the entries registered under
+them, in Redis and in every worker's L1 (via pub/sub), without scanning the
+keyspace. In Redis a tag is a sorted set of keys scored by their expiry time:
+expired members are pruned on every write, and the set itself expires with
+its longest-lived member, so a tag only ever holds (about) its live entries.
 """
 
+import gzip
+import hashlib
 import json
-import redis
+import time
+import uuid
+import asyncio
 import logging
-from typing import Optional, Any
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Optional, Any, Dict, List, Set, Tuple, Callable, Awaitable, Iterable
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import LockError, RedisError
 from core.config import settings
 
+try:
+    import zstandard as zstd
+except ImportError:  # Optional - CACHE_COMPRESSION=zstd falls back to gzip
+    zstd = None
+
 logger = logging.getLogger(__name__)
 
+TAG_PREFIX = "tags:"
+INVALIDATION_CHANNEL = "cache:invalidate"
+INVALIDATION_BATCH_SIZE = 500
+
+
+class LocalCache:
+    """In-process L1 cache with per-key TTL and LRU eviction by count and bytes"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires_at, approx_bytes, value, tags), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, int, Any, Tuple[str, ...]]]" = OrderedDict()
+        # tag -> keys registered under it
+        self._tags: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a live value and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, _, value, _ = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self, key: str, value: Any, ttl_seconds: float, size: int, tags: Iterable[str] = ()
+    ) -> None:
+        """Store a value, evicting least recently used entries to stay in bounds"""
+        self.delete(key)
+        if ttl_seconds <= 0 or size > self.max_bytes:
+            return
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + ttl_seconds, size, value, tags)
+        self._bytes += size
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self.delete(next(iter(self._entries)))
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Drop a key if present"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[1]
+        for tag in entry[3]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def delete_tags(self, tags: Iterable[str]) -> int:
+        """Drop all keys registered under any of the tags"""
+        keys = set()
+        for tag in tags:
+            keys.update(self._tags.get(tag, ()))
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Drop all keys matching a glob-style pattern"""
+        keys = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop everything"""
+        self._entries.clear()
+        self._tags.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and eviction counters"""
+        return {
+            "entries": len(self._entries),
+            "tags": len(self._tags),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent loads of the same key into a single call (per process)
+
+    The first caller starts the load as its own task; everyone else awaits that
+    task. A caller that disconnects does not cancel the load for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run loader once per key, sharing the result with concurrent callers"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"Single-flight JOIN: {key}")
+        else:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def is_running(self, key: str) -> bool:
+        """True while a load for key is in flight"""
+        return key in self._inflight
+
+    def stats(self) -> Dict[str, Any]:
+        """In-flight and coalesced counters"""
+        return {"inflight": len(self._inflight), "coalesced": self.coalesced}
+
+
+def compress(body: bytes) -> Tuple[bytes, Optional[str]]:
+    """Compress a serialized body per CACHE_COMPRESSION - returns (body, content-encoding)"""
+    if len(body) < settings.CACHE_COMPRESSION_MIN_BYTES:
+        return body, None
+    if settings.CACHE_COMPRESSION == "zstd" and zstd is not None:
+        return zstd.ZstdCompressor(level=settings.CACHE_COMPRESSION_LEVEL).compress(body), "zstd"
+    if settings.CACHE_COMPRESSION in ("gzip", "zstd"):
+        return gzip.compress(body, compresslevel=settings.CACHE_COMPRESSION_LEVEL, mtime=0), "gzip"
+    return body, None
+
+
+def content_hash(data: bytes) -> str:
+    """Strong validator for a serialized body"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def decompress(body: bytes, encoding: Optional[str]) -> bytes:
+    """Undo compress()"""
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        if zstd is None:
+            raise RuntimeError("zstandard is not installed - cannot read zstd cache entries")
+        return zstd.ZstdDecompressor().decompress(body)
+    return body
+
+
+class CacheEntry:
+    """
+    A cached response body plus the time it goes stale (soft TTL) and its tags
+
+    The value is stored serialized (JSON, optionally compressed) so a hit can be
+    sent as-is; `value` decodes it for callers that need Python objects.
+    `etag` is a hash of the JSON, computed once when the value is stored.
+    """
+
+    __slots__ = ("body", "encoding", "soft_expires_at", "tags", "etag")
+
+    def __init__(
+        self,
+        body: bytes,
+        encoding: Optional[str],
+        soft_expires_at: float,
+        tags: Iterable[str] = (),
+        etag: Optional[str] = None,
+    ):
+        self.body = body
+        self.encoding = encoding
+        self.soft_expires_at = soft_expires_at
+        self.tags = tuple(tags)
+        self.etag = etag or content_hash(self.json())
+
+    @classmethod
+    def from_value(
+        cls, value: Any, soft_expires_at: float, tags: Iterable[str] = ()
+    ) -> "CacheEntry":
+        """Serialize (and compress) a value once, when it is stored"""
+        data = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        body, encoding = compress(data)
+        return cls(body, encoding, soft_expires_at, tags, content_hash(data))
+
+    @property
+    def value(self) -> Any:
+        """The decoded value (decoded on every access - prefer body on hot paths)"""
+        return orjson.loads(self.json())
+
+    def json(self) -> bytes:
+        """The uncompressed JSON body"""
+        return decompress(self.body, self.encoding)
+
+    def is_fresh(self) -> bool:
+        """True until the soft TTL has passed"""
+        return time.time() < self.soft_expires_at
+
+    def dumps(self) -> bytes:
+        """Serialize for Redis: a one-line JSON header followed by the body"""
+        header = orjson.dumps(
+            {"s": self.soft_expires_at, "t": self.tags, "e": self.encoding, "h": self.etag}
+        )
+        return header + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CacheEntry":
+        """Deserialize from Redis"""
+        header, _, body = data.partition(b"\n")
+        meta = orjson.loads(header)
+        return cls(body, meta.get("e"), meta["s"], meta.get("t", ()), meta.get("h"))
+
 
 class CacheManager:
-    """Manages Redis caching for API responses"""
+    """Manages two-tier (in-process + Redis) caching for API responses"""
 
     def __init__(self):
-        """Initialize Redis connection"""
+        """Create the L1 cache and the Redis connection pool (connections are opened lazily)"""
+        self.local: Optional[LocalCache] = (
+            LocalCache(settings.CACHE_L1_MAX_ENTRIES, settings.CACHE_L1_MAX_BYTES)
+            if settings.CACHE_L1_ENABLED
+            else None
+        )
+        self.hits_l1 = 0
+        self.hits_l2 = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.flight = SingleFlight()
+        self._refreshing: Dict[str, "asyncio.Task[Any]"] = {}
+        self._instance_id = uuid.uuid4().hex
+        self._listener: Optional["asyncio.Task[None]"] = None
+        self._invalidation_callbacks: List[Callable[[Tuple[str, ...]], None]] = []
+        self.pool = redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            # Entries are stored as (possibly compressed) bytes
+            decode_responses=False,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        )
+        self.redis_client: Optional[redis.Redis] = redis.Redis(connection_pool=self.pool)
+
+    async def connect(self) -> None:
+        """Test the connection at startup - disables caching if Redis is unreachable"""
+        if not self.redis_client:
+            return
         try:
-            self.redis_client = redis.from_url(
-                settings.REDIS_URL, decode_responses=True, socket_connect_timeout=5
+            await self.redis_client.ping()
+            logger.info(
+                f"✅ Redis connected (pool size: {settings.REDIS_MAX_CONNECTIONS})"
             )
-            # Test connection
-            self.redis_client.ping()
-            logger.info("✅ Redis connected")
-        except redis.ConnectionError as e:
-            logger.warning(f"⚠️  Redis connection failed: {e}. Caching disabled.")
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
+        except (RedisError, OSError) as e:
+            logger.warning(f"⚠️  Redis connection failed: {e}. Using in-process cache only.")
+            await self.close()
+
+    async def close(self) -> None:
+        """Release all pooled connections"""
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.aclose()
+            await self.pool.disconnect()
+        except Exception as e:
+            logger.error(f"Cache close error: {e}")
+        finally:
             self.redis_client = None
 
-    async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
+    def _set_local(self, key: str, entry: CacheEntry, ttl_seconds: float, size: int) -> None:
+        """Populate L1, capped so other workers' writes are picked up quickly"""
+        if self.local:
+            self.local.set(
+                key, entry, min(ttl_seconds, settings.CACHE_L1_MAX_TTL), size, entry.tags
+            )
+
+    def on_invalidate(self, callback: Callable[[Tuple[str, ...]], None]) -> None:
+        """
+        Call callback(tags) whenever tags are invalidated, in this or any other worker
+
+        Lets in-process data derived from a table (e.g. snapshots) be dropped
+        together with the cache entries. Callbacks must not block.
+        """
+        self._invalidation_callbacks.append(callback)
+
+    def _notify_invalidation(self, tags: Iterable[str]) -> None:
+        """Run on_invalidate callbacks"""
+        tags = tuple(tags)
+        if not tags:
+            return
+        for callback in self._invalidation_callbacks:
+            try:
+                callback(tags)
+            except Exception as e:
+                logger.error(f"Cache invalidation callback error: {e}")
+
+    async def _listen_for_invalidations(self) -> None:
+        """Drop L1 entries (and derived data) invalidated by other workers"""
+        while self.redis_client:
+            try:
+                async with self.redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        payload = json.loads(message["data"])
+                        if payload.get("origin") == self._instance_id:
+                            continue
+                        if self.local:
+                            for key in payload.get("keys", ()):
+                                self.local.delete(key)
+                            self.local.delete_tags(payload.get("tags", ()))
+                        self._notify_invalidation(payload.get("tags", ()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}. Reconnecting...")
+                await asyncio.sleep(1)
+
+    async def _publish_invalidation(
+        self, keys: Iterable[str] = (), tags: Iterable[str] = ()
+    ) -> None:
+        """Tell other workers to drop keys/tags from their L1"""
         if not self.redis_client:
+            return
+        message = {"origin": self._instance_id, "keys": list(keys), "tags": list(tags)}
+        await self.redis_client.publish(INVALIDATION_CHANNEL, json.dumps(message))
+
+    async def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry (fresh or stale) in L1, then Redis"""
+        if self.local:
+            entry = self.local.get(key)
+            if entry is not None:
+                self.hits_l1 += 1
+                logger.debug(f"Cache HIT (L1): {key}")
+                return entry
+        if not self.redis_client:
+            self.misses += 1
             return None
         try:
-            data = self.redis_client.get(key)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.pttl(key)
+                data, pttl = await pipe.execute()
             if data:
+                self.hits_l2 += 1
                 logger.debug(f"Cache HIT: {key}")
-                return json.loads(data)
+                entry = CacheEntry.loads(data)
+                if pttl and pttl > 0:
+                    self._set_local(key, entry, pttl / 1000, len(data))
+                return entry
+            self.misses += 1
             logger.debug(f"Cache MISS: {key}")
             return None
         except Exception as e:
             logger.error(f"Cache get error for {key}: {e}")
             return None
 
-    async def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
-        """Set value in cache with TTL"""
+    async def get(self, key: str) -> Optional[Any]:
+        """Get fresh value from cache (L1 first, then Redis)"""
+        entry = await self._get_entry(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        return entry.value
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several fresh values (L1, then one Redis round-trip) - returns only the keys that were found"""
+        entries = await self.get_many_entries(keys)
+        return {key: entry.value for key, entry in entries.items()}
+
+    async def get_many_entries(self, keys: List[str]) -> Dict[str, CacheEntry]:
+        """Same as get_many, but returns the cache entries (values stay serialized)"""
+        found: Dict[str, CacheEntry] = {}
+        missing = keys
+        if self.local:
+            missing = []
+            for key in keys:
+                entry = self.local.get(key)
+                if entry is not None:
+                    found[key] = entry
+                else:
+                    missing.append(key)
+            self.hits_l1 += len(found)
+        if self.redis_client and missing:
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key in missing:
+                        pipe.get(key)
+                        pipe.pttl(key)
+                    results = await pipe.execute()
+                for key, data, pttl in zip(missing, results[::2], results[1::2]):
+                    if data:
+                        found[key] = CacheEntry.loads(data)
+                        self.hits_l2 += 1
+                        if pttl and pttl > 0:
+                            self._set_local(key, found[key], pttl / 1000, len(data))
+                    else:
+                        self.misses += 1
+                logger.debug(f"Cache MGET: {len(found)}/{len(keys)} hits")
+            except Exception as e:
+                logger.error(f"Cache get_many error: {e}")
+        else:
+            self.misses += len(missing)
+        return {key: entry for key, entry in found.items() if entry.is_fresh()}
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        stale_ttl_seconds: int = 0,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Set value in cache with TTL
+
+        ttl_seconds is the soft TTL (value is fresh). stale_ttl_seconds extends
+        the hard TTL: for that long after going stale the value can still be
+        served by get_or_set while it is refreshed in the background.
+        tags register the key for invalidate_tags().
+        """
+        await self.set_many({key: value}, ttl_seconds, stale_ttl_seconds, {key: tags})
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl_seconds: int = 300,
+        stale_ttl_seconds: int = 0,
+        tags: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> Dict[str, CacheEntry]:
+        """Set several values with the same TTL (and per-key tags) using a single pipeline"""
+        if not items:
+            return {}
+        tags = tags or {}
+        soft_expires_at = time.time() + ttl_seconds
+        hard_ttl = ttl_seconds + stale_ttl_seconds
+        entries: Dict[str, Tuple[CacheEntry, bytes]] = {}
+        for key, value in items.items():
+            entry = CacheEntry.from_value(value, soft_expires_at, tags.get(key, ()))
+            data = entry.dumps()
+            entries[key] = (entry, data)
+            self._set_local(key, entry, hard_ttl, len(data))
         if not self.redis_client:
+            return {key: entry for key, (entry, _) in entries.items()}
+        try:
+            expires_at = time.time() + hard_ttl
+            tagged: Dict[str, Dict[str, float]] = {}
+            for key, (entry, _) in entries.items():
+                for tag in entry.tags:
+                    tagged.setdefault(TAG_PREFIX + tag, {})[key] = expires_at
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, (entry, data) in entries.items():
+                    pipe.setex(key, hard_ttl, data)
+                for tag_key, members in tagged.items():
+                    pipe.zadd(tag_key, members)
+                    pipe.zremrangebyscore(tag_key, "-inf", time.time())
+                    # Expire with the longest-lived member (NX: new set, GT: extend only)
+                    pipe.expire(tag_key, hard_ttl, nx=True)
+                    pipe.expire(tag_key, hard_ttl, gt=True)
+                await pipe.execute()
+            logger.debug(
+                f"Cache SET: {', '.join(items)} (TTL: {ttl_seconds}s, stale: {stale_ttl_seconds}s)"
+            )
+        except Exception as e:
+            logger.error(f"Cache set error for {', '.join(items)}: {e}")
+        return {key: entry for key, (entry, _) in entries.items()}
+
+    async def delete(self, *keys: str) -> None:
+        """Delete one or more keys from cache (in every worker)"""
+        if self.local:
+            for key in keys:
+                self.local.delete(key)
+        if not self.redis_client or not keys:
             return
         try:
-            self.redis_client.setex(key, ttl_seconds, json.dumps(value))
-            logger.debug(f"Cache SET: {key} (TTL: {ttl_seconds}s)")
+            await self.redis_client.unlink(*keys)
+            await self._publish_invalidation(keys=keys)
+            logger.debug(f"Cache DEL: {', '.join(keys)}")
         except Exception as e:
-            logger.error(f"Cache set error for {key}: {e}")
+            logger.error(f"Cache delete error for {keys}: {e}")
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every entry registered under any of the tags (in every worker)
 
-    async def delete(self, key: str) -> None:
-        """Delete from cache"""
+        Cost is proportional to the number of affected keys - the keyspace is
+        never scanned. Returns the number of Redis keys removed.
+        """
+        if not tags:
+            return 0
+        # Derived data first, so a rebuild below cannot read it
+        self._notify_invalidation(tags)
+        if self.local:
+            self.local.delete_tags(tags)
         if not self.redis_client:
+            return 0
+        try:
+            # Read and drop the tag sets atomically (MULTI), so a key registered
+            # meanwhile lands in a new set instead of being lost with the old one
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    pipe.zrangebyscore(TAG_PREFIX + tag, time.time(), "+inf")
+                    pipe.unlink(TAG_PREFIX + tag)
+                results = await pipe.execute()
+            keys = sorted(set().union(*results[::2]))
+            for i in range(0, len(keys), INVALIDATION_BATCH_SIZE):
+                await self.redis_client.unlink(*keys[i : i + INVALIDATION_BATCH_SIZE])
+            await self._publish_invalidation(tags=tags)
+            logger.info(f"Cache invalidated {len(keys)} keys for tags {', '.join(tags)}")
+            return len(keys)
+        except Exception as e:
+            logger.error(f"Cache invalidate error for tags {tags}: {e}")
+            return 0
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: int = 300,
+        stale_ttl_seconds: int = 0,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        Get value from cache, or load and cache it on a miss
+
+        Concurrent misses for the same key share one loader call. With
+        CACHE_DISTRIBUTED_LOCKS enabled, a Redis lock also keeps other workers
+        from rebuilding the same key at the same time. A loader returning None
+        is not cached.
+
+        Stale-while-revalidate: once ttl_seconds has passed but the entry is
+        still within stale_ttl_seconds, the stale value is returned immediately
+        and a single background task refreshes it.
+        """
+        entry, _ = await self.get_or_set_entry(
+            key, loader, ttl_seconds, stale_ttl_seconds, tags
+        )
+        return entry.value if entry is not None else None
+
+    async def get_or_set_entry(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: int = 300,
+        stale_ttl_seconds: int = 0,
+        tags: Iterable[str] = (),
+    ) -> Tuple[Optional[CacheEntry], str]:
+        """
+        Same as get_or_set, but returns the cache entry and how it was served
+
+        Status is "hit", "stale" (served while refreshing) or "miss" (this
+        request waited for a load, its own or a coalesced one).
+        """
+        entry = await self._get_entry(key)
+        if entry is not None:
+            if entry.is_fresh():
+                return entry, "hit"
+            self._refresh_in_background(key, loader, ttl_seconds, stale_ttl_seconds, tags)
+            return entry, "stale"
+        entry = await self.flight.do(
+            key, lambda: self._load(key, loader, ttl_seconds, stale_ttl_seconds, tags)
+        )
+        return entry, "miss"
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        stale_ttl_seconds: int,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Schedule one refresh of a stale key (no-op if one is already running)"""
+        self.stale_hits += 1
+        if key in self._refreshing or self.flight.is_running(key):
             return
+
+        async def refresh():
+            try:
+                await self.flight.do(
+                    key,
+                    lambda: self._load(
+                        key, loader, ttl_seconds, stale_ttl_seconds, tags, wait=False
+                    ),
+                )
+                self.refreshes += 1
+            except Exception as e:
+                logger.error(f"Cache background refresh error for {key}: {e}")
+
+        self._refreshing[key] = asyncio.ensure_future(refresh())
+        self._refreshing[key].add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
+        tags: Iterable[str] = (),
+        wait: bool = True,
+    ) -> Optional[CacheEntry]:
+        """
+        Rebuild a key (runs once per key per process)
+
+        With wait=False (background refresh) the rebuild is skipped when
+        another worker already holds the lock.
+        """
+        lock = None
+        if settings.CACHE_DISTRIBUTED_LOCKS and self.redis_client:
+            lock = await self._acquire_rebuild_lock(key, wait)
+            if lock is None:
+                if not wait:
+                    return None
+                # Another worker rebuilt it while we waited
+                entry = await self._get_entry(key)
+                if entry is not None:
+                    return entry
         try:
-            self.redis_client.delete(key)
-            logger.debug(f"Cache DEL: {key}")
+            value = await loader()
+            if value is None:
+                return None
+            entries = await self.set_many(
+                {key: value}, ttl_seconds, stale_ttl_seconds, {key: tags}
+            )
+            return entries[key]
+        finally:
+            if lock is not None:
+                try:
+                    await lock.release()
+                except Exception as e:
+                    logger.debug(f"Cache lock release error for {key}: {e}")
+
+    async def _acquire_rebuild_lock(self, key: str, wait: bool = True) -> Optional[Any]:
+        """
+        Try to become the worker that rebuilds key
+
+        Returns the held lock, or None once another worker's lock has been
+        released (or has expired) so the caller should re-read the cache.
+        """
+        lock = self.redis_client.lock(
+            f"lock:{key}", timeout=settings.CACHE_LOCK_TIMEOUT, blocking=False
+        )
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+        try:
+            if await lock.acquire():
+                return lock
+            while wait and time.monotonic() < deadline:
+                await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+                if not await self.redis_client.exists(f"lock:{key}"):
+                    return None
         except Exception as e:
-            logger.error(f"Cache delete error for {key}: {e}")
+            logger.error(f"Cache lock error for {key}: {e}")
+        return None
 
     async def clear_pattern(self, pattern: str) -> None:
-        """Delete all keys matching pattern"""
+        """
+        Delete all keys matching pattern
+
+        Prefer invalidate_tags(). This walks the keyspace incrementally with
+        SCAN (never KEYS) so Redis is not blocked, but it is still O(N).
+        """
+        if self.local:
+            self.local.delete_pattern(pattern)
         if not self.redis_client:
             return
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                self.redis_client.delete(*keys)
-                logger.info(f"Cache cleared {len(keys)} keys matching {pattern}")
+            cleared = 0
+            batch: List[str] = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= INVALIDATION_BATCH_SIZE:
+                    cleared += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                cleared += await self.redis_client.unlink(*batch)
+            if cleared:
+                logger.info(f"Cache cleared {cleared} keys matching {pattern}")
         except Exception as e:
             logger.error(f"Cache clear pattern error: {e}")
 
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per tier"""
+        lookups = self.hits_l1 + self.hits_l2 + self.misses
+        return {
+            "redis_connected": self.redis_client is not None,
+            "hits_l1": self.hits_l1,
+            "hits_l2": self.hits_l2,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "background_refreshes": self.refreshes,
+            "hit_ratio": round((self.hits_l1 + self.hits_l2) / lookups, 4) if lookups else 0.0,
+            "l1": self.local.stats() if self.local else None,
+            "single_flight": self.flight.stats(),
+        }
+
 
 # Global cache manager instance
 cache_manager = CacheManager()
 
 
+class LeaderLock:
+    """
+    A Redis lock that elects one worker for a periodic duty
+
+    Call hold() before each round of the duty: it takes the lock, or extends
+    it to a full timeout if this worker already leads. The lock expires if its
+    holder stops calling hold() (e.g. dies), and another worker takes over.
+    Without Redis every worker leads.
+    """
+
+    def __init__(self, name: str, timeout: float):
+        self.name = name
+        self.timeout = timeout
+        self._lock: Optional[Any] = None
+        self.leader = False
+        self.elections = 0
+
+    async def hold(self) -> bool:
+        """Take or keep the lock - True if this worker leads"""
+        client = cache_manager.redis_client
+        if client is None:
+            self.leader = True
+            return True
+        try:
+            if self._lock is not None:
+                # Fails if the lock expired and was taken
+                await self._lock.reacquire()
+                return True
+            lock = client.lock(self.name, timeout=self.timeout, blocking=False, thread_local=False)
+            if await lock.acquire():
+                self._lock = lock
+                self.leader = True
+                self.elections += 1
+                logger.info(f"{self.name}: this worker is now the leader")
+                return True
+        except LockError:
+            logger.warning(f"{self.name}: leadership lost")
+            self._lock = None
+        except Exception as e:
+            logger.error(f"{self.name} election error: {e}")
+            self._lock = None
+        self.leader = False
+        return False
+
+    async def release(self) -> None:
+        """Hand leadership over"""
+        if self._lock is not None:
+            try:
+                await self._lock.release()
+            except Exception as e:
+                logger.debug(f"{self.name} release error: {e}")
+            self._lock = None
+        self.leader = False
+
+
 # Cache key builders
-def cache_key_schedules(season: int, week: Optional[int] = None, team: Optional[str] = None) -> str:
+def cache_key_schedules(
+    season: int,
+    week: Optional[int] = None,
+    team: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> str:
     """Build cache key for schedules"""
-    return f"schedules:{season}:{week}:{team}"
+    return f"schedules:{season}:{week}:{team}:{fields}"
 
 
 def cache_key_team_stats(team: str, season: int, week: Optional[int] = None) -> str:
@@ -90,21 +810,119 @@ def cache_key_team_stats(team: str, season: int, week: Optional[int] = None) ->
     return f"team_stats:{team}:{season}:{week}"
 
 
-def cache_key_pbp(game_id: str, limit: int = 100, offset: int = 0) -> str:
-    """Build cache key for play-by-play"""
-    return f"pbp:{game_id}:{limit}:{offset}"
+def cache_key_player(player_id: str) -> str:
+    """Build cache key for a player profile"""
+    return f"player:{player_id}"
+
+
+def cache_key_game(game_id: str) -> str:
+    """Build cache key for game details"""
+    return f"game:{game_id}"
+
+
+def cache_key_team_profile(team: str, season: int) -> str:
+    """Build cache key for a team profile"""
+    return f"team_profile:{team}:{season}"
 
 
-def cache_key_teams() -> str:
+def cache_key_pbp(
+    game_id: str,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[int] = None,
+    fields: Optional[str] = None,
+) -> str:
+    """Build cache key for a play-by-play page"""
+    return f"pbp:{game_id}:{limit}:{offset}:{cursor}:{fields}"
+
+
+def cache_key_pbp_count(game_id: str) -> str:
+    """Build cache key for a game's play count"""
+    return f"pbp_count:{game_id}"
+
+
+def cache_key_teams(fields: Optional[str] = None) -> str:
     """Build cache key for teams list"""
-    return "teams:all"
+    return f"teams:all:{fields}"
 
 
-def cache_key_power_ratings(season: int) -> str:
+def cache_key_power_ratings(season: int, fields: Optional[str] = None) -> str:
     """Build cache key for power ratings"""
-    return f"power_ratings:{season}"
+    return f"power_ratings:{season}:{fields}"
 
 
-def cache_key_scoreboard(date: str) -> str:
+def cache_key_scoreboard(date: str, fields: Optional[str] = None) -> str:
     """Build cache key for scoreboard"""
-    return f"scoreboard:{date}"
+    return f"scoreboard:{date}:{fields}"
+
+
+def cache_key_scoreboard_live(date: str) -> str:
+    """Build cache key for the live scoreboard poller's read"""
+    return f"scoreboard_live:{date}"
+
+
+def cache_key_inventory(table: str) -> str:
+    """Build cache key for a table's inventory statistics"""
+    return f"inventory:{table}"
+
+
+# Cache tag builders
+def cache_tags(
+    table: str,
+    season: Optional[int] = None,
+    week: Optional[int] = None,
+    team: Optional[str] = None,
+    game_id: Optional[str] = None,
+    player_id: Optional[str] = None,
+    gameday: Optional[str] = None,
+) -> List[str]:
+    """
+    Build tags for an entry built from `table` rows matching the given filters
+
+    An entry is tagged with each dimension it is filtered by. An entry filtered
+    by season only is tagged with the season, since it contains every row of it,
+    and an unfiltered entry with "{table}:all".
+    """
+    tags = [f"table:{table}"]
+    if game_id:
+        tags.append(f"{table}:game:{game_id}")
+    if player_id:
+        tags.append(f"{table}:player:{player_id}")
+    if gameday:
+        tags.append(f"{table}:gameday:{gameday}")
+    if week and season:
+        tags.append(f"{table}:week:{season}:{week}")
+    if team:
+        tags.append(f"{table}:team:{team}")
+    if len(tags) == 1:
+        tags.append(f"{table}:season:{season}" if season else f"{table}:all")
+    return tags
+
+
+def row_tags(
+    table: str,
+    season: Optional[int] = None,
+    week: Optional[int] = None,
+    teams: Iterable[str] = (),
+    game_id: Optional[str] = None,
+    player_id: Optional[str] = None,
+    gameday: Optional[str] = None,
+) -> List[str]:
+    """
+    Build the tags to invalidate when a `table` row changes
+
+    Every entry that can contain the row carries at least one of these tags.
+    """
+    tags = [f"{table}:all"]
+    if game_id:
+        tags.append(f"{table}:game:{game_id}")
+    if player_id:
+        tags.append(f"{table}:player:{player_id}")
+    if gameday:
+        tags.append(f"{table}:gameday:{gameday}")
+    if week and season:
+        tags.append(f"{table}:week:{season}:{week}")
+    tags.extend(f"{table}:team:{team}" for team in teams if team)
+    if season:
+        tags.append(f"{table}:season:{season}")
+    return tags
@@ -0,0 +1,451 @@
+"""
+Declarative endpoint caching
+Wraps a /v1 endpoint with canonical cache keys, TTL policy and per-endpoint metrics
+
+Usage:
+    @router.get("/schedules")
+    @cached(
+        key=cache_key_schedules,
+        ttl_seconds=60,
+        stale_ttl_seconds=300,
+        tags=lambda season, week, team: cache_tags("schedules", season, week, team),
+    )
+    async def get_schedules(season: int = Query(2025), ...):
+        return await data_reader.read_schedules(season, week, team)
+
+The endpoint body only runs on a cache miss and receives canonical parameters.
+Composite endpoints can reuse another endpoint's cached result, under the same
+key and policy, with `await get_schedules.load(season=..., team=...)` (omitted
+parameters take the endpoint's defaults).
+Raise ValueError for invalid input and return None for "not found" - neither
+is cached, both are returned as the usual {"status": "error", ...} body. So is
+any other exception (e.g. a failed database read): the failure is never stored,
+and a stale entry being refreshed stays in place.
+
+Results are serialized (and compressed) once when they are cached; every
+response, hit or miss, sends those bytes as-is with their Content-Encoding
+(decompressed only for clients that do not accept it), a strong ETag and a
+Cache-Control max-age matching the entry's remaining TTL. If-None-Match
+requests for a cached entry are answered 304 with no body.
+
+Endpoints declared with `table=` (a function returning the result's rows) can
+also answer with Arrow IPC or Parquet, chosen by `format=` or the Accept
+header. These bodies are built from the cached JSON entry and memoized per
+process by the entry's content hash.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from datetime import date
+from typing import Optional, Any, Dict, List, Set, Tuple, Callable, Awaitable
+
+import orjson
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+
+from pydantic_core import PydanticUndefined
+
+from services.cache import cache_manager, CacheEntry, LocalCache
+from services.export import TABULAR_FORMATS, arrow_table, serialize_table
+from services.readers import select_columns
+
+logger = logging.getLogger(__name__)
+
+# Parameters whose values are case-insensitive codes (team=kc == team=KC)
+UPPERCASE_PARAMS = {"team", "position"}
+
+# Most ids accepted by one batch request (ids=a,b,c)
+MAX_BATCH_IDS = 100
+
+# Comma-separated column lists (fields=epa,play_type == fields=play_type, epa)
+FIELD_LIST_PARAMS = {"fields"}
+
+# ISO dates, as YYYY-MM-DD (date=20251015 == date=2025-10-15) - the form the
+# ETL's gameday row tags use
+DATE_PARAMS = {"date_param"}
+
+# Other Accept values that select a columnar format
+FORMAT_ALIASES = {"application/x-parquet": "parquet", "application/vnd.apache.arrow.file": "arrow"}
+
+# Arrow/Parquet bodies built from cached entries: "{etag}:{format}" -> bytes
+_tabular_bodies = LocalCache(max_entries=256, max_bytes=64 * 1024 * 1024)
+
+
+def canonicalize(name: str, value: Any) -> Any:
+    """Normalize a request parameter so equivalent requests share one cache key"""
+    if isinstance(value, str):
+        value = value.strip()
+        if name in UPPERCASE_PARAMS:
+            value = value.upper()
+        elif name in FIELD_LIST_PARAMS:
+            value = ",".join(sorted({field.strip().lower() for field in value.split(",")} - {""}))
+        elif name in DATE_PARAMS and value:
+            try:
+                value = date.fromisoformat(value).isoformat()
+            except ValueError:
+                pass  # Left for the endpoint to reject
+        return value or None
+    return value
+
+
+def parse_fields(fields: Optional[str], table: str) -> Optional[List[str]]:
+    """Split a canonical fields= value into column names, validated against the table schema"""
+    if not fields:
+        return None
+    columns = fields.split(",")
+    select_columns(table, columns)  # Raises ValueError for unknown fields
+    return columns
+
+
+def default_params(fn: Callable[..., Any]) -> Dict[str, Any]:
+    """An endpoint's parameter defaults, unwrapped from Query()/Path() markers"""
+    defaults = {}
+    for name, parameter in inspect.signature(fn).parameters.items():
+        default = getattr(parameter.default, "default", parameter.default)
+        if default not in (inspect.Parameter.empty, Ellipsis, PydanticUndefined):
+            defaults[name] = default
+    return defaults
+
+
+def call_with(fn: Callable[..., Any], params: Dict[str, Any]) -> Any:
+    """Call fn with the subset of params it accepts"""
+    accepted = inspect.signature(fn).parameters
+    return fn(**{name: value for name, value in params.items() if name in accepted})
+
+
+def accepted_encodings(request: Request) -> Set[str]:
+    """Content codings the client accepts (from Accept-Encoding)"""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, quality = part.partition(";")
+        quality = quality.strip()
+        try:
+            if quality.startswith("q=") and float(quality[2:]) == 0:
+                continue  # Explicitly refused
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def entry_etag(entry: CacheEntry, encoding: Optional[str]) -> str:
+    """Strong ETag of one representation (each content coding and columnar format gets its own)"""
+    return f'"{entry.etag}-{encoding}"' if encoding else f'"{entry.etag}"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True if the client already has this representation (etag as sent in the ETag header)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def cache_control(entry: CacheEntry, stale_ttl_seconds: int) -> str:
+    """Cache-Control matching the entry's remaining freshness"""
+    max_age = max(0, int(entry.soft_expires_at - time.time()))
+    directives = f"public, max-age={max_age}"
+    if stale_ttl_seconds:
+        directives += f", stale-while-revalidate={stale_ttl_seconds}"
+    return directives
+
+
+def entry_response(
+    entry: CacheEntry, request: Request, stale_ttl_seconds: int = 0, vary: str = "Accept-Encoding"
+) -> Response:
+    """Send a cached body without re-serializing it (304 if the client has it)"""
+    encoding = entry.encoding if entry.encoding in accepted_encodings(request) else None
+    headers = {
+        "ETag": entry_etag(entry, encoding),
+        "Cache-Control": cache_control(entry, stale_ttl_seconds),
+        "Vary": vary,
+    }
+    if if_none_match(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+    return Response(content=entry.json(), media_type="application/json", headers=headers)
+
+
+def negotiate_format(request: Request, format: Optional[str] = None) -> str:
+    """"json", "arrow" or "parquet" - format= wins, then the Accept header"""
+    if format:
+        format = format.strip().lower()
+        if format != "json" and format not in TABULAR_FORMATS:
+            raise ValueError(f"Unknown format {format} (one of: json, {', '.join(TABULAR_FORMATS)})")
+        return format
+    accept = request.headers.get("accept", "").lower()
+    for name, media_type in TABULAR_FORMATS.items():
+        if media_type in accept:
+            return name
+    for media_type, name in FORMAT_ALIASES.items():
+        if media_type in accept:
+            return name
+    return "json"
+
+
+def build_tabular(value: Any, rows_of: Callable[[Any], List[Dict[str, Any]]], format: str) -> bytes:
+    """Serialize a result's rows, with the rest of a dict result as schema metadata"""
+    rows = rows_of(value)
+    metadata = (
+        {name: item for name, item in value.items() if item is not rows}
+        if isinstance(value, dict)
+        else None
+    )
+    return serialize_table(arrow_table(rows, metadata), format)
+
+
+async def tabular_response(
+    entry: CacheEntry,
+    request: Request,
+    format: str,
+    rows_of: Callable[[Any], List[Dict[str, Any]]],
+    ttl_seconds: float,
+    stale_ttl_seconds: int = 0,
+) -> Response:
+    """Send a cached entry as Arrow IPC or Parquet (304 if the client has it)"""
+    headers = {
+        "ETag": entry_etag(entry, format),
+        "Cache-Control": cache_control(entry, stale_ttl_seconds),
+        "Vary": "Accept, Accept-Encoding",
+    }
+    if if_none_match(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    memo_key = f"{entry.etag}:{format}"
+    body = _tabular_bodies.get(memo_key)
+    if body is None:
+        # Columnar encoding (Parquet compression especially) is CPU work - keep it off the loop
+        body = await asyncio.to_thread(build_tabular, entry.value, rows_of, format)
+        _tabular_bodies.set(memo_key, body, ttl_seconds, len(body))
+    return Response(content=body, media_type=TABULAR_FORMATS[format], headers=headers)
+
+
+def parse_ids(ids: str, limit: int = MAX_BATCH_IDS) -> List[str]:
+    """Split a comma-separated ids= value (deduplicated, in request order)"""
+    parsed = list(dict.fromkeys(item.strip() for item in ids.split(",") if item.strip()))
+    if not parsed:
+        raise ValueError("ids must list at least one id")
+    if len(parsed) > limit:
+        raise ValueError(f"At most {limit} ids per request (got {len(parsed)})")
+    return parsed
+
+
+async def get_or_load_many(
+    ids: List[str],
+    key: Callable[[str], str],
+    load_many: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+    ttl_seconds: int,
+    stale_ttl_seconds: int = 0,
+    tags: Optional[Callable[[str], List[str]]] = None,
+) -> Dict[str, CacheEntry]:
+    """
+    Batch counterpart of the per-item cache
+
+    One multi-get for every id, one load_many(missing ids) call for the
+    misses, and the loaded items are written back under their per-item keys
+    (so single-item endpoints hit them too). Returns id -> entry for the ids
+    that exist.
+    """
+    keys = {item_id: key(item_id) for item_id in ids}
+    cached_entries = await cache_manager.get_many_entries(list(keys.values()))
+    found = {item_id: cached_entries[k] for item_id, k in keys.items() if k in cached_entries}
+
+    missing = [item_id for item_id in ids if item_id not in found]
+    if missing:
+        loaded = await load_many(missing)
+        stored = await cache_manager.set_many(
+            {keys[item_id]: value for item_id, value in loaded.items() if item_id in keys},
+            ttl_seconds,
+            stale_ttl_seconds,
+            {keys[item_id]: tags(item_id) for item_id in loaded if item_id in keys} if tags else None,
+        )
+        found.update({item_id: stored[keys[item_id]] for item_id in loaded if item_id in keys})
+    return found
+
+
+def batch_response(name: str, ids: List[str], found: Dict[str, CacheEntry]) -> Response:
+    """{name: [items in request order], "missing": [ids]} built from the cached JSON bodies"""
+    items = b",".join(found[item_id].json() for item_id in ids if item_id in found)
+    missing = [item_id for item_id in ids if item_id not in found]
+    body = b'{"%s":[%s],"missing":%s}' % (name.encode(), items, orjson.dumps(missing))
+    return Response(content=body, media_type="application/json")
+
+
+class EndpointStats:
+    """Hit/miss/latency counters for one cached endpoint"""
+
+    def __init__(self):
+        self.requests = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, status: str, elapsed_ms: float) -> None:
+        """Record one request"""
+        self.requests += 1
+        if status == "hit":
+            self.hits += 1
+        elif status == "stale":
+            self.stale_hits += 1
+        elif status == "miss":
+            self.misses += 1
+        else:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counters plus derived hit ratio and average latency"""
+        served = self.hits + self.stale_hits + self.misses
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round((self.hits + self.stale_hits) / served, 4) if served else 0.0,
+            "avg_ms": round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+# endpoint name -> counters
+_endpoint_stats: Dict[str, EndpointStats] = {}
+
+
+def endpoint_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-endpoint cache metrics"""
+    return {name: stats.as_dict() for name, stats in sorted(_endpoint_stats.items())}
+
+
+def cached(
+    key: Callable[..., str],
+    ttl_seconds: int,
+    stale_ttl_seconds: int = 0,
+    tags: Optional[Callable[..., List[str]]] = None,
+    not_found: Optional[Callable[..., str]] = None,
+    error_body: Optional[Dict[str, Any]] = None,
+    table: Optional[Callable[[Any], List[Dict[str, Any]]]] = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache an endpoint's result under a canonical key
+
+    - **key**: cache key builder, called with the canonical parameters it accepts
+    - **ttl_seconds** / **stale_ttl_seconds**: soft TTL and stale-while-revalidate window
+    - **tags**: invalidation tags builder (see cache_tags)
+    - **not_found**: message builder used when the endpoint returns None
+    - **error_body**: extra fields merged into error responses
+    - **table**: returns the rows of a result - enables Arrow/Parquet responses
+      (adds a `format` query parameter)
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        stats = _endpoint_stats.setdefault(fn.__name__, EndpointStats())
+        endpoint_logger = logging.getLogger(fn.__module__)
+
+        async def get_entry(params: Dict[str, Any]) -> Tuple[Optional[CacheEntry], str]:
+            """Serve canonical params through the cache"""
+            return await cache_manager.get_or_set_entry(
+                call_with(key, params),
+                lambda: fn(**params),
+                ttl_seconds=ttl_seconds,
+                stale_ttl_seconds=stale_ttl_seconds,
+                tags=call_with(tags, params) if tags else (),
+            )
+
+        def error(message: str) -> JSONResponse:
+            # Returned as a Response so list endpoints can carry the error body
+            return JSONResponse({"status": "error", "message": message, **(error_body or {})})
+
+        @functools.wraps(fn)
+        async def wrapper(_request: Request, format: Optional[str] = None, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            params = {name: canonicalize(name, value) for name, value in kwargs.items()}
+            status = "error"
+            try:
+                response_format = negotiate_format(_request, format) if table else "json"
+                entry, status = await get_entry(params)
+
+                if entry is None:
+                    message = call_with(not_found, params) if not_found else "Not found"
+                    return error(message)
+
+                if response_format != "json":
+                    return await tabular_response(
+                        entry,
+                        _request,
+                        response_format,
+                        table,
+                        ttl_seconds + stale_ttl_seconds,
+                        stale_ttl_seconds,
+                    )
+                return entry_response(
+                    entry,
+                    _request,
+                    stale_ttl_seconds,
+                    vary="Accept, Accept-Encoding" if table else "Accept-Encoding",
+                )
+
+            except HTTPException:
+                raise
+            except ValueError as e:
+                status = "error"
+                endpoint_logger.warning(f"Invalid request to {fn.__name__}: {e}")
+                return error(str(e))
+            except Exception as e:
+                status = "error"
+                endpoint_logger.error(f"Error in {fn.__name__} {params}: {e}")
+                return error(str(e))
+            finally:
+                stats.record(status, (time.perf_counter() - started) * 1000)
+
+        defaults = default_params(fn)
+
+        async def load(**kwargs: Any) -> Any:
+            """The endpoint's (cached) result as a Python value, None if not found"""
+            entry, _ = await get_entry(
+                {name: canonicalize(name, value) for name, value in {**defaults, **kwargs}.items()}
+            )
+            return entry.value if entry is not None else None
+
+        wrapper.load = load
+
+        # Expose the endpoint's own parameters to FastAPI, plus the Request
+        # (and format= for endpoints with a columnar representation)
+        signature = inspect.signature(fn)
+        extra = [inspect.Parameter("_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)]
+        if table:
+            extra.append(
+                inspect.Parameter(
+                    "format",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=Optional[str],
+                    default=Query(
+                        None,
+                        description="json (default), arrow (Arrow IPC stream) or parquet - "
+                        "or send an Accept header",
+                    ),
+                )
+            )
+        wrapper.__signature__ = signature.replace(
+            parameters=[*signature.parameters.values(), *extra]
+        )
+        return wrapper
+
+    return decorator
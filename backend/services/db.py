@@ -0,0 +1,329 @@
+"""
+Async PostgreSQL connection pool
+Talks to Supabase Postgres directly over DATABASE_URL (psycopg 3)
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+import uuid
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator
+
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_value(value: Any) -> Any:
+    """Convert Postgres types to the JSON-friendly values PostgREST would return"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    return value
+
+
+def normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize every value in a result row"""
+    return {key: _normalize_value(value) for key, value in row.items()}
+
+
+class Database:
+    """Bounded async connection pool with per-query timeouts and metrics"""
+
+    def __init__(self):
+        """Pool is created on connect() - nothing is opened at import time"""
+        self.pool: Optional[AsyncConnectionPool] = None
+        self._queries = 0
+        self._errors = 0
+        self._timeouts = 0
+        self._query_ms = 0.0
+
+    async def connect(self) -> None:
+        """Open the connection pool (idempotent)"""
+        if self.pool:
+            return
+
+        connect_kwargs: Dict[str, Any] = {
+            "row_factory": dict_row,
+            # Statements executed this many times are prepared server-side.
+            # Disable when connecting through a transaction-mode pooler.
+            "prepare_threshold": (
+                settings.DB_PREPARE_THRESHOLD if settings.DB_PREPARED_STATEMENTS else None
+            ),
+        }
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_kwargs["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+        self.pool = AsyncConnectionPool(
+            conninfo=settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+            timeout=settings.DB_POOL_TIMEOUT,
+            kwargs=connect_kwargs,
+            name="nfl-api",
+            open=False,
+        )
+        await self.pool.open(wait=False)
+        logger.info(
+            f"✅ Postgres pool opened (size: {settings.DB_POOL_MIN_SIZE}-{settings.DB_POOL_MAX_SIZE})"
+        )
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        if not self.pool:
+            return
+        try:
+            await self.pool.close()
+        except Exception as e:
+            logger.error(f"Postgres pool close error: {e}")
+        finally:
+            self.pool = None
+
+    async def fetch(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run a query on a pooled connection and return normalized rows"""
+        if not self.pool:
+            await self.connect()
+
+        timeout = timeout or settings.DB_QUERY_TIMEOUT
+        started = time.perf_counter()
+        self._queries += 1
+        try:
+            return await asyncio.wait_for(self._execute(query, params), timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            logger.error(f"Query timed out after {timeout}s: {query[:80]}")
+            raise
+        except Exception:
+            self._errors += 1
+            raise
+        finally:
+            self._query_ms += (time.perf_counter() - started) * 1000
+
+    async def fetchrow(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Run a query and return the first row (or None)"""
+        rows = await self.fetch(query, params, timeout)
+        return rows[0] if rows else None
+
+    async def stream(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Run a query through a server-side cursor and yield normalized rows in batches
+
+        Only one batch is held in memory at a time. The connection stays
+        checked out until the generator is exhausted or closed; each fetch is
+        bounded by statement_timeout rather than DB_QUERY_TIMEOUT.
+        """
+        if not self.pool:
+            await self.connect()
+
+        started = time.perf_counter()
+        self._queries += 1
+        try:
+            async with self.pool.connection() as conn:
+                # Named cursors only live inside a transaction (the pool opens one)
+                async with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cur:
+                    await cur.execute(query, params)
+                    while True:
+                        rows = await cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield [normalize_row(row) for row in rows]
+        except Exception:
+            self._errors += 1
+            raise
+        finally:
+            self._query_ms += (time.perf_counter() - started) * 1000
+
+    async def copy_merge(
+        self,
+        table: str,
+        columns: Sequence[str],
+        conflict_columns: Sequence[str],
+        chunks: AsyncIterator[bytes],
+        touch_column: Optional[str] = None,
+        returning: Sequence[str] = (),
+        delete_scope: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Bulk upsert CSV chunks into table, writing only what changed
+
+        The chunks (CSV without header, columns in order) are streamed with
+        COPY into a temporary staging table, then merged into table with one
+        INSERT ... ON CONFLICT (conflict_columns) DO UPDATE that skips rows
+        whose loaded columns are unchanged (IS DISTINCT FROM). touch_column
+        (e.g. updated_at) is set to NOW() on updated rows.
+
+        With delete_scope (column -> value, or a list of values), rows of table
+        in that scope that are not in the load are deleted (conflict columns
+        must be non-null).
+        Nothing is deleted if the load is empty.
+
+        Everything runs in one transaction, so readers see all of the load or
+        none of it. Table and column names are put in SQL as given - pass only
+        names from code, never from a request.
+
+        Returns counts (copied, inserted, updated, deleted) plus the returning
+        columns of inserted/updated rows ("changed"), of updated rows as they
+        were before the update ("previous") and of deleted rows ("removed").
+        """
+        if not self.pool:
+            await self.connect()
+
+        column_list = ", ".join(columns)
+        conflict_list = ", ".join(conflict_columns)
+        compared = [column for column in columns if column not in conflict_columns]
+        updates = [f"{column} = EXCLUDED.{column}" for column in compared]
+        if touch_column:
+            updates.append(f"{touch_column} = NOW()")
+        returned = ", ".join(f"target.{column}" for column in returning)
+        staging = f"staging_{table}"
+        matches = " AND ".join(f"staged.{column} = target.{column}" for column in conflict_columns)
+
+        if compared:
+            on_conflict = (
+                f"UPDATE SET {', '.join(updates)}"
+                f" WHERE ({', '.join(f'target.{column}' for column in compared)})"
+                f" IS DISTINCT FROM ({', '.join(f'EXCLUDED.{column}' for column in compared)})"
+            )
+        else:
+            on_conflict = "NOTHING"
+
+        # DISTINCT ON: a key repeated in the file would otherwise abort the merge
+        merge = (
+            f"INSERT INTO {table} AS target ({column_list})"
+            f" SELECT DISTINCT ON ({conflict_list}) {column_list} FROM {staging}"
+            f" ON CONFLICT ({conflict_list}) DO {on_conflict}"
+            # xmax is 0 for a freshly inserted row version
+            f" RETURNING (target.xmax = 0) AS _inserted"
+            + (f", {returned}" if returned else "")
+        )
+        if returned and compared:
+            # RETURNING only has the new values of an updated row. Its old values
+            # (e.g. the week a game moved from) are read in the same statement -
+            # every part of a WITH sees the table as it was before the merge.
+            plain = ", ".join(returning)
+            merge = (
+                f"WITH merged AS ({merge}),"
+                f" previous AS (SELECT DISTINCT {returned} FROM {table} AS target"
+                f" JOIN {staging} AS staged ON {matches}"
+                f" WHERE ({', '.join(f'target.{column}' for column in compared)})"
+                f" IS DISTINCT FROM ({', '.join(f'staged.{column}' for column in compared)}))"
+                f" SELECT _inserted, FALSE AS _previous, {plain} FROM merged"
+                f" UNION ALL SELECT NULL, TRUE, {plain} FROM previous"
+            )
+
+        started = time.perf_counter()
+        self._queries += 1
+        try:
+            async with self.pool.connection() as conn:
+                async with conn.transaction():
+                    # Bulk statements outlive the API's statement_timeout
+                    await conn.execute("SET LOCAL statement_timeout = 0")
+                    # Only the loaded columns, no constraints or defaults (no sequence use)
+                    await conn.execute(
+                        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS"
+                        f" SELECT {column_list} FROM {table} WITH NO DATA"
+                    )
+                    async with conn.cursor() as cur:
+                        async with cur.copy(
+                            f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+                        ) as copy:
+                            async for chunk in chunks:
+                                await copy.write(chunk)
+                        copied = cur.rowcount
+                        # Temp tables are never auto-analyzed - give the planner row counts
+                        await cur.execute(f"ANALYZE {staging}")
+
+                        await cur.execute(merge)
+                        changed: List[Dict[str, Any]] = []
+                        previous: List[Dict[str, Any]] = []
+                        for row in await cur.fetchall():
+                            row = normalize_row(row)
+                            (previous if row.pop("_previous", False) else changed).append(row)
+
+                        removed: List[Dict[str, Any]] = []
+                        if delete_scope is not None and copied:
+                            scope = [
+                                f"target.{column} = ANY(%s)"
+                                if isinstance(value, (list, tuple))
+                                else f"target.{column} = %s"
+                                for column, value in delete_scope.items()
+                            ]
+                            await cur.execute(
+                                f"DELETE FROM {table} AS target"
+                                f" WHERE {' AND '.join(scope) or 'TRUE'}"
+                                f" AND NOT EXISTS (SELECT 1 FROM {staging} AS staged"
+                                f" WHERE {matches})"
+                                f" RETURNING 1 AS _deleted" + (f", {returned}" if returned else ""),
+                                [
+                                    list(value) if isinstance(value, tuple) else value
+                                    for value in delete_scope.values()
+                                ],
+                            )
+                            removed = [normalize_row(row) for row in await cur.fetchall()]
+
+            inserted = sum(1 for row in changed if row.pop("_inserted"))
+            for row in previous:
+                row.pop("_inserted")
+            for row in removed:
+                row.pop("_deleted")
+            return {
+                "copied": copied,
+                "inserted": inserted,
+                "updated": len(changed) - inserted,
+                "deleted": len(removed),
+                "changed": changed,
+                "previous": previous,
+                "removed": removed,
+            }
+        except Exception:
+            self._errors += 1
+            raise
+        finally:
+            self._query_ms += (time.perf_counter() - started) * 1000
+
+    async def _execute(
+        self, query: str, params: Optional[Sequence[Any]]
+    ) -> List[Dict[str, Any]]:
+        """Borrow a connection, execute and release it"""
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, params)
+                rows = await cur.fetchall() if cur.description else []
+        return [normalize_row(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool and query metrics"""
+        pool_stats = self.pool.get_stats() if self.pool else {}
+        return {
+            "connected": self.pool is not None,
+            "pool": pool_stats,
+            "queries": self._queries,
+            "errors": self._errors,
+            "timeouts": self._timeouts,
+            "avg_query_ms": round(self._query_ms / self._queries, 2) if self._queries else 0.0,
+        }
+
+
+# Global database pool instance
+database = Database()
@@ -2,26 +2,367 @@
 ETL (Extract-Transform-Load) functions
 Loads data from Parquet files to Supabase PostgreSQL
 
+Parquet-backed tables are bulk loaded over DATABASE_URL: the file is scanned
+in record batches, each batch transformed with Polars and streamed into a
+staging table with COPY, then merged into the target with one set-based
+upsert (see copy_parquet). Memory is bounded by COPY_BATCH_ROWS.
+
+Loads are incremental:
+- a file whose size and mtime match the etl_manifest entry of its last
+  successful load is skipped (force=True reloads it)
+- only inserted and changed rows are written; rows missing from the file are
+  deleted (within the loaded season)
+- only the cache entries that can contain a changed or deleted row are
+  invalidated (row_tags), instead of the whole table
+
 Run manually or from background job queue:
     python -m scripts.etl
 """
 
 import polars as pl
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from pathlib import Path
+import io
 import logging
-from typing import List, Dict, Any
+from typing import (
+    Optional, List, Dict, Any, Iterator, AsyncIterator, Sequence, Tuple, Callable, Awaitable
+)
 import asyncio
-
-from services.readers import data_reader
+import time
+
+from core.config import settings
+from services.db import database
+from services.readers import data_reader, export_columns
+from services.cache import cache_manager, row_tags
+from services.ratings import elo_engine, ELO_COLUMNS
+from services.season_stats import (
+    PLAY_COLUMNS, PLAY_SCHEMA, GAME_COLUMNS, GAME_SCHEMA, TOTAL_COLUMNS, TOTAL_SCHEMA,
+    frame, week_totals, season_stats, changed_weeks,
+)
 
 logger = logging.getLogger(__name__)
 
 # Configuration
 DATA_RAW_PATH = Path(__file__).parent.parent.parent.parent / "data" / "raw"
-BATCH_SIZE = 1000  # Upsert in batches to avoid payload limits
+COPY_BATCH_ROWS = 50_000  # Parquet rows read, transformed and copied at a time
+
+# table -> (columns returned for changed rows, cache tags of such a row)
+CHANGE_TAGS: Dict[str, Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], List[str]]]] = {
+    "schedules": (
+        ("game_id", "season", "week", "gameday", "home_team", "away_team"),
+        lambda row: row_tags(
+            "schedules",
+            row["season"],
+            row["week"],
+            (row["home_team"], row["away_team"]),
+            row["game_id"],
+            gameday=row["gameday"],
+        ),
+    ),
+    "play_by_play": (
+        ("game_id", "season", "week", "posteam", "defteam"),
+        lambda row: row_tags(
+            "play_by_play", row["season"], row["week"], (row["posteam"], row["defteam"]), row["game_id"]
+        ),
+    ),
+    "depth_charts": (
+        ("season", "week", "team", "player_id"),
+        lambda row: row_tags(
+            "depth_charts", row["season"], row["week"], (row["team"],), player_id=row["player_id"]
+        ),
+    ),
+    "players": (
+        ("player_id", "team"),
+        lambda row: row_tags("players", teams=(row["team"],), player_id=row["player_id"]),
+    ),
+    "player_stats": (
+        ("player_id", "season", "week", "team"),
+        lambda row: row_tags(
+            "player_stats", row["season"], row["week"], (row["team"],), player_id=row["player_id"]
+        ),
+    ),
+    "injuries": (
+        ("season", "week", "team", "player_id"),
+        lambda row: row_tags(
+            "injuries", row["season"], row["week"], (row["team"],), player_id=row["player_id"]
+        ),
+    ),
+    "teams": (
+        ("team",),
+        lambda row: row_tags("teams", teams=(row["team"],)),
+    ),
+    "power_ratings": (
+        ("team", "season"),
+        lambda row: row_tags("power_ratings", row["season"], teams=(row["team"],)),
+    ),
+    "season_stats": (
+        ("team", "season", "week"),
+        lambda row: row_tags("season_stats", row["season"], row["week"], (row["team"],)),
+    ),
+}
+
+# Tables whose changed weeks are logged in etl_changes for derived datasets
+# (season_stats re-aggregates only the play-by-play weeks that changed)
+CHANGE_LOG_TABLES = ("play_by_play",)
+
+
+def _update_high_water(marks: Dict[str, Any], df: pl.DataFrame) -> None:
+    """Track the latest season in df's rows, and the latest week of that season"""
+    if "season" not in df.columns:
+        return
+    season = df["season"].max()
+    if season is None or (marks.get("season") is not None and season < marks["season"]):
+        return
+    week = df.filter(pl.col("season") == season)["week"].max() if "week" in df.columns else None
+    if season == marks.get("season") and marks.get("week") is not None:
+        week = marks["week"] if week is None else max(week, marks["week"])
+    marks.update(season=season, week=week)
+
+
+def _csv(df: pl.DataFrame) -> bytes:
+    """Rows as headerless CSV for COPY"""
+    # Arrow's CSV writer: unquoted empty = NULL, "" = empty string (COPY csv semantics)
+    sink = io.BytesIO()
+    pa_csv.write_csv(df.to_arrow(), sink, pa_csv.WriteOptions(include_header=False))
+    return sink.getvalue()
+
+
+def _frame_chunks(df: pl.DataFrame) -> Iterator[bytes]:
+    """A frame as CSV, COPY_BATCH_ROWS rows at a time"""
+    for offset in range(0, df.height, COPY_BATCH_ROWS):
+        yield _csv(df.slice(offset, COPY_BATCH_ROWS))
+
+
+def _csv_chunks(
+    path: Path,
+    columns: List[pl.Expr],
+    where: Optional[pl.Expr] = None,
+    marks: Optional[Dict[str, Any]] = None,
+) -> Iterator[bytes]:
+    """
+    Scan a parquet file batch by batch, yielding the transformed rows as CSV
 
+    marks, if given, collects the high-water season/week of the rows.
+    """
+    parquet = pq.ParquetFile(path)
+    # Read only the source columns the expressions use
+    expressions = [*columns, *([where] if where is not None else [])]
+    source_columns = sorted({name for expr in expressions for name in expr.meta.root_names()})
+
+    for batch in parquet.iter_batches(batch_size=COPY_BATCH_ROWS, columns=source_columns):
+        df = pl.from_arrow(batch)
+        if where is not None:
+            df = df.filter(where)
+        df = df.select(columns)
+        if df.is_empty():
+            continue
+        if marks is not None:
+            _update_high_water(marks, df)
+        yield _csv(df)
+
+
+async def _in_thread(iterator: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Advance a blocking iterator in a worker thread, one item at a time"""
+    done = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, done)
+        if item is done:
+            return
+        yield item
+
+
+async def _manifest_matches(table: str, path: Path) -> bool:
+    """True if path is the file (same name, size and mtime) last loaded into table"""
+    try:
+        row = await database.fetchrow(
+            "SELECT file_name, file_size, file_mtime FROM etl_manifest WHERE dataset = %s",
+            [table],
+        )
+    except Exception as e:
+        logger.warning(f"ETL manifest unavailable ({e}) - loading {table} in full")
+        return False
+    stat = path.stat()
+    return bool(row) and (row["file_name"], row["file_size"], row["file_mtime"]) == (
+        path.name,
+        stat.st_size,
+        stat.st_mtime,
+    )
+
+
+async def _record_manifest(
+    table: str,
+    path: Optional[Path],
+    rows: int,
+    changed: Optional[int] = None,
+    high_water: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Remember the file just loaded into table (path None for derived datasets)
+    and its high-water marks, then refresh the table's inventory entry
+    """
+    stat = path.stat() if path is not None else None
+    high_water = high_water or {}
+    await database.fetch(
+        "INSERT INTO etl_manifest (dataset, file_name, file_size, file_mtime, rows_loaded,"
+        " rows_changed, high_season, high_week, loaded_at)"
+        " VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW())"
+        " ON CONFLICT (dataset) DO UPDATE SET file_name = EXCLUDED.file_name,"
+        " file_size = EXCLUDED.file_size, file_mtime = EXCLUDED.file_mtime,"
+        " rows_loaded = EXCLUDED.rows_loaded, rows_changed = EXCLUDED.rows_changed,"
+        " high_season = EXCLUDED.high_season, high_week = EXCLUDED.high_week,"
+        " loaded_at = EXCLUDED.loaded_at",
+        [
+            table,
+            path.name if path is not None else None,
+            stat.st_size if stat is not None else None,
+            stat.st_mtime if stat is not None else None,
+            rows,
+            changed,
+            high_water.get("season"),
+            high_water.get("week"),
+        ],
+    )
+    await cache_manager.invalidate_tags(f"inventory:{table}")
+
+
+async def _record_changes(table: str, weeks: List[Tuple[int, int]]) -> None:
+    """Log the (season, week)s of table whose rows changed"""
+    if not weeks:
+        return
+    await database.fetch(
+        "INSERT INTO etl_changes (dataset, season, week, changed_at)"
+        " SELECT %s, season, week, NOW() FROM unnest(%s::int[], %s::int[]) AS changed(season, week)"
+        " ON CONFLICT (dataset, season, week) DO UPDATE SET changed_at = EXCLUDED.changed_at",
+        [table, [season for season, _ in weeks], [week for _, week in weeks]],
+    )
+
+
+async def copy_parquet(
+    table: str,
+    pattern: str,
+    columns: List[pl.Expr],
+    conflict_columns: Sequence[str],
+    where: Optional[pl.Expr] = None,
+    touch_column: Optional[str] = None,
+    delete_scope: Optional[Dict[str, Any]] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Bulk load the first parquet file matching pattern into table
 
-async def load_schedules(season: int = 2025) -> Dict[str, Any]:
+    columns are Polars expressions producing the table's columns (by alias),
+    where an optional row filter. Rows are upserted on conflict_columns in
+    one transaction - unchanged rows are not rewritten, and with delete_scope
+    rows of that scope missing from the file are deleted. Then the cache
+    entries affected by the changes (see CHANGE_TAGS) are invalidated.
+
+    Skipped if the file is unchanged since its last load, unless force.
+    """
+    files = sorted(DATA_RAW_PATH.glob(pattern))
+    if not files:
+        logger.warning(f"No file matching {pattern} for {table}")
+        return {"status": "failed", "reason": "File not found"}
+    path = files[0]
+
+    if not force and await _manifest_matches(table, path):
+        logger.info(f"{path.name} unchanged since its last load - skipping {table}")
+        return {"status": "success", "unchanged": True, "records_inserted": 0}
+
+    high_water: Dict[str, Any] = {}
+    return await _merge(
+        table,
+        [expr.meta.output_name() for expr in columns],
+        conflict_columns,
+        _in_thread(_csv_chunks(path, columns, where, high_water)),
+        path,
+        high_water,
+        touch_column=touch_column,
+        delete_scope=delete_scope,
+    )
+
+
+async def copy_frame(
+    table: str,
+    df: pl.DataFrame,
+    conflict_columns: Sequence[str],
+    touch_column: Optional[str] = None,
+    delete_scope: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Merge computed rows (a derived dataset) into table
+
+    The same merge as copy_parquet - only changed rows are written, and only
+    their cache entries invalidated - with the frame's columns as the table's.
+    """
+    high_water: Dict[str, Any] = {}
+    if not df.is_empty():
+        _update_high_water(high_water, df)
+    return await _merge(
+        table,
+        df.columns,
+        conflict_columns,
+        _in_thread(_frame_chunks(df)),
+        None,
+        high_water,
+        touch_column=touch_column,
+        delete_scope=delete_scope,
+    )
+
+
+async def _merge(
+    table: str,
+    columns: List[str],
+    conflict_columns: Sequence[str],
+    chunks: AsyncIterator[bytes],
+    path: Optional[Path],
+    high_water: Dict[str, Any],
+    touch_column: Optional[str] = None,
+    delete_scope: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """COPY chunks into table, invalidate the changed rows' tags and record the load"""
+    tag_columns, tags_of = CHANGE_TAGS[table]
+    result = await database.copy_merge(
+        table,
+        columns,
+        conflict_columns,
+        chunks,
+        touch_column=touch_column,
+        returning=tag_columns,
+        delete_scope=delete_scope,
+    )
+    logger.info(
+        f"Copied {result['copied']} rows from {path.name if path else 'computed rows'} into {table}: "
+        f"{result['inserted']} inserted, {result['updated']} updated, {result['deleted']} deleted"
+    )
+
+    # Updated rows count with their old values too - a game moved to another
+    # week must leave the old week's entries as well
+    rows = [*result["changed"], *result["previous"], *result["removed"]]
+    tags = {tag for row in rows for tag in tags_of(row)}
+    if tags:
+        await cache_manager.invalidate_tags(*sorted(tags))
+    if table in CHANGE_LOG_TABLES:
+        await _record_changes(table, changed_weeks(rows))
+    await _record_manifest(
+        table,
+        path,
+        result["copied"],
+        result["inserted"] + result["updated"] + result["deleted"],
+        high_water,
+    )
+
+    return {
+        "status": "success",
+        "records_read": result["copied"],
+        "records_inserted": result["inserted"],
+        "records_updated": result["updated"],
+        "records_deleted": result["deleted"],
+        "invalidated_tags": len(tags),
+    }
+
+
+async def load_schedules(season: int = 2025, force: bool = False) -> Dict[str, Any]:
     """
     Load schedules from parquet to PostgreSQL
 
@@ -38,68 +379,359 @@ async def load_schedules(season: int = 2025) -> Dict[str, Any]:
 
         logger.info(f"Loading schedules for season {season}...")
 
-        # Find parquet file
-        parquet_file = DATA_RAW_PATH / f"schedules_{season}*.parquet"
-        files = list(DATA_RAW_PATH.glob(f"schedules_*{season}*.parquet"))
-
-        if not files:
-            logger.warning(f"No schedules file found for {season}")
-            return {"status": "failed", "reason": "File not found"}
-
-        # Read parquet
-        df = pl.read_parquet(str(files[0]))
-        logger.info(f"Read {len(df)} schedules from {files[0].name}")
-
-        # Select and rename columns
-        df = df.select([
-            pl.col("game_id"),
-            pl.col("season"),
-            pl.col("week"),
-            pl.col("gameday"),
-            pl.col("gametime"),
-            pl.col("home_team"),
-            pl.col("away_team"),
-            pl.col("stadium"),
-            pl.col("roof"),
-            pl.col("temp"),
-            pl.col("wind"),
-            pl.col("spread_line"),
-            pl.col("total_line"),
-            pl.col("home_moneyline").cast(pl.Int32).alias("home_moneyline"),
-            pl.col("away_moneyline").cast(pl.Int32).alias("away_moneyline"),
-            pl.col("home_score"),
-            pl.col("away_score"),
-            pl.col("result"),
-        ])
-
-        # Upsert to database in batches
-        data = df.to_dicts()
-        inserted = 0
-
-        for i in range(0, len(data), BATCH_SIZE):
-            batch = data[i : i + BATCH_SIZE]
-            try:
-                result = (
-                    data_reader.supabase.table("schedules")
-                    .upsert(batch, on_conflict="game_id")
-                    .execute()
-                )
-                inserted += len(batch)
-                logger.debug(f"Inserted batch {i//BATCH_SIZE + 1}")
-            except Exception as e:
-                logger.error(f"Error inserting batch: {e}")
-                return {"status": "failed", "reason": str(e)}
-
-        logger.info(f"Successfully loaded {inserted} schedules")
-        return {"status": "success", "records_inserted": inserted}
+        return await copy_parquet(
+            "schedules",
+            f"schedules_*{season}*.parquet",
+            [
+                pl.col("game_id"),
+                pl.col("season"),
+                pl.col("week"),
+                pl.col("gameday"),
+                pl.col("gametime"),
+                pl.col("home_team"),
+                pl.col("away_team"),
+                pl.col("stadium"),
+                pl.col("roof"),
+                pl.col("temp"),
+                pl.col("wind"),
+                pl.col("spread_line"),
+                pl.col("total_line"),
+                pl.col("home_moneyline").cast(pl.Int32).alias("home_moneyline"),
+                pl.col("away_moneyline").cast(pl.Int32).alias("away_moneyline"),
+                pl.col("home_score"),
+                pl.col("away_score"),
+                pl.col("result"),
+            ],
+            conflict_columns=["game_id"],
+            touch_column="updated_at",
+            # No deletes - play_by_play rows reference their game
+            force=force,
+        )
 
     except Exception as e:
         logger.error(f"Error loading schedules: {e}")
         return {"status": "failed", "reason": str(e)}
 
 
-async def load_teams() -> Dict[str, Any]:
-    """Load team metadata"""
+async def load_play_by_play(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Load play-by-play from parquet to PostgreSQL (nflverse pbp columns)
+
+    Upserts on (game_id, play_index) - see migrations/003_bulk_load_keys.sql
+    """
+    try:
+        logger.info(f"Loading play-by-play for season {season}...")
+
+        return await copy_parquet(
+            "play_by_play",
+            f"pbp_{season}*.parquet",
+            [
+                pl.col("game_id"),
+                pl.col("season").cast(pl.Int32),
+                pl.col("week").cast(pl.Int32),
+                pl.col("play_id").cast(pl.Int32).alias("play_index"),
+                pl.col("qtr").cast(pl.Int32).alias("quarter"),
+                pl.col("time").alias("clock"),
+                pl.col("posteam"),
+                pl.col("defteam"),
+                pl.col("play_type"),
+                pl.col("yards_gained").cast(pl.Int32, strict=False),
+                pl.col("epa"),
+                pl.col("success").cast(pl.Int32, strict=False),
+                pl.col("pass").cast(pl.Int32, strict=False),
+                pl.col("rush").cast(pl.Int32, strict=False),
+                pl.col("interception").cast(pl.Int32, strict=False),
+                pl.col("fumble_lost").cast(pl.Int32, strict=False),
+                pl.col("desc").alias("play_text"),
+            ],
+            conflict_columns=["game_id", "play_index"],
+            where=(pl.col("season") == season) & pl.col("play_id").is_not_null(),
+            delete_scope={"season": season},
+            force=force,
+        )
+
+    except Exception as e:
+        logger.error(f"Error loading play-by-play: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def load_depth_charts(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Load depth charts from parquet to PostgreSQL (nflverse depth chart columns)
+
+    Players must be loaded first (player_id references players).
+    Upserts on (season, week, team, position, player_id) - see
+    migrations/003_bulk_load_keys.sql
+    """
+    try:
+        logger.info(f"Loading depth charts for season {season}...")
+
+        return await copy_parquet(
+            "depth_charts",
+            f"depth_charts_{season}.parquet",
+            [
+                pl.col("gsis_id").alias("player_id"),
+                pl.col("club_code").alias("team"),
+                pl.col("season").cast(pl.Int32),
+                pl.col("week").cast(pl.Int32),
+                pl.col("depth_position").alias("position"),
+                pl.col("depth_team").cast(pl.Int32, strict=False).alias("depth_rank"),
+            ],
+            conflict_columns=["season", "week", "team", "position", "player_id"],
+            # Key columns must be non-null for deletes to match rows
+            where=pl.all_horizontal(
+                [
+                    pl.col(column).is_not_null()
+                    for column in ("gsis_id", "club_code", "week", "depth_position")
+                ]
+            ),
+            delete_scope={"season": season},
+            force=force,
+        )
+
+    except Exception as e:
+        logger.error(f"Error loading depth charts: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def load_players(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Load player profiles from the season roster (nflverse rosters columns)
+
+    Upserts on player_id (gsis_id). No deletes - stats, injuries and depth
+    charts reference players.
+    """
+    try:
+        logger.info(f"Loading players for season {season}...")
+
+        return await copy_parquet(
+            "players",
+            f"rosters_{season}.parquet",
+            [
+                pl.col("gsis_id").alias("player_id"),
+                pl.col("full_name").alias("player_name"),
+                pl.col("position"),
+                pl.col("team"),
+                pl.col("gsis_id"),
+                pl.col("espn_id").cast(pl.Utf8),
+            ],
+            conflict_columns=["player_id"],
+            where=pl.col("gsis_id").is_not_null(),
+            force=force,
+        )
+
+    except Exception as e:
+        logger.error(f"Error loading players: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def load_player_stats(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Load weekly player stats from parquet (nflverse player_stats columns)
+
+    Upserts on (player_id, season, week)
+    """
+    try:
+        logger.info(f"Loading player stats for season {season}...")
+
+        return await copy_parquet(
+            "player_stats",
+            f"player_stats_{season}.parquet",
+            [
+                pl.col("player_id"),
+                pl.col("recent_team").alias("team"),
+                pl.col("position"),
+                pl.col("season").cast(pl.Int32),
+                pl.col("week").cast(pl.Int32),
+                pl.col("passing_yards").cast(pl.Int32, strict=False),
+                pl.col("passing_tds").cast(pl.Int32, strict=False),
+                pl.col("rushing_yards").cast(pl.Int32, strict=False),
+                pl.col("rushing_tds").cast(pl.Int32, strict=False),
+                pl.col("receptions").cast(pl.Int32, strict=False),
+                pl.col("receiving_yards").cast(pl.Int32, strict=False),
+                pl.col("receiving_tds").cast(pl.Int32, strict=False),
+                pl.col("targets").cast(pl.Int32, strict=False),
+            ],
+            conflict_columns=["player_id", "season", "week"],
+            where=(pl.col("season") == season) & pl.col("player_id").is_not_null(),
+            delete_scope={"season": season},
+            force=force,
+        )
+
+    except Exception as e:
+        logger.error(f"Error loading player stats: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def load_injuries(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Load injury reports from parquet (nflverse injuries columns)
+
+    Upserts on (season, week, player_id) - see migrations/005_etl_datasets.sql
+    """
+    try:
+        logger.info(f"Loading injuries for season {season}...")
+
+        return await copy_parquet(
+            "injuries",
+            "injuries_current.parquet",
+            [
+                pl.col("gsis_id").alias("player_id"),
+                pl.col("team"),
+                pl.col("season").cast(pl.Int32),
+                pl.col("week").cast(pl.Int32),
+                pl.col("report_status"),
+                pl.col("report_primary_injury").alias("primary_injury"),
+            ],
+            conflict_columns=["season", "week", "player_id"],
+            where=(pl.col("season") == season)
+            & pl.col("gsis_id").is_not_null()
+            & pl.col("week").is_not_null(),
+            delete_scope={"season": season},
+            force=force,
+        )
+
+    except Exception as e:
+        logger.error(f"Error loading injuries: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def compute_power_ratings(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Compute Elo power ratings from schedule results (services/ratings.py)
+
+    Every season's results are read (ratings carry over between seasons),
+    but the engine only replays the weeks whose games changed since its last
+    update - all of them if force. The season's ratings are merged on
+    (team, season).
+    """
+    try:
+        logger.info(f"Computing power ratings for season {season}...")
+
+        rows = [
+            row
+            async for batch in data_reader.iter_rows(
+                "schedules", {}, export_columns("schedules", ELO_COLUMNS), settings.EXPORT_BATCH_SIZE
+            )
+            for row in batch
+        ]
+        replay = await asyncio.to_thread(elo_engine.update, rows, force)
+        ratings = await asyncio.to_thread(elo_engine.season_ratings, season)
+        if ratings.is_empty():
+            logger.info(f"No results to rate for season {season}")
+            return {"status": "skipped", "reason": f"No completed games up to season {season}"}
+
+        result = await copy_frame(
+            "power_ratings",
+            ratings,
+            conflict_columns=["team", "season"],
+            touch_column="updated_at",
+            delete_scope={"season": season},
+        )
+        return {**result, "weeks_replayed": replay["weeks_replayed"]}
+
+    except Exception as e:
+        logger.error(f"Error computing power ratings: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def compute_season_stats(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """
+    Aggregate team season stats from play-by-play and schedules (services/season_stats.py)
+
+    Only the play-by-play weeks logged in etl_changes since the last run are
+    aggregated into team_week_totals (the whole season if force or none are
+    stored yet). The season-to-date rows are then rebuilt from the week
+    totals and schedule results and merged on (team, season, week) - only
+    rows that changed are written.
+    """
+    try:
+        logger.info(f"Computing season stats for season {season}...")
+
+        pending = await database.fetch(
+            "SELECT week, changed_at FROM etl_changes WHERE dataset = 'play_by_play' AND season = %s",
+            [season],
+        )
+        stored = await database.fetchrow(
+            "SELECT count(*) AS rows FROM team_week_totals WHERE season = %s", [season]
+        )
+        full = force or not stored["rows"]
+        weeks = sorted(row["week"] for row in pending)
+
+        if full or weeks:
+            scopes = [{"season": season}] if full else [{"season": season, "week": week} for week in weeks]
+            columns = export_columns("play_by_play", PLAY_COLUMNS)
+            rows = [
+                row
+                for scope in scopes
+                async for batch in data_reader.iter_rows(
+                    "play_by_play", scope, columns, settings.EXPORT_BATCH_SIZE
+                )
+                for row in batch
+            ]
+            totals = await asyncio.to_thread(week_totals, frame(rows, PLAY_SCHEMA))
+            if totals.is_empty():
+                # Every play of the scope was deleted - copy_merge deletes nothing on an empty load
+                deleted = await database.fetch(
+                    "DELETE FROM team_week_totals WHERE season = %s"
+                    + ("" if full else " AND week = ANY(%s)") + " RETURNING week",
+                    [season] if full else [season, weeks],
+                )
+                logger.info(
+                    f"No plays left in {'season' if full else f'weeks {weeks}'}: "
+                    f"{len(deleted)} team weeks deleted"
+                )
+            else:
+                merged = await database.copy_merge(
+                    "team_week_totals",
+                    totals.columns,
+                    ["team", "season", "week"],
+                    _in_thread(_frame_chunks(totals)),
+                    touch_column="updated_at",
+                    delete_scope={"season": season} if full else {"season": season, "week": weeks},
+                )
+                logger.info(
+                    f"Aggregated {len(rows)} plays of {'every week' if full else f'weeks {weeks}'}: "
+                    f"{merged['inserted']} team weeks inserted, {merged['updated']} updated, "
+                    f"{merged['deleted']} deleted"
+                )
+        if pending:
+            # Changes logged while this ran stay pending for the next run
+            await database.fetch(
+                "DELETE FROM etl_changes WHERE dataset = 'play_by_play' AND season = %s"
+                " AND week = ANY(%s) AND changed_at <= %s::timestamp",
+                [season, weeks, max(row["changed_at"] for row in pending)],
+            )
+
+        totals = await database.fetch(
+            f"SELECT team, season, week, {', '.join(TOTAL_COLUMNS)} FROM team_week_totals"
+            " WHERE season = %s",
+            [season],
+        )
+        games = await data_reader.read_schedules(season, columns=GAME_COLUMNS)
+        stats = await asyncio.to_thread(
+            season_stats, frame(totals, TOTAL_SCHEMA), frame(games, GAME_SCHEMA)
+        )
+        if stats.is_empty():
+            logger.info(f"No completed games in season {season}")
+            return {"status": "skipped", "reason": f"No completed games in season {season}"}
+
+        result = await copy_frame(
+            "season_stats",
+            stats,
+            conflict_columns=["team", "season", "week"],
+            touch_column="updated_at",
+            delete_scope={"season": season},
+        )
+        return {**result, "weeks_aggregated": "all" if full else weeks}
+
+    except Exception as e:
+        logger.error(f"Error computing season stats: {e}")
+        return {"status": "failed", "reason": str(e)}
+
+
+async def load_teams(season: int = 2025, force: bool = False) -> Dict[str, Any]:
+    """Load team metadata (a static list - season and force are not used)"""
     try:
         logger.info("Loading teams...")
 
@@ -139,26 +771,147 @@ async def load_teams() -> Dict[str, Any]:
             {"team": "WAS", "team_name": "Washington Commanders", "location": "Washington DC"},
         ]
 
-        # Upsert
-        result = (
-            data_reader.supabase.table("teams")
-            .upsert(teams, on_conflict="team")
-            .execute()
-        )
-
-        logger.info(f"Successfully loaded {len(teams)} teams")
-        return {"status": "success", "records_inserted": len(teams)}
+        # Same merge as the file loads - unchanged teams are not rewritten or invalidated
+        return await copy_frame("teams", pl.DataFrame(teams), conflict_columns=["team"])
 
     except Exception as e:
         logger.error(f"Error loading teams: {e}")
         return {"status": "failed", "reason": str(e)}
 
 
-async def load_all(season: int = 2025) -> Dict[str, Any]:
+# dataset -> (loader, datasets it depends on). Every loader takes (season, force).
+ETL_STAGES: Dict[str, Tuple[Callable[[int, bool], Awaitable[Dict[str, Any]]], Tuple[str, ...]]] = {
+    "teams": (load_teams, ()),
+    "players": (load_players, ("teams",)),
+    "schedules": (load_schedules, ("teams",)),
+    "power_ratings": (compute_power_ratings, ("schedules",)),
+    "player_stats": (load_player_stats, ("players",)),
+    "injuries": (load_injuries, ("players",)),
+    "depth_charts": (load_depth_charts, ("players",)),
+    "play_by_play": (load_play_by_play, ("schedules",)),
+    "season_stats": (compute_season_stats, ("schedules", "play_by_play")),
+}
+
+
+def stage_order(datasets: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Datasets in dependency order (ValueError on unknown names or cycles)
+
+    Dependencies of the requested datasets are not added - a partial run
+    assumes they are already loaded.
+    """
+    selected = list(ETL_STAGES) if datasets is None else list(dict.fromkeys(datasets))
+    unknown = [name for name in selected if name not in ETL_STAGES]
+    if unknown:
+        raise ValueError(f"Unknown datasets: {', '.join(unknown)}")
+
+    order: List[str] = []
+    visiting: set = set()
+
+    def visit(name: str) -> None:
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle at {name}")
+        visiting.add(name)
+        for dependency in ETL_STAGES[name][1]:
+            if dependency in selected:
+                visit(dependency)
+        visiting.discard(name)
+        order.append(name)
+
+    for name in selected:
+        visit(name)
+    return order
+
+
+async def run_stages(
+    season: int = 2025,
+    force: bool = False,
+    datasets: Optional[Sequence[str]] = None,
+    concurrency: Optional[int] = None,
+    on_stage: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run dataset loaders as a dependency graph
+
+    Every stage starts as soon as the stages it depends on have finished,
+    with at most `concurrency` (ETL_CONCURRENCY) loaders running at once. A
+    failed stage only skips the stages that depend on it, directly or not.
+    Each stage reports its result (row counts) plus timings:
+    - waited_seconds: from the start of the run until it began loading
+    - seconds: its own run time
+    on_stage(name, result) is awaited as each stage finishes (progress reporting).
+    """
+    order = stage_order(datasets)
+    semaphore = asyncio.Semaphore(concurrency or settings.ETL_CONCURRENCY)
+    run_started = time.perf_counter()
+    stages: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+    async def run_stage(name: str) -> Dict[str, Any]:
+        result = await load_stage(name)
+        if on_stage is not None:
+            try:
+                await on_stage(name, result)
+            except Exception as e:
+                logger.error(f"Stage progress callback failed for {name}: {e}")
+        return result
+
+    async def load_stage(name: str) -> Dict[str, Any]:
+        loader, dependencies = ETL_STAGES[name]
+        # A stage skipped for a failed dependency counts as failed, so failures propagate
+        blocked = []
+        for dependency in dependencies:
+            if dependency in stages and (await stages[dependency])["status"] == "failed":
+                blocked.append(dependency)
+        if blocked:
+            logger.warning(f"Skipping {name}: {', '.join(blocked)} failed")
+            return {"status": "failed", "reason": "dependency failed", "blocked_by": blocked}
+
+        async with semaphore:
+            started = time.perf_counter()
+            logger.info(f"▶ {name}")
+            try:
+                result = await loader(season, force)
+            except Exception as e:
+                logger.error(f"Stage {name} failed: {e}")
+                result = {"status": "failed", "reason": str(e)}
+            elapsed = time.perf_counter() - started
+            logger.info(f"■ {name}: {result.get('status')} in {elapsed:.2f}s")
+            return {
+                **result,
+                "waited_seconds": round(started - run_started, 3),
+                "seconds": round(elapsed, 3),
+            }
+
+    # Stages are created in dependency order, so a stage's dependencies exist before it
+    for name in order:
+        stages[name] = asyncio.create_task(run_stage(name))
+    await asyncio.gather(*stages.values())
+
+    results = {name: stages[name].result() for name in order}
+    failed = [name for name, result in results.items() if result["status"] == "failed"]
+    return {
+        "status": "failed" if len(failed) == len(results) else "partial" if failed else "success",
+        "failed": failed,
+        "seconds": round(time.perf_counter() - run_started, 3),
+        "results": results,
+    }
+
+
+async def load_all(
+    season: int = 2025,
+    force: bool = False,
+    datasets: Optional[Sequence[str]] = None,
+    on_stage: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
     """
     Load all data (orchestrator)
 
-    This is what runs when you manually trigger a refresh
+    This is what runs when you manually trigger a refresh. Datasets load
+    concurrently in dependency order (see ETL_STAGES and run_stages), so a
+    full refresh takes about as long as its longest dependency chain. Files
+    unchanged since their last load are skipped unless force.
     """
     try:
         # Validate season - only 2025 supported
@@ -170,30 +923,13 @@ async def load_all(season: int = 2025) -> Dict[str, Any]:
         logger.info("🔄 Starting ETL process...")
         logger.info("=" * 80)
 
-        results = {}
-
-        # Load teams first (referenced by schedules)
-        logger.info("\n[1/2] Loading teams...")
-        results["teams"] = await load_teams()
-
-        # Load schedules
-        logger.info("\n[2/2] Loading schedules...")
-        results["schedules"] = await load_schedules(season)
-
-        # TODO: Add more data types as needed:
-        # - players
-        # - player_stats
-        # - injuries
-        # - depth_charts
-        # - pbp
-        # - season_stats
-        # - power_ratings
+        result = await run_stages(season, force, datasets, on_stage=on_stage)
 
         logger.info("\n" + "=" * 80)
-        logger.info("✅ ETL process complete!")
+        logger.info(f"✅ ETL process complete in {result['seconds']}s ({result['status']})")
         logger.info("=" * 80)
 
-        return {"status": "success", "results": results}
+        return result
 
     except Exception as e:
         logger.error(f"Error in ETL process: {e}")
@@ -206,5 +942,11 @@ if __name__ == "__main__":
 
     season = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
 
-    result = asyncio.run(load_all(season))
+    async def main() -> Dict[str, Any]:
+        try:
+            return await load_all(season)
+        finally:
+            await database.close()
+
+    result = asyncio.run(main())
     print(f"\nResult: {result}")
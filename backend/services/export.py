@@ -0,0 +1,170 @@
+"""
+Columnar and streaming serialization
+- Streaming table exports: batches of rows from DataReader.iter_rows() as
+  NDJSON or an Arrow IPC stream, one batch at a time - memory stays bounded
+  by EXPORT_BATCH_SIZE whatever the size of the export
+- Arrow IPC / Parquet bodies for endpoint results (see cached(table=...))
+"""
+
+import io
+import logging
+from typing import Optional, Any, Dict, List, AsyncIterator
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# Arrow types of numeric columns (migrations/001_create_schema.sql) - every
+# other column is a string, dates and times as ISO 8601 like the JSON endpoints
+INTEGER_COLUMNS = {
+    "team_id", "stat_id", "rating_id", "injury_id", "depth_id", "pbp_id", "nfl_id",
+    "season", "week", "home_moneyline", "away_moneyline", "home_score", "away_score",
+    "wins", "losses", "elo_rank", "depth_rank", "play_index", "quarter", "yards_gained",
+    "success", "pass", "rush", "passing_yards", "passing_tds", "rushing_yards",
+    "rushing_tds", "receptions", "receiving_yards", "receiving_tds", "targets",
+    "interception", "fumble_lost", "turnovers", "takeaways",
+}
+FLOAT_COLUMNS = {
+    "temp", "wind", "spread_line", "total_line", "pass_yards_per_game",
+    "rush_yards_per_game", "total_yards_per_game", "epa_per_play_off", "epa_per_play_def",
+    "success_rate_off", "success_rate_def", "ats_win_pct", "over_pct", "elo_rating",
+    "offensive_rating", "defensive_rating", "epa",
+}
+
+
+def arrow_schema(columns: List[str]) -> pa.Schema:
+    """Fixed Arrow schema for a column list, so every batch of a stream agrees"""
+    return pa.schema(
+        [
+            (
+                column,
+                pa.int64() if column in INTEGER_COLUMNS
+                else pa.float64() if column in FLOAT_COLUMNS
+                else pa.string(),
+            )
+            for column in columns
+        ]
+    )
+
+
+# Columnar response formats -> media type
+TABULAR_FORMATS = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Schema metadata key holding the non-row fields of a result (e.g. pbp's total, next_cursor)
+METADATA_KEY = b"nfl_api"
+
+
+def arrow_table(rows: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> pa.Table:
+    """Build a typed Arrow table from result rows (columns taken from the first row)"""
+    schema = arrow_schema(list(rows[0]) if rows else [])
+    if metadata:
+        schema = schema.with_metadata({METADATA_KEY: orjson.dumps(metadata)})
+    return pa.Table.from_pylist(rows, schema=schema)
+
+
+def serialize_table(table: pa.Table, format: str) -> bytes:
+    """An Arrow table as an Arrow IPC stream or a Parquet file"""
+    sink = io.BytesIO()
+    if format == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue()
+
+
+class _ChunkSink:
+    """Write-only file object that hands what was written back as chunks"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+async def ndjson_stream(
+    batches: AsyncIterator[List[Dict[str, Any]]],
+) -> AsyncIterator[bytes]:
+    """One JSON object per line, one chunk per batch"""
+    async for rows in batches:
+        yield b"".join(orjson.dumps(row) + b"\n" for row in rows)
+
+
+async def arrow_stream(
+    batches: AsyncIterator[List[Dict[str, Any]]], columns: List[str]
+) -> AsyncIterator[bytes]:
+    """Arrow IPC stream format - the schema, then one record batch per batch"""
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    # The schema message goes out with the first batch
+    writer = pa.ipc.new_stream(sink, schema)
+    async for rows in batches:
+        writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+class ExportLimiter:
+    """Caps concurrent exports - each one holds a database connection while it streams"""
+
+    def __init__(self):
+        self.active = 0
+        self.started = 0
+        self.rejected = 0
+        self.failed = 0
+        self.rows = 0
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting (False if every slot is busy)"""
+        if self.active >= settings.EXPORT_MAX_CONCURRENT:
+            self.rejected += 1
+            return False
+        self.active += 1
+        self.started += 1
+        return True
+
+    def release(self) -> None:
+        """Give a slot back"""
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Export counters"""
+        return {
+            "active": self.active,
+            "max_concurrent": settings.EXPORT_MAX_CONCURRENT,
+            "started": self.started,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "rows": self.rows,
+        }
+
+
+# Global export limiter instance
+export_limiter = ExportLimiter()
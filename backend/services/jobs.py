@@ -0,0 +1,448 @@
+"""
+Background job engine behind /v1/admin/jobs
+Runs ETL actions off the request path and tracks them in Redis
+
+- I/O-bound loads run as asyncio tasks in the API process
+- CPU-heavy recomputes (and full refreshes) run in a separate process pool,
+  so they never hold the API's event loop
+- At most JOB_MAX_WORKERS jobs run at once per worker, and each action has
+  its own limit (JOB_ACTION_LIMITS) - further jobs wait as "queued"
+- An identical job (same action and parameters) that is still queued or
+  running is returned instead of starting another one, across workers
+- The worker that owns a job renews its lease every few seconds. A queued or
+  running job whose lease expired (its worker or process died) is marked
+  failed, and the next identical submit runs again instead of waiting on it
+- A job's record and lease are saved before it claims its action, and a dead
+  job's claim is taken over with a compare-and-set, so concurrent identical
+  submits never run the action twice
+- Job state, per-stage progress, timings and results are stored in Redis for
+  JOB_TTL seconds (in memory if Redis is unavailable)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional, Any, Dict, List, Tuple, Sequence, Callable, Awaitable
+
+import orjson
+
+from core.config import settings
+from services.cache import cache_manager
+from services.db import database
+from services.etl import load_all, stage_order
+
+logger = logging.getLogger(__name__)
+
+JOB_PREFIX = "job:"
+INFLIGHT_PREFIX = "job:inflight:"
+LEASE_PREFIX = "job:lease:"
+
+# Sets KEYS[1] to ARGV[2] only if ARGV[1] still holds it (or nobody does),
+# otherwise returns the current holder
+REPLACE_CLAIM_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and current ~= ARGV[1] then
+    return current
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return false
+"""
+
+# action -> (ETL datasets it runs (None = all), runs in the process pool)
+JOB_ACTIONS: Dict[str, Tuple[Optional[Tuple[str, ...]], bool]] = {
+    "refresh_season_stats": (("season_stats",), True),
+    "refresh_power_ratings": (("power_ratings",), True),
+    "load_schedules": (("schedules",), False),
+    "load_player_stats": (("player_stats",), False),
+    "load_pbp": (("play_by_play",), False),
+    "load_injuries": (("injuries",), False),
+    "load_depth_charts": (("depth_charts",), False),
+    "refresh_all": (None, True),
+}
+
+# Concurrent jobs per action (per worker) - default 1
+JOB_ACTION_LIMITS: Dict[str, int] = {}
+
+
+def job_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Canonical job parameters (identical requests produce identical params)"""
+    params = params or {}
+    unknown = set(params) - {"season", "force"}
+    if unknown:
+        raise ValueError(f"Unknown job params: {', '.join(sorted(unknown))}")
+    try:
+        season = int(params.get("season", settings.CURRENT_SEASON))
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid season: {params.get('season')}")
+    return {"season": season, "force": bool(params.get("force", False))}
+
+
+def progress_of(job: Dict[str, Any]) -> int:
+    """Percent of the job's stages that have finished"""
+    stages = job["stages"]
+    if job["status"] == "completed":
+        return 100
+    if not stages:
+        return 0
+    return int(100 * sum(1 for state in stages.values() if state != "pending") / len(stages))
+
+
+def failure_reason(result: Optional[Dict[str, Any]]) -> str:
+    """Why an ETL run did not succeed"""
+    if not result:
+        return "No result"
+    if result.get("reason"):
+        return result["reason"]
+    return f"Stages failed: {', '.join(result.get('failed', []))}"
+
+
+class JobStore:
+    """Job records and in-flight claims in Redis (or in memory without Redis)"""
+
+    def __init__(self):
+        self._memory: Dict[str, bytes] = {}
+        self._leases: Dict[str, float] = {}  # job_id -> expiry (without Redis)
+
+    async def save(self, job: Dict[str, Any]) -> None:
+        """Write a job record"""
+        job["progress"] = progress_of(job)
+        data = orjson.dumps(job)
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                await client.set(f"{JOB_PREFIX}{job['job_id']}", data, ex=settings.JOB_TTL)
+                return
+            except Exception as e:
+                logger.error(f"Job store write error for {job['job_id']}: {e}")
+        self._memory[job["job_id"]] = data
+
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Read a job record (None if unknown or expired)"""
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                data = await client.get(f"{JOB_PREFIX}{job_id}")
+                if data is not None:
+                    return orjson.loads(data)
+            except Exception as e:
+                logger.error(f"Job store read error for {job_id}: {e}")
+        data = self._memory.get(job_id)
+        return orjson.loads(data) if data is not None else None
+
+    async def claim(self, key: str, job_id: str) -> Optional[str]:
+        """Register job_id as the in-flight job for key - returns the current holder if any"""
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                if await client.set(f"{INFLIGHT_PREFIX}{key}", job_id, nx=True, ex=settings.JOB_TTL):
+                    return None
+                holder = await client.get(f"{INFLIGHT_PREFIX}{key}")
+                return holder.decode() if holder else None
+            except Exception as e:
+                logger.error(f"Job claim error for {key}: {e}")
+        holder = self._memory.get(f"{INFLIGHT_PREFIX}{key}")
+        if holder is not None:
+            return holder.decode()
+        self._memory[f"{INFLIGHT_PREFIX}{key}"] = job_id.encode()
+        return None
+
+    async def replace_claim(self, key: str, holder: str, job_id: str) -> Optional[str]:
+        """
+        Take over the claim for key from holder (no longer in flight)
+
+        Compare-and-set: returns None once job_id holds the claim, or the
+        current holder if another submit took it over first.
+        """
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                current = await client.eval(
+                    REPLACE_CLAIM_SCRIPT, 1, f"{INFLIGHT_PREFIX}{key}", holder, job_id, settings.JOB_TTL
+                )
+                return current.decode() if current else None
+            except Exception as e:
+                logger.error(f"Job claim error for {key}: {e}")
+        current = self._memory.get(f"{INFLIGHT_PREFIX}{key}")
+        if current is not None and current.decode() != holder:
+            return current.decode()
+        self._memory[f"{INFLIGHT_PREFIX}{key}"] = job_id.encode()
+        return None
+
+    async def release(self, key: str, job_id: str) -> None:
+        """Drop the claim for key if job_id still holds it"""
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                holder = await client.get(f"{INFLIGHT_PREFIX}{key}")
+                if holder is not None and holder.decode() == job_id:
+                    await client.delete(f"{INFLIGHT_PREFIX}{key}")
+                return
+            except Exception as e:
+                logger.error(f"Job release error for {key}: {e}")
+        if self._memory.get(f"{INFLIGHT_PREFIX}{key}") == job_id.encode():
+            del self._memory[f"{INFLIGHT_PREFIX}{key}"]
+
+    async def discard(self, job_id: str) -> None:
+        """Delete a job record and its lease (a submit that lost its claim)"""
+        await self.drop_lease(job_id)
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                await client.delete(f"{JOB_PREFIX}{job_id}")
+            except Exception as e:
+                logger.error(f"Job store delete error for {job_id}: {e}")
+        self._memory.pop(job_id, None)
+
+    async def renew_lease(self, job_id: str) -> None:
+        """Extend job_id's lease by JOB_LEASE_TTL"""
+        self._leases[job_id] = time.monotonic() + settings.JOB_LEASE_TTL
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                await client.set(f"{LEASE_PREFIX}{job_id}", 1, ex=settings.JOB_LEASE_TTL)
+            except Exception as e:
+                logger.error(f"Job lease error for {job_id}: {e}")
+
+    async def drop_lease(self, job_id: str) -> None:
+        """Forget job_id's lease (the job finished)"""
+        self._leases.pop(job_id, None)
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                await client.delete(f"{LEASE_PREFIX}{job_id}")
+            except Exception as e:
+                logger.error(f"Job lease error for {job_id}: {e}")
+
+    async def leased(self, job_id: str) -> bool:
+        """True while job_id's owner keeps renewing its lease"""
+        client = cache_manager.redis_client
+        if client is not None:
+            try:
+                return bool(await client.exists(f"{LEASE_PREFIX}{job_id}"))
+            except Exception as e:
+                logger.error(f"Job lease read error for {job_id}: {e}")
+        return self._leases.get(job_id, 0.0) > time.monotonic()
+
+
+def stage_recorder(
+    store: JobStore, job_id: str
+) -> Callable[[str, Dict[str, Any]], Awaitable[None]]:
+    """on_stage callback that records each finished ETL stage in the job"""
+
+    async def record(name: str, result: Dict[str, Any]) -> None:
+        job = await store.load(job_id)
+        if job is None:
+            return
+        job["stages"][name] = result.get("status", "unknown")
+        await store.save(job)
+
+    return record
+
+
+def run_job_process(
+    job_id: str, datasets: Optional[Sequence[str]], season: int, force: bool
+) -> Dict[str, Any]:
+    """Process pool entry point - runs the ETL on its own event loop and connections"""
+    logging.basicConfig(level=settings.LOG_LEVEL)
+
+    async def run() -> Dict[str, Any]:
+        # This process has its own Redis client (progress, cache invalidation) and DB pool
+        await cache_manager.connect()
+        try:
+            return await load_all(season, force, datasets, on_stage=stage_recorder(JobStore(), job_id))
+        finally:
+            await database.close()
+            await cache_manager.close()
+
+    return asyncio.run(run())
+
+
+class JobManager:
+    """Queues, runs and tracks admin jobs"""
+
+    def __init__(self):
+        self.store = JobStore()
+        self._tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self._workers: Optional[asyncio.Semaphore] = None
+        self._action_slots: Dict[str, asyncio.Semaphore] = {}
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self.submitted = 0
+        self.deduplicated = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def workers(self) -> asyncio.Semaphore:
+        # Created lazily, inside the running event loop
+        if self._workers is None:
+            self._workers = asyncio.Semaphore(settings.JOB_MAX_WORKERS)
+        return self._workers
+
+    def _action_slot(self, action: str) -> asyncio.Semaphore:
+        if action not in self._action_slots:
+            self._action_slots[action] = asyncio.Semaphore(JOB_ACTION_LIMITS.get(action, 1))
+        return self._action_slots[action]
+
+    @property
+    def processes(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            # spawn: children must not inherit the API's event loop, sockets or pools
+            self._processes = ProcessPoolExecutor(
+                max_workers=settings.JOB_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._processes
+
+    async def submit(
+        self, action: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Queue a job - returns (job, deduplicated)
+
+        If an identical job is queued or running, that job is returned with
+        deduplicated=True. Raises ValueError for unknown actions or params.
+        """
+        if action not in JOB_ACTIONS:
+            raise ValueError(f"Invalid action. Valid actions: {', '.join(JOB_ACTIONS)}")
+        params = job_params(params)
+        datasets, in_process = JOB_ACTIONS[action]
+
+        job_id = str(uuid.uuid4())
+        inflight_key = f"{action}:{params['season']}:{int(params['force'])}"
+        job = {
+            "job_id": job_id,
+            "action": action,
+            "params": params,
+            "status": "queued",
+            "executor": "process" if in_process else "async",
+            "created_at": datetime.utcnow().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "seconds": None,
+            "stages": {name: "pending" for name in stage_order(datasets)},
+            "result": None,
+            "error": None,
+        }
+        # Record and lease first: whoever sees this job holding the claim
+        # can load it and tell it is alive
+        await self.store.renew_lease(job_id)
+        await self.store.save(job)
+        holder = await self.store.claim(inflight_key, job_id)
+        while holder is not None:
+            existing = await self.store.load(holder)
+            if existing is not None and existing["status"] in ("queued", "running"):
+                if await self.store.leased(holder):
+                    await self.store.discard(job_id)
+                    self.deduplicated += 1
+                    return existing, True
+                # Its worker stopped renewing the lease (died mid-job)
+                existing.update(
+                    status="failed",
+                    finished_at=datetime.utcnow().isoformat(),
+                    error="Lease expired - the worker running the job stopped",
+                )
+                await self.store.save(existing)
+                logger.warning(f"Job {holder} ({action}) lease expired - marked failed")
+            # The holder finished without releasing (e.g. its worker died) -
+            # take over, unless another submit already did
+            holder = await self.store.replace_claim(inflight_key, holder, job_id)
+
+        self.submitted += 1
+        self._tasks[job_id] = asyncio.create_task(self._run(job, inflight_key))
+        logger.info(f"Job queued: {action} (job_id={job_id}, params={params})")
+        return job, False
+
+    async def _run(self, job: Dict[str, Any], inflight_key: str) -> None:
+        """Wait for a slot, run the job and record the outcome"""
+        job_id = job["job_id"]
+        datasets, in_process = JOB_ACTIONS[job["action"]]
+        season, force = job["params"]["season"], job["params"]["force"]
+        started = 0.0
+        result: Optional[Dict[str, Any]] = None
+        error: Optional[str] = None
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            async with self._action_slot(job["action"]), self.workers:
+                job.update(status="running", started_at=datetime.utcnow().isoformat())
+                await self.store.save(job)
+                started = time.perf_counter()
+
+                if in_process:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        self.processes, run_job_process, job_id, datasets, season, force
+                    )
+                else:
+                    result = await load_all(
+                        season, force, datasets, on_stage=stage_recorder(self.store, job_id)
+                    )
+        except asyncio.CancelledError:
+            error = "Interrupted by shutdown"
+            raise
+        except Exception as e:
+            logger.error(f"Job {job_id} ({job['action']}) failed: {e}")
+            error = str(e)
+        finally:
+            heartbeat.cancel()
+            # Re-read - stage progress was written while the job ran
+            job = await self.store.load(job_id) or job
+            succeeded = error is None and result is not None and result.get("status") == "success"
+            job.update(
+                status="completed" if succeeded else "failed",
+                finished_at=datetime.utcnow().isoformat(),
+                seconds=round(time.perf_counter() - started, 3) if started else None,
+                result=result,
+                error=error if error or succeeded else failure_reason(result),
+            )
+            if result and "results" in result:
+                job["stages"].update(
+                    {name: stage.get("status", "unknown") for name, stage in result["results"].items()}
+                )
+            await self.store.save(job)
+            await self.store.release(inflight_key, job_id)
+            await self.store.drop_lease(job_id)
+            self._tasks.pop(job_id, None)
+            if succeeded:
+                self.completed += 1
+            else:
+                self.failed += 1
+            logger.info(f"Job {job_id} ({job['action']}) {job['status']} in {job['seconds']}s")
+
+    async def _heartbeat(self, job_id: str) -> None:
+        """Renew a job's lease while it is queued or running in this worker"""
+        while True:
+            await asyncio.sleep(settings.JOB_LEASE_TTL / 3)
+            await self.store.renew_lease(job_id)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A job's current record (None if unknown or expired)"""
+        return await self.store.load(job_id)
+
+    async def close(self) -> None:
+        """Cancel running jobs and stop the process pool"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counters"""
+        return {
+            "active": len(self._tasks),
+            "max_workers": settings.JOB_MAX_WORKERS,
+            "process_workers": settings.JOB_PROCESS_WORKERS,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+# Global job manager instance
+job_manager = JobManager()
@@ -0,0 +1,201 @@
+"""
+Live scoreboard fan-out
+One poller per date reads the scoreboard, diffs it per game and pushes the
+changes to every subscriber, so viewers no longer poll the API
+
+- A new subscriber first receives a full snapshot, then diffs
+- The poller's read goes through the cache with a TTL of one interval, so
+  all workers together cost about one query per interval per date
+- Each subscriber has a bounded queue. A subscriber that falls behind has
+  its backlog replaced by a single fresh snapshot instead of growing memory
+- A poller stops once its last subscriber leaves
+"""
+
+import asyncio
+import logging
+from typing import Optional, Any, Dict, List, Set
+
+from core.config import settings
+from services.cache import cache_manager, cache_key_scoreboard_live, cache_tags
+from services.readers import data_reader
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """One connected client - a bounded queue of (event, payload)"""
+
+    def __init__(self, maxsize: int):
+        self.queue: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=maxsize)
+        self.resyncs = 0
+
+    def push(self, event: str, payload: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
+        """Queue an event, or replace the backlog with a snapshot if the client is behind"""
+        try:
+            self.queue.put_nowait((event, payload))
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(("snapshot", snapshot))
+            self.resyncs += 1
+
+    async def next(self, timeout: float) -> Optional[tuple]:
+        """Next event, or None after timeout (time for a heartbeat)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+def diff_games(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Per-game changes between two scoreboards (only changed fields are sent)"""
+    changed = []
+    for game_id, game in current.items():
+        before = previous.get(game_id)
+        if before is None:
+            continue
+        fields = {key: value for key, value in game.items() if before.get(key) != value}
+        if fields:
+            changed.append({"game_id": game_id, "fields": fields})
+    return {
+        "changed": changed,
+        "added": [game for game_id, game in current.items() if game_id not in previous],
+        "removed": [game_id for game_id in previous if game_id not in current],
+    }
+
+
+class ScoreboardFeed:
+    """Polls one date's scoreboard and broadcasts diffs to its subscribers"""
+
+    def __init__(self, date: str):
+        self.date = date
+        self.games: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+        self.polls = 0
+        self.subscribers: Set[Subscriber] = set()
+        self.waiting = 0  # subscribe() calls waiting for the first read
+        self.loaded = asyncio.Event()
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full current state"""
+        return {"date": self.date, "version": self.version, "games": list(self.games.values())}
+
+    def start(self) -> None:
+        """Start polling (idempotent)"""
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop polling"""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def _read(self) -> List[Dict[str, Any]]:
+        """Read the scoreboard, shared across workers for one interval"""
+        return await cache_manager.get_or_set(
+            cache_key_scoreboard_live(self.date),
+            lambda: data_reader.read_scoreboard(self.date),
+            ttl_seconds=settings.LIVE_POLL_INTERVAL,
+            tags=cache_tags("schedules", gameday=self.date),
+        ) or []
+
+    async def _run(self) -> None:
+        """Poll until stopped"""
+        while True:
+            try:
+                self.poll(await self._read())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scoreboard feed error for {self.date}: {e}")
+            self.loaded.set()
+            await asyncio.sleep(settings.LIVE_POLL_INTERVAL)
+
+    def poll(self, rows: List[Dict[str, Any]]) -> None:
+        """Apply a fresh read and broadcast what changed"""
+        self.polls += 1
+        current = {row["game_id"]: row for row in rows}
+        if not self.loaded.is_set():
+            self.games = current
+            return
+        diff = diff_games(self.games, current)
+        if not any(diff.values()):
+            return
+        self.games = current
+        self.version += 1
+        payload = {"date": self.date, "version": self.version, **diff}
+        snapshot = self.snapshot()
+        for subscriber in self.subscribers:
+            subscriber.push("diff", payload, snapshot)
+
+    def stats(self) -> Dict[str, Any]:
+        """Subscriber and poll counters"""
+        return {
+            "subscribers": len(self.subscribers),
+            "games": len(self.games),
+            "version": self.version,
+            "polls": self.polls,
+            "resyncs": sum(subscriber.resyncs for subscriber in self.subscribers),
+        }
+
+
+class LiveScoreboard:
+    """Registry of per-date feeds"""
+
+    def __init__(self):
+        self.feeds: Dict[str, ScoreboardFeed] = {}
+
+    async def subscribe(self, date: str) -> Subscriber:
+        """Join (or start) a date's feed - the first event is a snapshot"""
+        feed = self.feeds.get(date)
+        if feed is None:
+            feed = self.feeds[date] = ScoreboardFeed(date)
+            feed.start()
+        feed.waiting += 1
+        try:
+            await feed.loaded.wait()
+        finally:
+            feed.waiting -= 1
+            if not feed.subscribers and not feed.waiting and not feed.loaded.is_set():
+                # Cancelled before the first read with no one else waiting
+                self._stop(date, feed)
+        if self.feeds.get(date) is not feed:
+            # Everyone else left (and the feed stopped) while we waited
+            return await self.subscribe(date)
+        subscriber = Subscriber(settings.LIVE_SUBSCRIBER_QUEUE_SIZE)
+        subscriber.queue.put_nowait(("snapshot", feed.snapshot()))
+        feed.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, date: str, subscriber: Subscriber) -> None:
+        """Leave a feed - the poller stops with its last subscriber"""
+        feed = self.feeds.get(date)
+        if feed is None:
+            return
+        feed.subscribers.discard(subscriber)
+        if not feed.subscribers and not feed.waiting:
+            self._stop(date, feed)
+
+    def _stop(self, date: str, feed: ScoreboardFeed) -> None:
+        """Stop a feed and forget it"""
+        feed.stop()
+        if self.feeds.get(date) is feed:
+            del self.feeds[date]
+
+    async def close(self) -> None:
+        """Stop every poller"""
+        for feed in self.feeds.values():
+            feed.stop()
+        self.feeds.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-date feed stats"""
+        return {date: feed.stats() for date, feed in self.feeds.items()}
+
+
+# Global live scoreboard instance
+live_scoreboard = LiveScoreboard()
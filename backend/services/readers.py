@@ -1,17 +1,150 @@
 """
 Data readers for Supabase PostgreSQL
 Handles all database queries using Polars for transformation
+
+Two backends, selected by settings.DATA_BACKEND:
+- "supabase": supabase-py / PostgREST client (default)
+- "postgres": direct async connection pool on DATABASE_URL (services/db.py)
+
+Read errors are logged and re-raised - an empty list or dict always means
+no rows, so a failed read is never cached as valid empty data.
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 import polars as pl
 from supabase import create_client, Client
 
 from core.config import settings
+from services.db import database
 
 logger = logging.getLogger(__name__)
 
+# Columns of each table (migrations/001_create_schema.sql) - fields= is validated against these.
+# player_stats also lists team/position, which the reader filters on.
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "teams": (
+        "team_id", "team", "team_name", "location", "primary_color", "secondary_color",
+        "created_at",
+    ),
+    "schedules": (
+        "game_id", "season", "week", "gameday", "gametime", "home_team", "away_team",
+        "stadium", "roof", "temp", "wind", "spread_line", "total_line", "home_moneyline",
+        "away_moneyline", "home_score", "away_score", "result", "created_at", "updated_at",
+    ),
+    "season_stats": (
+        "stat_id", "team", "season", "week", "wins", "losses", "pass_yards_per_game",
+        "rush_yards_per_game", "total_yards_per_game", "epa_per_play_off", "epa_per_play_def",
+        "success_rate_off", "success_rate_def", "turnovers", "takeaways", "ats_record",
+        "ats_win_pct", "over_pct", "created_at", "updated_at",
+    ),
+    "power_ratings": (
+        "rating_id", "team", "season", "elo_rating", "elo_rank", "offensive_rating",
+        "defensive_rating", "created_at", "updated_at",
+    ),
+    "players": (
+        "player_id", "player_name", "position", "team", "nfl_id", "gsis_id", "espn_id",
+        "created_at",
+    ),
+    "player_stats": (
+        "stat_id", "player_id", "team", "position", "season", "week", "passing_yards",
+        "passing_tds", "rushing_yards", "rushing_tds", "receptions", "receiving_yards",
+        "receiving_tds", "targets", "created_at",
+    ),
+    "injuries": (
+        "injury_id", "player_id", "team", "season", "week", "report_status", "primary_injury",
+        "created_at",
+    ),
+    "depth_charts": (
+        "depth_id", "player_id", "team", "season", "week", "position", "depth_rank",
+        "created_at",
+    ),
+    "play_by_play": (
+        "pbp_id", "game_id", "season", "week", "play_index", "quarter", "clock",
+        "posteam", "defteam", "play_type", "yards_gained", "epa", "success",
+        "pass", "rush", "interception", "fumble_lost", "play_text", "created_at",
+    ),
+}
+
+# Columns always returned with a projection (keys clients and cursors rely on)
+KEY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "teams": ("team",),
+    "schedules": ("game_id",),
+    "power_ratings": ("team",),
+    "player_stats": ("player_id",),
+    "injuries": ("player_id",),
+    "depth_charts": ("player_id",),
+    "play_by_play": ("play_index",),
+}
+
+
+def select_columns(table: str, columns: Optional[List[str]] = None) -> List[str]:
+    """
+    Validate a column projection against the table schema
+
+    Returns ["*"] without a projection. Raises ValueError on unknown columns.
+    The result only contains known column names, so it is safe to put in SQL.
+    """
+    if not columns:
+        return ["*"]
+    unknown = [column for column in columns if column not in TABLE_COLUMNS[table]]
+    if unknown:
+        raise ValueError(f"Unknown {table} fields: {', '.join(unknown)}")
+    return list(dict.fromkeys([*KEY_COLUMNS.get(table, ()), *columns]))
+
+
+def project(rows: List[Dict[str, Any]], columns: List[str]) -> List[Dict[str, Any]]:
+    """Apply a select_columns() projection to rows already in memory"""
+    if columns == ["*"]:
+        return rows
+    return [{column: row.get(column) for column in columns} for row in rows]
+
+
+# Small tables that can be read whole (see services/snapshots.py)
+REFERENCE_TABLES = ("schedules", "teams", "power_ratings")
+
+# Tables reported by /v1/data/inventory
+INVENTORY_TABLES = (
+    "schedules", "teams", "season_stats", "power_ratings", "players", "player_stats",
+    "injuries", "depth_charts", "play_by_play",
+)
+
+# etl_manifest columns reported with a table's statistics
+MANIFEST_COLUMNS = ("loaded_at", "rows_loaded", "rows_changed", "high_season", "high_week")
+
+# Tables that can be streamed (see api/export.py) -> unique key they are ordered by
+EXPORT_KEYS: Dict[str, str] = {
+    "schedules": "game_id",
+    "player_stats": "stat_id",
+    "injuries": "injury_id",
+    "depth_charts": "depth_id",
+    "play_by_play": "pbp_id",
+}
+
+# Equality filters an export accepts (where the table has the column)
+EXPORT_FILTERS = ("season", "week", "team", "game_id", "player_id")
+
+
+def export_columns(table: str, columns: Optional[List[str]] = None) -> List[str]:
+    """
+    Columns of an export - the full table or a validated projection
+
+    The ordering key is always included (streams are resumed on it).
+    """
+    if not columns:
+        return list(TABLE_COLUMNS[table])
+    return list(dict.fromkeys([EXPORT_KEYS[table], *select_columns(table, columns)]))
+
+
+def export_filters(table: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop unset filters and reject ones the table has no column for (ValueError)"""
+    filters = {name: value for name, value in filters.items() if value is not None}
+    unsupported = [name for name in filters if name not in TABLE_COLUMNS[table]]
+    if unsupported:
+        raise ValueError(f"{table} cannot be filtered by: {', '.join(unsupported)}")
+    return filters
+
 
 class DataReader:
     """Reads and transforms data from Supabase PostgreSQL"""
@@ -27,15 +160,42 @@ class DataReader:
             logger.error(f"❌ Failed to initialize Supabase: {e}")
             raise
 
+    async def connect(self) -> None:
+        """Open backend connections (the Supabase client needs none)"""
+
+    async def close(self) -> None:
+        """Release backend connections"""
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool metrics for this backend"""
+        return {"backend": "supabase"}
+
+    async def read_table(self, table: str) -> Optional[List[Dict[str, Any]]]:
+        """Read every row of a reference table (None if the read failed)"""
+        if table not in REFERENCE_TABLES:
+            raise ValueError(f"Not a reference table: {table}")
+        try:
+            result = self.supabase.table(table).select("*").execute()
+            return result.data or []
+
+        except Exception as e:
+            logger.error(f"Error reading {table}: {e}")
+            return None
+
     async def read_schedules(
         self,
         season: int,
         week: Optional[int] = None,
         team: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Read game schedules with optional filters"""
         try:
-            query = self.supabase.table("schedules").select("*").eq("season", season)
+            query = (
+                self.supabase.table("schedules")
+                .select(",".join(select_columns("schedules", columns)))
+                .eq("season", season)
+            )
 
             if week:
                 query = query.eq("week", week)
@@ -50,7 +210,7 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading schedules: {e}")
-            return []
+            raise
 
     async def read_team_stats(
         self, team: str, season: int, week: Optional[int] = None
@@ -75,60 +235,113 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading team stats for {team}: {e}")
-            return {}
+            raise
 
     async def read_pbp(
-        self, game_id: str, limit: int = 100, offset: int = 0
-    ) -> Dict[str, Any]:
-        """Read play-by-play data with pagination"""
+        self,
+        game_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read one page of play-by-play data
+
+        With `after` (a play_index), reads the plays following it - an indexed
+        range read on (game_id, play_index). Otherwise pages by offset.
+        """
         try:
-            # Get total count
-            count_result = (
+            query = (
                 self.supabase.table("play_by_play")
-                .select("*", count="exact")
+                .select(",".join(select_columns("play_by_play", columns)))
                 .eq("game_id", game_id)
-                .execute()
             )
 
-            # Get paginated data
-            query = (
+            if after is not None:
+                query = query.gt("play_index", after).limit(limit)
+            else:
+                query = query.range(offset, offset + limit - 1)
+
+            result = query.order("play_index", desc=False).execute()
+            return result.data or []
+
+        except Exception as e:
+            logger.error(f"Error reading PBP for {game_id}: {e}")
+            raise
+
+    async def read_pbp_count(self, game_id: str) -> Optional[int]:
+        """Count the plays of a game (None if the count failed)"""
+        try:
+            # count comes from the Content-Range header - fetch a single row only
+            result = (
                 self.supabase.table("play_by_play")
-                .select("*")
+                .select("play_index", count="exact")
                 .eq("game_id", game_id)
-                .order("play_index", desc=False)
-                .range(offset, offset + limit - 1)
+                .limit(1)
+                .execute()
             )
+            return result.count or 0
 
-            result = query.execute()
-
+        except Exception as e:
+            logger.error(f"Error counting PBP for {game_id}: {e}")
+            return None
+
+    async def read_table_stats(self, table: str) -> Optional[Dict[str, Any]]:
+        """
+        Estimated row count and ETL high-water marks of a table (None if the read failed)
+
+        The count is PostgREST's estimated count (planner statistics above its
+        threshold), so large tables are never scanned.
+        """
+        if table not in INVENTORY_TABLES:
+            raise ValueError(f"Not an inventory table: {table}")
+        try:
+            counted = (
+                self.supabase.table(table)
+                .select(TABLE_COLUMNS[table][0], count="estimated")
+                .limit(1)
+                .execute()
+            )
+            manifest = (
+                self.supabase.table("etl_manifest")
+                .select(",".join(MANIFEST_COLUMNS))
+                .eq("dataset", table)
+                .execute()
+            )
             return {
-                "total": count_result.count or 0,
-                "plays": result.data or [],
-                "limit": limit,
-                "offset": offset,
+                "records": counted.count or 0,
+                "last_analyzed": None,
+                **(manifest.data[0] if manifest.data else dict.fromkeys(MANIFEST_COLUMNS)),
             }
 
         except Exception as e:
-            logger.error(f"Error reading PBP for {game_id}: {e}")
-            return {"total": 0, "plays": [], "limit": limit, "offset": offset}
+            logger.error(f"Error reading stats of {table}: {e}")
+            return None
 
-    async def read_teams(self) -> List[Dict[str, Any]]:
+    async def read_teams(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Read all teams"""
         try:
-            result = self.supabase.table("teams").select("*").execute()
+            result = (
+                self.supabase.table("teams")
+                .select(",".join(select_columns("teams", columns)))
+                .execute()
+            )
             logger.debug(f"Read {len(result.data)} teams")
             return result.data or []
 
         except Exception as e:
             logger.error(f"Error reading teams: {e}")
-            return []
+            raise
 
-    async def read_power_ratings(self, season: int) -> List[Dict[str, Any]]:
+    async def read_power_ratings(
+        self, season: int, columns: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """Read power ratings for a season"""
         try:
             result = (
                 self.supabase.table("power_ratings")
-                .select("*")
+                .select(",".join(select_columns("power_ratings", columns)))
                 .eq("season", season)
                 .order("elo_rank", desc=False)
                 .execute()
@@ -138,14 +351,22 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading power ratings: {e}")
-            return []
+            raise
 
     async def read_injuries(
-        self, season: int, week: Optional[int] = None, team: Optional[str] = None
+        self,
+        season: int,
+        week: Optional[int] = None,
+        team: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Read injury reports"""
         try:
-            query = self.supabase.table("injuries").select("*").eq("season", season)
+            query = (
+                self.supabase.table("injuries")
+                .select(",".join(select_columns("injuries", columns)))
+                .eq("season", season)
+            )
 
             if week:
                 query = query.eq("week", week)
@@ -158,16 +379,20 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading injuries: {e}")
-            return []
+            raise
 
     async def read_depth_charts(
-        self, team: str, season: int, week: Optional[int] = None
+        self,
+        team: str,
+        season: int,
+        week: Optional[int] = None,
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Read depth charts"""
         try:
             query = (
                 self.supabase.table("depth_charts")
-                .select("*")
+                .select(",".join(select_columns("depth_charts", columns)))
                 .eq("team", team)
                 .eq("season", season)
             )
@@ -182,16 +407,20 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading depth charts: {e}")
-            return []
+            raise
 
     async def read_player_stats(
-        self, season: int, team: Optional[str] = None, position: Optional[str] = None
+        self,
+        season: int,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Read player statistics"""
         try:
             query = (
                 self.supabase.table("player_stats")
-                .select("*")
+                .select(",".join(select_columns("player_stats", columns)))
                 .eq("season", season)
             )
 
@@ -206,7 +435,7 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading player stats: {e}")
-            return []
+            raise
 
     async def read_player(self, player_id: str) -> Dict[str, Any]:
         """Read single player profile"""
@@ -222,7 +451,7 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading player {player_id}: {e}")
-            return {}
+            raise
 
     async def read_game(self, game_id: str) -> Dict[str, Any]:
         """Read full game details"""
@@ -256,14 +485,90 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading game {game_id}: {e}")
-            return {}
+            raise
 
-    async def read_scoreboard(self, date: str) -> List[Dict[str, Any]]:
-        """Read scoreboard for a specific date"""
+    async def read_players(self, player_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read several player profiles in one query - keyed by player_id, missing ids omitted"""
         try:
             result = (
+                self.supabase.table("players")
+                .select("*")
+                .in_("player_id", player_ids)
+                .execute()
+            )
+            return {row["player_id"]: row for row in result.data or []}
+
+        except Exception as e:
+            logger.error(f"Error reading players {player_ids}: {e}")
+            raise
+
+    async def read_games(self, game_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read several games (with PBP samples) - keyed by game_id, missing ids omitted"""
+        try:
+            schedules = (
                 self.supabase.table("schedules")
                 .select("*")
+                .in_("game_id", game_ids)
+                .execute()
+            )
+            games = {row["game_id"]: row for row in schedules.data or []}
+
+            # PostgREST has no per-group limit - one sample query per found game
+            for game_id, game in games.items():
+                pbp_result = (
+                    self.supabase.table("play_by_play")
+                    .select("*")
+                    .eq("game_id", game_id)
+                    .order("play_index", desc=False)
+                    .limit(20)
+                    .execute()
+                )
+                game["pbp_sample"] = pbp_result.data or []
+
+            return games
+
+        except Exception as e:
+            logger.error(f"Error reading games {game_ids}: {e}")
+            raise
+
+    async def iter_rows(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        columns: List[str],
+        batch_size: int,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream a table in batches, ordered by its export key
+
+        PostgREST has no cursors - each batch is a keyset page (key > last key),
+        so every request is an indexed range read however deep the export goes.
+        Errors propagate: a stream cannot fall back to an empty result halfway.
+        """
+        key = EXPORT_KEYS[table]
+        last = None
+        while True:
+            query = self.supabase.table(table).select(",".join(columns))
+            for name, value in filters.items():
+                query = query.eq(name, value)
+            if last is not None:
+                query = query.gt(key, last)
+            rows = query.order(key, desc=False).limit(batch_size).execute().data or []
+            if not rows:
+                return
+            yield rows
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][key]
+
+    async def read_scoreboard(
+        self, date: str, columns: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read scoreboard for a specific date"""
+        try:
+            result = (
+                self.supabase.table("schedules")
+                .select(",".join(select_columns("schedules", columns)))
                 .eq("gameday", date)
                 .order("gametime", desc=False)
                 .execute()
@@ -273,8 +578,389 @@ class DataReader:
 
         except Exception as e:
             logger.error(f"Error reading scoreboard for {date}: {e}")
-            return []
+            raise
+
+
+class PostgresDataReader(DataReader):
+    """
+    Reads directly from PostgreSQL through the async connection pool
+
+    Queries run concurrently on pooled connections instead of blocking the
+    event loop. The Supabase client is still created for ETL writes.
+    """
+
+    async def connect(self) -> None:
+        """Open the connection pool"""
+        await database.connect()
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        await database.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool metrics"""
+        return {"backend": "postgres", **database.stats()}
+
+    async def read_table(self, table: str) -> Optional[List[Dict[str, Any]]]:
+        """Read every row of a reference table (None if the read failed)"""
+        if table not in REFERENCE_TABLES:
+            raise ValueError(f"Not a reference table: {table}")
+        try:
+            return await database.fetch(f"SELECT * FROM {table}")
+
+        except Exception as e:
+            logger.error(f"Error reading {table}: {e}")
+            return None
+
+    async def read_schedules(
+        self,
+        season: int,
+        week: Optional[int] = None,
+        team: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read game schedules with optional filters"""
+        try:
+            query = f"SELECT {', '.join(select_columns('schedules', columns))} FROM schedules WHERE season = %s"
+            params: List[Any] = [season]
+
+            if week:
+                query += " AND week = %s"
+                params.append(week)
+
+            if team:
+                # Filter by home or away team
+                query += " AND (home_team = %s OR away_team = %s)"
+                params.extend([team, team])
+
+            rows = await database.fetch(query + " ORDER BY gameday", params)
+            logger.debug(f"Read {len(rows)} schedules for season {season}")
+            return rows
+
+        except Exception as e:
+            logger.error(f"Error reading schedules: {e}")
+            raise
+
+    async def read_team_stats(
+        self, team: str, season: int, week: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Read team statistics"""
+        try:
+            query = "SELECT * FROM season_stats WHERE team = %s AND season = %s"
+            params: List[Any] = [team, season]
+
+            if week:
+                query += " AND week = %s"
+                params.append(week)
+            else:
+                # Get most recent week if not specified
+                query += " ORDER BY week DESC LIMIT 1"
+
+            return await database.fetchrow(query, params) or {}
+
+        except Exception as e:
+            logger.error(f"Error reading team stats for {team}: {e}")
+            raise
+
+    async def read_pbp(
+        self,
+        game_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read one page of play-by-play data
+
+        With `after` (a play_index), reads the plays following it - an indexed
+        range read on (game_id, play_index). Otherwise pages by offset.
+        """
+        try:
+            # Column names are validated against TABLE_COLUMNS
+            query = f"SELECT {', '.join(select_columns('play_by_play', columns))} FROM play_by_play WHERE game_id = %s"
+            params: List[Any] = [game_id]
+
+            if after is not None:
+                query += " AND play_index > %s ORDER BY play_index LIMIT %s"
+                params.extend([after, limit])
+            else:
+                query += " ORDER BY play_index LIMIT %s OFFSET %s"
+                params.extend([limit, offset])
+
+            return await database.fetch(query, params)
+
+        except Exception as e:
+            logger.error(f"Error reading PBP for {game_id}: {e}")
+            raise
+
+    async def read_pbp_count(self, game_id: str) -> Optional[int]:
+        """Count the plays of a game (None if the count failed)"""
+        try:
+            row = await database.fetchrow(
+                "SELECT count(*) AS total FROM play_by_play WHERE game_id = %s", [game_id]
+            )
+            return row["total"] if row else 0
+
+        except Exception as e:
+            logger.error(f"Error counting PBP for {game_id}: {e}")
+            return None
+
+    async def read_table_stats(self, table: str) -> Optional[Dict[str, Any]]:
+        """
+        Estimated row count and ETL high-water marks of a table (None if the read failed)
+
+        The count is the statistics collector's live tuple count (the planner's
+        reltuples before the table has any), so large tables are never scanned.
+        """
+        if table not in INVENTORY_TABLES:
+            raise ValueError(f"Not an inventory table: {table}")
+        try:
+            row = await database.fetchrow(
+                "SELECT s.n_live_tup AS live_rows, c.reltuples::bigint AS planner_rows,"
+                " GREATEST(s.last_analyze, s.last_autoanalyze) AS last_analyzed,"
+                f" {', '.join(f'm.{column}' for column in MANIFEST_COLUMNS)}"
+                " FROM pg_class c"
+                " JOIN pg_namespace n ON n.oid = c.relnamespace AND n.nspname = current_schema()"
+                " LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid"
+                " LEFT JOIN etl_manifest m ON m.dataset = c.relname"
+                " WHERE c.relname = %s AND c.relkind = 'r'",
+                [table],
+            )
+            if not row:
+                return None
+            live_rows, planner_rows = row.pop("live_rows"), row.pop("planner_rows")
+            return {"records": live_rows or max(planner_rows, 0), **row}
+
+        except Exception as e:
+            logger.error(f"Error reading stats of {table}: {e}")
+            return None
+
+    async def read_teams(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Read all teams"""
+        try:
+            rows = await database.fetch(
+                f"SELECT {', '.join(select_columns('teams', columns))} FROM teams"
+            )
+            logger.debug(f"Read {len(rows)} teams")
+            return rows
+
+        except Exception as e:
+            logger.error(f"Error reading teams: {e}")
+            raise
+
+    async def read_power_ratings(
+        self, season: int, columns: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read power ratings for a season"""
+        try:
+            rows = await database.fetch(
+                f"SELECT {', '.join(select_columns('power_ratings', columns))} FROM power_ratings"
+                " WHERE season = %s ORDER BY elo_rank",
+                [season],
+            )
+            logger.debug(f"Read {len(rows)} power ratings")
+            return rows
+
+        except Exception as e:
+            logger.error(f"Error reading power ratings: {e}")
+            raise
+
+    async def read_injuries(
+        self,
+        season: int,
+        week: Optional[int] = None,
+        team: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read injury reports"""
+        try:
+            query = f"SELECT {', '.join(select_columns('injuries', columns))} FROM injuries WHERE season = %s"
+            params: List[Any] = [season]
+
+            if week:
+                query += " AND week = %s"
+                params.append(week)
+
+            if team:
+                query += " AND team = %s"
+                params.append(team)
+
+            return await database.fetch(query, params)
+
+        except Exception as e:
+            logger.error(f"Error reading injuries: {e}")
+            raise
+
+    async def read_depth_charts(
+        self,
+        team: str,
+        season: int,
+        week: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read depth charts"""
+        try:
+            query = (
+                f"SELECT {', '.join(select_columns('depth_charts', columns))} FROM depth_charts"
+                " WHERE team = %s AND season = %s"
+            )
+            params: List[Any] = [team, season]
+
+            if week:
+                query += " AND week = %s"
+                params.append(week)
+
+            return await database.fetch(query + " ORDER BY position, depth_rank", params)
+
+        except Exception as e:
+            logger.error(f"Error reading depth charts: {e}")
+            raise
+
+    async def read_player_stats(
+        self,
+        season: int,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read player statistics"""
+        try:
+            query = f"SELECT {', '.join(select_columns('player_stats', columns))} FROM player_stats WHERE season = %s"
+            params: List[Any] = [season]
+
+            if team:
+                query += " AND team = %s"
+                params.append(team)
+
+            if position:
+                query += " AND position = %s"
+                params.append(position)
+
+            return await database.fetch(query, params)
+
+        except Exception as e:
+            logger.error(f"Error reading player stats: {e}")
+            raise
+
+    async def read_player(self, player_id: str) -> Dict[str, Any]:
+        """Read single player profile"""
+        try:
+            row = await database.fetchrow(
+                "SELECT * FROM players WHERE player_id = %s", [player_id]
+            )
+            return row or {}
+
+        except Exception as e:
+            logger.error(f"Error reading player {player_id}: {e}")
+            raise
+
+    async def read_game(self, game_id: str) -> Dict[str, Any]:
+        """Read full game details"""
+        try:
+            # Schedule info and PBP sample are fetched concurrently
+            game, pbp_sample = await asyncio.gather(
+                database.fetchrow("SELECT * FROM schedules WHERE game_id = %s", [game_id]),
+                database.fetch(
+                    "SELECT * FROM play_by_play WHERE game_id = %s"
+                    " ORDER BY play_index LIMIT 20",
+                    [game_id],
+                ),
+            )
+
+            if not game:
+                return {}
+
+            game["pbp_sample"] = pbp_sample
+            return game
+
+        except Exception as e:
+            logger.error(f"Error reading game {game_id}: {e}")
+            raise
+
+    async def read_players(self, player_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read several player profiles in one query - keyed by player_id, missing ids omitted"""
+        try:
+            rows = await database.fetch(
+                "SELECT * FROM players WHERE player_id = ANY(%s)", [player_ids]
+            )
+            return {row["player_id"]: row for row in rows}
+
+        except Exception as e:
+            logger.error(f"Error reading players {player_ids}: {e}")
+            raise
+
+    async def read_games(self, game_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read several games (with PBP samples) - keyed by game_id, missing ids omitted"""
+        try:
+            # Schedules and the first 20 plays of every game, concurrently
+            schedules, plays = await asyncio.gather(
+                database.fetch("SELECT * FROM schedules WHERE game_id = ANY(%s)", [game_ids]),
+                database.fetch(
+                    "SELECT * FROM ("
+                    "  SELECT *, row_number() OVER (PARTITION BY game_id ORDER BY play_index) AS sample_rank"
+                    "  FROM play_by_play WHERE game_id = ANY(%s)"
+                    ") ranked WHERE sample_rank <= 20 ORDER BY game_id, play_index",
+                    [game_ids],
+                ),
+            )
+
+            games = {row["game_id"]: {**row, "pbp_sample": []} for row in schedules}
+            for play in plays:
+                play.pop("sample_rank", None)
+                if play["game_id"] in games:
+                    games[play["game_id"]]["pbp_sample"].append(play)
+            return games
+
+        except Exception as e:
+            logger.error(f"Error reading games {game_ids}: {e}")
+            raise
+
+    async def iter_rows(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        columns: List[str],
+        batch_size: int,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream a table in batches, ordered by its export key
+
+        One query through a server-side cursor - rows are fetched batch by
+        batch, never materialized whole. Errors propagate.
+        """
+        # Table, column and filter names are validated against TABLE_COLUMNS
+        query = f"SELECT {', '.join(columns)} FROM {table}"
+        if filters:
+            query += " WHERE " + " AND ".join(f"{name} = %s" for name in filters)
+        query += f" ORDER BY {EXPORT_KEYS[table]}"
+
+        async for rows in database.stream(query, list(filters.values()), batch_size):
+            yield rows
+
+    async def read_scoreboard(
+        self, date: str, columns: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read scoreboard for a specific date"""
+        try:
+            return await database.fetch(
+                f"SELECT {', '.join(select_columns('schedules', columns))} FROM schedules"
+                " WHERE gameday = %s ORDER BY gametime",
+                [date],
+            )
+
+        except Exception as e:
+            logger.error(f"Error reading scoreboard for {date}: {e}")
+            raise
+
+
+def create_data_reader() -> DataReader:
+    """Build the reader for the configured DATA_BACKEND"""
+    if settings.DATA_BACKEND == "postgres":
+        logger.info("Using direct Postgres data backend")
+        return PostgresDataReader()
+    return DataReader()
 
 
 # Global data reader instance
-data_reader = DataReader()
+data_reader = create_data_reader()
@@ -0,0 +1,234 @@
+"""
+Gameday-aware refresh scheduler
+Submits the ETL jobs (services/jobs.py) on a cadence derived from the
+schedules table instead of a fixed timetable
+
+- Phase "live": a game has kicked off and has no result yet. Live scores are
+  written into schedules by the scrapers (scripts/scheduler.js), so the
+  datasets computed from the database (power ratings, season stats) are
+  recomputed every few minutes
+- Phase "gameday": a kickoff is within SCHEDULER_GAMEDAY_WINDOW (before or
+  after) - refreshed every 15-60 minutes
+- Phase "idle": no games around - hourly to daily
+- Each interval is jittered by +/- SCHEDULER_JITTER so workers and datasets
+  do not refresh in lockstep
+- One worker (the holder of a Redis lock) schedules for all of them - the
+  lock expires if its holder dies, and another worker takes over
+- Last run times (and the interval then in force) are kept in Redis, so a
+  new leader catches up on runs missed while no one was leading (one run per
+  dataset, not one per missed interval)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional, Any, Dict, List, Tuple
+from zoneinfo import ZoneInfo
+
+from core.config import settings
+from services.cache import cache_manager, LeaderLock
+from services.jobs import job_manager
+from services.readers import data_reader
+from services.snapshots import snapshot_store
+
+logger = logging.getLogger(__name__)
+
+LEADER_KEY = "scheduler:leader"
+LAST_RUN_KEY = "scheduler:last_run"
+
+PHASES = ("live", "gameday", "idle")
+
+# Job action -> refresh interval (seconds) in the live, gameday and idle phases
+# load_* actions read the parquet files under data/raw and are skipped while a
+# file is unchanged (etl_manifest) - their cadence only bounds how soon a file
+# refreshed upstream is picked up, so they are not polled faster during games
+REFRESH_POLICIES: Dict[str, tuple] = {
+    "load_schedules": (900, 900, 3600),
+    "load_pbp": (1800, 1800, 86400),
+    "load_player_stats": (3600, 3600, 86400),
+    "refresh_season_stats": (300, 3600, 86400),
+    "refresh_power_ratings": (300, 3600, 86400),
+    "load_injuries": (3600, 3600, 21600),
+    "load_depth_charts": (86400, 86400, 86400),
+}
+
+# nflverse game times are US Eastern
+GAMETIME_ZONE = ZoneInfo("America/New_York")
+
+# A game without a result this long after kickoff is not treated as live
+GAME_LENGTH = timedelta(hours=5)
+
+
+def kickoff(game: Dict[str, Any]) -> Optional[datetime]:
+    """A game's kickoff as an aware datetime (None without a date)"""
+    gameday = game.get("gameday")
+    if not gameday:
+        return None
+    day = gameday if isinstance(gameday, date) else date.fromisoformat(str(gameday)[:10])
+    hour, minute = 0, 0
+    if game.get("gametime"):
+        hour, minute = (int(part) for part in str(game["gametime"]).split(":")[:2])
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=GAMETIME_ZONE)
+
+
+def game_phase(games: List[Dict[str, Any]], now: Optional[datetime] = None) -> str:
+    """live, gameday or idle, from the kickoffs and results of games"""
+    now = now or datetime.now(GAMETIME_ZONE)
+    window = timedelta(seconds=settings.SCHEDULER_GAMEDAY_WINDOW)
+    phase = "idle"
+    for game in games:
+        start = kickoff(game)
+        if start is None:
+            continue
+        if start <= now < start + GAME_LENGTH and game.get("result") in (None, ""):
+            return "live"
+        if start - window <= now < start + window:
+            phase = "gameday"
+    return phase
+
+
+class RefreshScheduler:
+    """Leader-elected loop that submits refresh jobs when they are due"""
+
+    def __init__(self):
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._leadership = LeaderLock(LEADER_KEY, settings.SCHEDULER_LEADER_TIMEOUT)
+        self._last_run: Dict[str, Tuple[float, float]] = {}  # used without Redis
+        self._jitter: Dict[str, float] = {}
+        self.phase = "idle"
+        self.runs = 0
+        self.missed = 0
+
+    async def start(self) -> None:
+        """Start scheduling (no-op unless SCHEDULER_ENABLED)"""
+        if not settings.SCHEDULER_ENABLED or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("✅ Refresh scheduler started")
+
+    async def close(self) -> None:
+        """Stop scheduling and hand leadership over"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._leadership.release()
+
+    async def _run(self) -> None:
+        """Tick until stopped"""
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Refresh scheduler error: {e}")
+            await asyncio.sleep(settings.SCHEDULER_TICK)
+
+    async def tick(self, now: Optional[float] = None) -> List[str]:
+        """Submit the jobs that are due if this worker leads - returns their actions"""
+        if not await self._leadership.hold():
+            return []
+        now = now or time.time()
+        self.phase = await self.current_phase()
+        last_runs = await self._load_last_runs()
+
+        due = []
+        for action in REFRESH_POLICIES:
+            interval = self.interval(action)
+            last_run, last_interval = last_runs.get(action, (None, interval))
+            if last_run is not None and now - last_run < interval:
+                continue
+            if last_run is not None and now - last_run >= 2 * last_interval:
+                # Missed on the cadence in force at the last run - coalesced into this one
+                skipped = int((now - last_run) // last_interval) - 1
+                self.missed += skipped
+                logger.info(f"Catching up {action}: {skipped} missed run(s)")
+            due.append(action)
+
+        for action in due:
+            try:
+                job, deduplicated = await job_manager.submit(
+                    action, {"season": settings.CURRENT_SEASON}
+                )
+            except Exception as e:
+                logger.error(f"Scheduled {action} could not be submitted: {e}")
+                continue
+            self.runs += 1
+            await self._save_last_run(action, now, self.interval(action))
+            self._jitter.pop(action, None)
+            logger.info(
+                f"Scheduled {action} ({self.phase}): job {job['job_id']}"
+                f"{' (already running)' if deduplicated else ''}"
+            )
+        return due
+
+    def interval(self, action: str) -> float:
+        """Jittered interval of action in the current phase"""
+        if action not in self._jitter:
+            self._jitter[action] = random.uniform(-settings.SCHEDULER_JITTER, settings.SCHEDULER_JITTER)
+        return REFRESH_POLICIES[action][PHASES.index(self.phase)] * (1 + self._jitter[action])
+
+    async def current_phase(self) -> str:
+        """Phase of the current season's games"""
+        games = snapshot_store.schedules(settings.CURRENT_SEASON)
+        if games is None:
+            games = await data_reader.read_schedules(
+                settings.CURRENT_SEASON, columns=["gameday", "gametime", "result"]
+            )
+        return game_phase(games)
+
+    async def _load_last_runs(self) -> Dict[str, Tuple[float, float]]:
+        """action -> (last run time, interval in force when it ran)"""
+        client = cache_manager.redis_client
+        if client is None:
+            return dict(self._last_run)
+        try:
+            stored = await client.hgetall(LAST_RUN_KEY)
+            last_runs = {}
+            for key, value in stored.items():
+                when, _, interval = value.decode().partition(" ")
+                action = key.decode()
+                if action in REFRESH_POLICIES:
+                    last_runs[action] = (float(when), float(interval or self.interval(action)))
+            return last_runs
+        except Exception as e:
+            logger.error(f"Refresh scheduler state read error: {e}")
+            return dict(self._last_run)
+
+    async def _save_last_run(self, action: str, when: float, interval: float) -> None:
+        self._last_run[action] = (when, interval)
+        client = cache_manager.redis_client
+        if client is None:
+            return
+        try:
+            await client.hset(LAST_RUN_KEY, action, f"{when} {interval}")
+        except Exception as e:
+            logger.error(f"Refresh scheduler state write error: {e}")
+
+    def cadence(self) -> Dict[str, Any]:
+        """Refresh intervals per action and phase (seconds)"""
+        return {
+            "phase": self.phase,
+            "intervals": {
+                action: dict(zip(PHASES, intervals))
+                for action, intervals in REFRESH_POLICIES.items()
+            },
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler state"""
+        return {
+            "enabled": settings.SCHEDULER_ENABLED,
+            "leader": self._leadership.leader,
+            "phase": self.phase,
+            "runs": self.runs,
+            "missed": self.missed,
+            "elections": self._leadership.elections,
+        }
+
+
+# Global refresh scheduler instance
+refresh_scheduler = RefreshScheduler()
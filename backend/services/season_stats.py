@@ -0,0 +1,210 @@
+"""
+Team season stats from play-by-play and schedules
+Polars lazy queries behind the season_stats ETL stage (etl.compute_season_stats)
+
+Two steps:
+- week_totals: one grouped pass over a week's plays -> per team and week
+  sums (plays, EPA, successes, yards, turnovers, for offense and defense).
+  Totals are kept in team_week_totals, so only weeks whose plays changed
+  are aggregated again
+- season_stats: season-to-date rows (one per team and week played) from
+  the week totals plus the schedule results - record, per-game yards,
+  EPA/play, success rate, turnovers, ATS and over/under
+"""
+
+from typing import Any, Dict, Iterable, List
+
+import polars as pl
+
+# play_by_play columns read for the totals
+PLAY_COLUMNS = [
+    "game_id", "season", "week", "posteam", "defteam", "epa", "success", "pass", "rush",
+    "yards_gained", "interception", "fumble_lost",
+]
+PLAY_SCHEMA = {
+    "game_id": pl.Utf8, "season": pl.Int64, "week": pl.Int64, "posteam": pl.Utf8,
+    "defteam": pl.Utf8, "epa": pl.Float64, "success": pl.Int64, "pass": pl.Int64,
+    "rush": pl.Int64, "yards_gained": pl.Int64, "interception": pl.Int64, "fumble_lost": pl.Int64,
+}
+
+# schedules columns read for records and betting results
+GAME_COLUMNS = [
+    "season", "week", "home_team", "away_team", "home_score", "away_score",
+    "spread_line", "total_line",
+]
+GAME_SCHEMA = {
+    "season": pl.Int64, "week": pl.Int64, "home_team": pl.Utf8, "away_team": pl.Utf8,
+    "home_score": pl.Int64, "away_score": pl.Int64, "spread_line": pl.Float64,
+    "total_line": pl.Float64,
+}
+
+# team_week_totals columns (besides team, season, week)
+TOTAL_COLUMNS = [
+    "games", "plays_off", "epa_off", "successes_off", "pass_yards", "rush_yards",
+    "plays_def", "epa_def", "successes_def", "turnovers", "takeaways",
+]
+TOTAL_SCHEMA = {
+    "team": pl.Utf8, "season": pl.Int64, "week": pl.Int64,
+    **{column: pl.Float64 if column.startswith("epa") else pl.Int64 for column in TOTAL_COLUMNS},
+}
+
+
+def frame(rows: Iterable[Dict[str, Any]], schema: Dict[str, Any]) -> pl.DataFrame:
+    """Rows (dicts) as a frame with a fixed schema, whatever columns the rows carry"""
+    return pl.from_dicts(
+        [{column: row.get(column) for column in schema} for row in rows], schema=schema
+    )
+
+
+def week_totals(plays: pl.DataFrame) -> pl.DataFrame:
+    """Per team and week sums of plays - each play counts for its offense and its defense"""
+    plays = plays.lazy().filter(pl.col("week").is_not_null())
+    turnover = pl.col("interception").fill_null(0) + pl.col("fumble_lost").fill_null(0)
+    common = [
+        pl.col("season"), pl.col("week"), pl.col("game_id"), pl.col("epa"),
+        pl.col("success"), pl.col("pass"), pl.col("rush"), pl.col("yards_gained"),
+        turnover.alias("turnover"),
+    ]
+    sides = pl.concat(
+        [
+            plays.select(pl.col("posteam").alias("team"), *common, pl.lit(True).alias("offense")),
+            plays.select(pl.col("defteam").alias("team"), *common, pl.lit(False).alias("offense")),
+        ]
+    ).filter(pl.col("team").is_not_null())
+
+    offense = pl.col("offense")
+    scrimmage = (pl.col("pass") == 1) | (pl.col("rush") == 1)
+    return (
+        sides.group_by(["team", "season", "week"])
+        .agg(
+            pl.col("game_id").n_unique().cast(pl.Int64).alias("games"),
+            (offense & scrimmage).sum().cast(pl.Int64).alias("plays_off"),
+            pl.col("epa").filter(offense & scrimmage).sum().alias("epa_off"),
+            pl.col("success").filter(offense & scrimmage).sum().cast(pl.Int64).alias("successes_off"),
+            pl.col("yards_gained").filter(offense & (pl.col("pass") == 1)).sum().cast(pl.Int64).alias("pass_yards"),
+            pl.col("yards_gained").filter(offense & (pl.col("rush") == 1)).sum().cast(pl.Int64).alias("rush_yards"),
+            (~offense & scrimmage).sum().cast(pl.Int64).alias("plays_def"),
+            pl.col("epa").filter(~offense & scrimmage).sum().alias("epa_def"),
+            pl.col("success").filter(~offense & scrimmage).sum().cast(pl.Int64).alias("successes_def"),
+            pl.col("turnover").filter(offense).sum().cast(pl.Int64).alias("turnovers"),
+            pl.col("turnover").filter(~offense).sum().cast(pl.Int64).alias("takeaways"),
+        )
+        .with_columns(pl.col("season", "week").cast(pl.Int32))
+        .sort(["season", "week", "team"])
+        .collect()
+    )
+
+
+def team_games(games: pl.DataFrame) -> pl.LazyFrame:
+    """Completed games from each team's side - result, cover and over/under flags"""
+    games = games.lazy().filter(
+        pl.col("home_score").is_not_null() & pl.col("away_score").is_not_null()
+    )
+    margin = pl.col("home_score") - pl.col("away_score")
+    # spread_line: points the home team is favored by (nflverse)
+    sides = pl.concat(
+        [
+            games.select(
+                pl.col("home_team").alias("team"), "season", "week",
+                pl.col("home_score").alias("points_for"),
+                pl.col("away_score").alias("points_against"),
+                (margin - pl.col("spread_line")).alias("cover"),
+                "total_line",
+            ),
+            games.select(
+                pl.col("away_team").alias("team"), "season", "week",
+                pl.col("away_score").alias("points_for"),
+                pl.col("home_score").alias("points_against"),
+                (pl.col("spread_line") - margin).alias("cover"),
+                "total_line",
+            ),
+        ]
+    )
+    total = pl.col("points_for") + pl.col("points_against")
+    return sides.select(
+        "team", "season", "week",
+        (pl.col("points_for") > pl.col("points_against")).cast(pl.Int64).alias("win"),
+        (pl.col("points_for") < pl.col("points_against")).cast(pl.Int64).alias("loss"),
+        (pl.col("cover") > 0).cast(pl.Int64).alias("ats_win"),
+        (pl.col("cover") < 0).cast(pl.Int64).alias("ats_loss"),
+        (pl.col("cover") == 0).cast(pl.Int64).alias("ats_push"),
+        (total > pl.col("total_line")).cast(pl.Int64).alias("over"),
+        (total < pl.col("total_line")).cast(pl.Int64).alias("under"),
+    )
+
+
+def season_stats(totals: pl.DataFrame, games: pl.DataFrame) -> pl.DataFrame:
+    """
+    Season-to-date stats of every team through each week it played
+
+    totals: team_week_totals rows of the season, games: its schedules rows.
+    Weeks without plays yet still get a row (record and betting results only).
+    """
+    weekly = team_games(games).join(
+        totals.lazy().with_columns(pl.col("season", "week").cast(pl.Int64)),
+        on=["team", "season", "week"],
+        how="left",
+    )
+    # Each team's weeks up to and including each week it played
+    through = weekly.join(
+        weekly.select("team", pl.col("week").alias("through_week")), on="team"
+    ).filter(pl.col("week") <= pl.col("through_week"))
+
+    def ratio(numerator: str, denominator: str, digits: int = 3) -> pl.Expr:
+        return (
+            pl.when(pl.col(denominator) > 0)
+            .then(pl.col(numerator) / pl.col(denominator))
+            .otherwise(None)
+            .round(digits)
+        )
+
+    summed = ["win", "loss", "ats_win", "ats_loss", "ats_push", "over", "under", *TOTAL_COLUMNS]
+    return (
+        through.group_by(["team", "season", "through_week"])
+        .agg([pl.col(column).sum() for column in summed])
+        .select(
+            "team",
+            pl.col("season").cast(pl.Int32),
+            pl.col("through_week").cast(pl.Int32).alias("week"),
+            pl.col("win").cast(pl.Int32).alias("wins"),
+            pl.col("loss").cast(pl.Int32).alias("losses"),
+            ratio("pass_yards", "games", 1).alias("pass_yards_per_game"),
+            ratio("rush_yards", "games", 1).alias("rush_yards_per_game"),
+            (
+                pl.when(pl.col("games") > 0)
+                .then((pl.col("pass_yards") + pl.col("rush_yards")) / pl.col("games"))
+                .otherwise(None)
+                .round(1)
+            ).alias("total_yards_per_game"),
+            ratio("epa_off", "plays_off").alias("epa_per_play_off"),
+            ratio("epa_def", "plays_def").alias("epa_per_play_def"),
+            ratio("successes_off", "plays_off").alias("success_rate_off"),
+            ratio("successes_def", "plays_def").alias("success_rate_def"),
+            pl.col("turnovers").cast(pl.Int32),
+            pl.col("takeaways").cast(pl.Int32),
+            pl.format(
+                "{}-{}-{}", pl.col("ats_win"), pl.col("ats_loss"), pl.col("ats_push")
+            ).alias("ats_record"),
+            (
+                pl.when(pl.col("ats_win") + pl.col("ats_loss") > 0)
+                .then(pl.col("ats_win") / (pl.col("ats_win") + pl.col("ats_loss")))
+                .otherwise(None)
+                .round(3)
+            ).alias("ats_win_pct"),
+            (
+                pl.when(pl.col("over") + pl.col("under") > 0)
+                .then(pl.col("over") / (pl.col("over") + pl.col("under")))
+                .otherwise(None)
+                .round(3)
+            ).alias("over_pct"),
+        )
+        .sort(["season", "week", "team"])
+        .collect()
+    )
+
+
+def changed_weeks(rows: Iterable[Dict[str, Any]]) -> List[tuple]:
+    """Distinct (season, week) of changed play rows"""
+    return sorted(
+        {(row["season"], row["week"]) for row in rows if row.get("season") and row.get("week")}
+    )
@@ -0,0 +1,346 @@
+"""
+In-memory snapshots of small reference tables
+Schedules, teams and power ratings are a few hundred rows - they are loaded
+whole, with prebuilt indexes, and queried from memory (`frame` exposes a
+snapshot as a Polars DataFrame for analytics)
+
+Snapshots are immutable and replaced atomically:
+- every SNAPSHOT_REFRESH_INTERVAL seconds. Changes are detected by content
+  hash, and one worker (the holder of a Redis lock) invalidates the cache tags
+  of the changed rows only (row_tags, as the ETL does) - a score update drops
+  that game's entries, not every entry built from the table. The version it
+  last invalidated for is shared in Redis, so a new leader never diffs from a
+  version it loaded while following
+- when a table's cache tags are invalidated in any worker (e.g. after ETL) -
+  the snapshot is dropped at once, so queries fall back to the database until
+  the reload completes, then reloaded
+
+Query methods return None while a table has no snapshot; callers then read
+from the database as before.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Optional, Any, Dict, List, Set, Tuple, Callable
+
+import orjson
+import polars as pl
+
+from core.config import settings
+from services.cache import cache_manager, content_hash, LeaderLock
+from services.etl import CHANGE_TAGS
+from services.readers import data_reader, select_columns, project
+
+logger = logging.getLogger(__name__)
+
+LEADER_KEY = "snapshots:leader"
+# table -> version of the snapshot the leader last invalidated for
+VERSION_KEY = "snapshots:version"
+
+# table -> (sort columns, {index name: columns it is built from})
+SNAPSHOT_TABLES: Dict[str, Tuple[Tuple[str, ...], Dict[str, Tuple[str, ...]]]] = {
+    "schedules": (
+        ("gameday", "gametime", "game_id"),
+        {
+            "game_id": ("game_id",),
+            "season": ("season",),
+            "week": ("week",),
+            "team": ("home_team", "away_team"),
+            "gameday": ("gameday",),
+        },
+    ),
+    "teams": (("team",), {"team": ("team",)}),
+    "power_ratings": (
+        ("season", "elo_rank"),
+        {"season": ("season",), "team": ("team",)},
+    ),
+}
+
+# table -> columns identifying a row
+SNAPSHOT_KEYS: Dict[str, Tuple[str, ...]] = {
+    "schedules": ("game_id",),
+    "teams": ("team",),
+    "power_ratings": ("team", "season"),
+}
+
+
+class TableSnapshot:
+    """An immutable, indexed copy of one table"""
+
+    def __init__(self, table: str, rows: List[Dict[str, Any]]):
+        sort_columns, index_columns = SNAPSHOT_TABLES[table]
+        key_columns = SNAPSHOT_KEYS[table]
+        self.table = table
+        self.loaded_at = time.time()
+        # Rows are served as read (no type round-trip), sorted with nulls last -
+        # the key columns break ties, so the order never depends on the read
+        self.rows = sorted(
+            rows,
+            key=lambda row: tuple(
+                (row.get(column) is None, row.get(column) if row.get(column) is not None else 0)
+                for column in (*sort_columns, *key_columns)
+            ),
+        )
+        # Same rows, same version in every worker
+        self.version = content_hash(orjson.dumps(self.rows, option=orjson.OPT_SORT_KEYS))
+        self.by_key = {
+            tuple(row.get(column) for column in key_columns): row for row in self.rows
+        }
+
+        # index name -> value -> row positions (ascending, i.e. in sort order)
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {}
+        for name, columns in index_columns.items():
+            index: Dict[Any, List[int]] = {}
+            for position, row in enumerate(self.rows):
+                for value in {row.get(column) for column in columns}:
+                    if value is not None:
+                        index.setdefault(value, []).append(position)
+            self.indexes[name] = index
+
+    @functools.cached_property
+    def frame(self) -> pl.DataFrame:
+        """The rows as a Polars frame (built on first use)"""
+        return pl.DataFrame(self.rows, infer_schema_length=None)
+
+    def select(self, **filters: Any) -> List[Dict[str, Any]]:
+        """Rows matching every non-None filter (index name=value), in sort order"""
+        positions: Optional[Set[int]] = None
+        for name, value in filters.items():
+            if value is None:
+                continue
+            matches = self.indexes[name].get(value, ())
+            positions = set(matches) if positions is None else positions.intersection(matches)
+            if not positions:
+                return []
+        if positions is None:
+            return list(self.rows)
+        return [self.rows[position] for position in sorted(positions)]
+
+    def changed_rows(self, previous: "TableSnapshot") -> List[Dict[str, Any]]:
+        """Rows added, removed or changed since previous (both versions of a changed row)"""
+        changed = []
+        for key, row in self.by_key.items():
+            before = previous.by_key.get(key)
+            if before != row:
+                changed.append(row)
+                if before is not None:
+                    changed.append(before)
+        changed.extend(row for key, row in previous.by_key.items() if key not in self.by_key)
+        return changed
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and age"""
+        return {
+            "rows": len(self.rows),
+            "indexes": {name: len(index) for name, index in self.indexes.items()},
+            "age_seconds": round(time.time() - self.loaded_at, 1),
+        }
+
+
+class SnapshotStore:
+    """Holds the current snapshot of each reference table"""
+
+    def __init__(self):
+        self._snapshots: Dict[str, TableSnapshot] = {}
+        self._reloading: Dict[str, "asyncio.Task[None]"] = {}
+        self._invalidating: Set[str] = set()
+        self._refresher: Optional["asyncio.Task[None]"] = None
+        self._leadership = LeaderLock(LEADER_KEY, settings.SNAPSHOT_REFRESH_INTERVAL * 3)
+        self.reloads = 0
+        self.changes = 0
+        cache_manager.on_invalidate(self._on_invalidate)
+
+    async def connect(self) -> None:
+        """Load every table and start the periodic refresh"""
+        if not settings.SNAPSHOTS_ENABLED:
+            return
+        await asyncio.gather(*(self.reload(table) for table in SNAPSHOT_TABLES))
+        self._refresher = asyncio.create_task(self._refresh_periodically())
+        logger.info(
+            f"✅ Snapshots loaded: "
+            f"{', '.join(f'{t} ({len(s.rows)})' for t, s in self._snapshots.items())}"
+        )
+
+    async def close(self) -> None:
+        """Stop refreshing"""
+        if self._refresher:
+            self._refresher.cancel()
+            self._refresher = None
+        for task in list(self._reloading.values()):
+            task.cancel()
+        await self._leadership.release()
+
+    async def reload(self, table: str, invalidate: bool = False) -> bool:
+        """
+        Load a fresh snapshot of table and swap it in
+
+        With invalidate=True (the leader), changes since the last published
+        version are also invalidated (see publish). Returns True if the
+        content changed. On a failed read the current snapshot (if any) is
+        kept.
+        """
+        rows = await data_reader.read_table(table)
+        if rows is None:
+            return False
+        snapshot = TableSnapshot(table, rows)
+        current = self._snapshots.get(table)
+        self._snapshots[table] = snapshot
+        self.reloads += 1
+        changed = current is not None and current.version != snapshot.version
+        if changed:
+            self.changes += 1
+            logger.info(f"Snapshot {table} changed ({len(snapshot.rows)} rows)")
+        if invalidate:
+            await self.publish(snapshot, current)
+        return changed
+
+    async def publish(self, snapshot: TableSnapshot, previous: Optional[TableSnapshot]) -> None:
+        """
+        Invalidate the cache tags of whatever changed since the published version
+
+        The baseline is the version the leader last invalidated for (shared in
+        Redis), not this worker's previous snapshot: after a handover, the new
+        leader may already have loaded a change while following. If the
+        previous snapshot is that version, only the changed rows' tags are
+        invalidated; otherwise (new leader, no previous snapshot, shared
+        version lost) the rows in between are unknown and the whole
+        table:{name} tag is.
+        """
+        table = snapshot.table
+        client = cache_manager.redis_client
+        # Without Redis each worker publishes for itself
+        published = previous.version if previous is not None else None
+        if client is not None:
+            try:
+                stored = await client.hget(VERSION_KEY, table)
+                published = stored.decode() if stored is not None else None
+            except Exception as e:
+                logger.error(f"Snapshot version read error for {table}: {e}")
+                published = None
+        if published == snapshot.version:
+            return
+
+        if previous is not None and previous.version == published:
+            _, tags_of = CHANGE_TAGS[table]
+            changed = snapshot.changed_rows(previous)
+            tags = sorted({tag for row in changed for tag in tags_of(row)})
+            logger.info(f"Snapshot {table}: invalidating {len(changed)} changed rows")
+        else:
+            tags = [f"table:{table}"]
+            logger.info(f"Snapshot {table}: no baseline for version {published} - invalidating the table")
+        self._invalidating.add(table)
+        try:
+            await cache_manager.invalidate_tags(*tags)
+        finally:
+            self._invalidating.discard(table)
+
+        if client is not None:
+            try:
+                await client.hset(VERSION_KEY, table, snapshot.version)
+            except Exception as e:
+                logger.error(f"Snapshot version write error for {table}: {e}")
+
+    def _on_invalidate(self, tags: Tuple[str, ...]) -> None:
+        """Drop and reload snapshots of tables whose cache tags were invalidated"""
+        if not settings.SNAPSHOTS_ENABLED:
+            return
+        for table in SNAPSHOT_TABLES:
+            if table in self._invalidating:
+                continue
+            if not any(tag == f"table:{table}" or tag.startswith(f"{table}:") for tag in tags):
+                continue
+            self._snapshots.pop(table, None)
+            # A reload already in flight may have read the old rows - restart it
+            running = self._reloading.get(table)
+            if running is not None:
+                running.cancel()
+            task = asyncio.ensure_future(self._reload_safely(table))
+            self._reloading[table] = task
+            task.add_done_callback(self._reload_done(table))
+
+    def _reload_done(self, table: str) -> Callable[["asyncio.Task[None]"], None]:
+        """Done callback that forgets a reload task unless it has been replaced"""
+
+        def done(task: "asyncio.Task[None]") -> None:
+            if self._reloading.get(table) is task:
+                del self._reloading[table]
+
+        return done
+
+    async def _reload_safely(self, table: str, invalidate: bool = False) -> None:
+        """reload() for background tasks"""
+        try:
+            await self.reload(table, invalidate)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Snapshot reload error for {table}: {e}")
+
+    async def _refresh_periodically(self) -> None:
+        """
+        Pick up changes made outside the ETL (e.g. live score updates)
+
+        Every worker reloads, only the leader invalidates - the other workers
+        drop their snapshots and cache entries through its invalidation.
+        """
+        while True:
+            await asyncio.sleep(settings.SNAPSHOT_REFRESH_INTERVAL)
+            leader = await self._leadership.hold()
+            for table in SNAPSHOT_TABLES:
+                if table not in self._reloading:
+                    await self._reload_safely(table, invalidate=leader)
+
+    def get(self, table: str) -> Optional[TableSnapshot]:
+        """The current snapshot of table, None if not loaded"""
+        return self._snapshots.get(table)
+
+    def query(
+        self, table: str, columns: Optional[List[str]] = None, **filters: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Filtered (and optionally projected) rows of table, None if not loaded"""
+        snapshot = self.get(table)
+        if snapshot is None:
+            return None
+        return project(snapshot.select(**filters), select_columns(table, columns))
+
+    def schedules(
+        self,
+        season: int,
+        week: Optional[int] = None,
+        team: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Games of a season, optionally for a week and/or team (home or away)"""
+        return self.query("schedules", columns, season=season, week=week, team=team)
+
+    def scoreboard(
+        self, date: str, columns: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Games on a date"""
+        return self.query("schedules", columns, gameday=date)
+
+    def teams(self, columns: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """All teams"""
+        return self.query("teams", columns)
+
+    def power_ratings(
+        self, season: int, columns: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Power ratings of a season, by rank"""
+        return self.query("power_ratings", columns, season=season)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-table snapshot stats"""
+        return {
+            "enabled": settings.SNAPSHOTS_ENABLED,
+            "leader": self._leadership.leader,
+            "reloads": self.reloads,
+            "changes": self.changes,
+            "tables": {table: snapshot.stats() for table, snapshot in self._snapshots.items()},
+        }
+
+
+# Global snapshot store instance
+snapshot_store = SnapshotStore()
@@ -0,0 +1,13 @@
+"""
+Test configuration
+
+The tests cover pure logic only - no Supabase, Postgres or Redis is needed.
+Settings are required at import time, so placeholders are set first.
+"""
+
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/test")
+os.environ.setdefault("API_KEY", "test-api-key")
@@ -0,0 +1,18 @@
+"""Canonical cache key parameters"""
+
+from services.caching import canonicalize
+
+
+def test_canonicalize_codes_and_field_lists():
+    assert canonicalize("team", " kc ") == "KC"
+    assert canonicalize("position", "qb") == "QB"
+    assert canonicalize("fields", "epa, play_type,EPA,") == "epa,play_type"
+    assert canonicalize("fields", " , ") is None
+    assert canonicalize("game_id", " 2025_01_KC_BAL ") == "2025_01_KC_BAL"
+    assert canonicalize("season", 2025) == 2025
+
+
+def test_canonicalize_dates():
+    assert canonicalize("date_param", " 2025-10-15 ") == "2025-10-15"
+    assert canonicalize("date_param", "20251015") == "2025-10-15"
+    assert canonicalize("date_param", "not-a-date") == "not-a-date"
@@ -0,0 +1,37 @@
+"""ETags and If-None-Match"""
+
+import time
+
+from starlette.requests import Request
+
+from services.cache import CacheEntry
+from services.caching import entry_etag, if_none_match
+
+
+def request_with(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+        }
+    )
+
+
+def test_if_none_match_compares_the_whole_representation_etag():
+    entry = CacheEntry.from_value([{"game_id": "g1"}], time.time() + 60)
+    json_etag = entry_etag(entry, None)
+    gzip_etag = entry_etag(entry, "gzip")
+    zstd_etag = entry_etag(entry, "zstd")
+    arrow_etag = entry_etag(entry, "arrow")
+
+    assert if_none_match(request_with(if_none_match=json_etag), json_etag)
+    assert if_none_match(request_with(if_none_match=f"W/{json_etag}"), json_etag)
+    assert if_none_match(request_with(if_none_match=f'"other", {zstd_etag}'), zstd_etag)
+    assert if_none_match(request_with(if_none_match="*"), zstd_etag)
+    # Same content, other representation - the client's body cannot be reused
+    assert not if_none_match(request_with(if_none_match=json_etag), zstd_etag)
+    assert not if_none_match(request_with(if_none_match=zstd_etag), gzip_etag)
+    assert not if_none_match(request_with(if_none_match=json_etag), arrow_etag)
+    assert not if_none_match(request_with(), json_etag)
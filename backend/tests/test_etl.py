@@ -0,0 +1,134 @@
+"""ETL stage graph - ordering and failure propagation"""
+
+import asyncio
+
+import pytest
+
+from services import etl
+
+
+def test_stage_order_puts_dependencies_first():
+    order = etl.stage_order()
+    assert sorted(order) == sorted(etl.ETL_STAGES)
+    for name, (_, dependencies) in etl.ETL_STAGES.items():
+        for dependency in dependencies:
+            assert order.index(dependency) < order.index(name)
+
+
+def test_stage_order_of_a_partial_run():
+    # Dependencies outside the request are assumed loaded, not added
+    assert etl.stage_order(["season_stats", "schedules", "schedules"]) == ["schedules", "season_stats"]
+    with pytest.raises(ValueError, match="nope"):
+        etl.stage_order(["schedules", "nope"])
+
+
+def test_stage_order_rejects_cycles(monkeypatch):
+    monkeypatch.setitem(etl.ETL_STAGES, "teams", (etl.load_teams, ("season_stats",)))
+    with pytest.raises(ValueError, match="cycle"):
+        etl.stage_order()
+
+
+def test_failed_stage_blocks_only_its_dependents(monkeypatch):
+    ran = []
+
+    def stage(name, fails=False):
+        async def loader(season, force):
+            ran.append(name)
+            if fails:
+                raise RuntimeError(f"{name} broke")
+            return {"status": "success", "rows": 1}
+        return loader
+
+    monkeypatch.setitem(etl.ETL_STAGES, "teams", (stage("teams"), ()))
+    monkeypatch.setitem(etl.ETL_STAGES, "schedules", (stage("schedules", fails=True), ("teams",)))
+    monkeypatch.setitem(etl.ETL_STAGES, "play_by_play", (stage("play_by_play"), ("schedules",)))
+    monkeypatch.setitem(etl.ETL_STAGES, "season_stats", (stage("season_stats"), ("schedules", "play_by_play")))
+    monkeypatch.setitem(etl.ETL_STAGES, "players", (stage("players"), ("teams",)))
+    reported = []
+
+    async def on_stage(name, result):
+        reported.append(name)
+
+    result = asyncio.run(
+        etl.run_stages(
+            datasets=["teams", "schedules", "play_by_play", "season_stats", "players"],
+            concurrency=2,
+            on_stage=on_stage,
+        )
+    )
+
+    assert result["status"] == "partial"
+    assert result["failed"] == ["schedules", "play_by_play", "season_stats"]
+    results = result["results"]
+    assert results["schedules"]["reason"] == "schedules broke"
+    assert results["play_by_play"]["blocked_by"] == ["schedules"]
+    assert results["season_stats"]["blocked_by"] == ["schedules", "play_by_play"]
+    assert results["players"]["status"] == "success"
+    assert sorted(ran) == ["players", "schedules", "teams"]
+    assert sorted(reported) == sorted(results)
+
+
+def test_merge_invalidates_old_and_new_values_of_updated_rows(monkeypatch):
+    invalidated, logged = [], []
+
+    async def copy_merge(table, columns, conflict_columns, chunks, **options):
+        # A game moved from week 1 to week 2 (and to another gameday)
+        moved = {"game_id": "g1", "season": 2025, "home_team": "KC", "away_team": "BAL"}
+        return {
+            "copied": 1, "inserted": 0, "updated": 1, "deleted": 0,
+            "changed": [{**moved, "week": 2, "gameday": "2025-09-14"}],
+            "previous": [{**moved, "week": 1, "gameday": "2025-09-07"}],
+            "removed": [],
+        }
+
+    async def invalidate_tags(*tags):
+        invalidated.extend(tags)
+
+    async def record_manifest(*args, **kwargs):
+        pass
+
+    async def record_changes(table, weeks):
+        logged.extend(weeks)
+
+    monkeypatch.setattr(etl.database, "copy_merge", copy_merge)
+    monkeypatch.setattr(etl.cache_manager, "invalidate_tags", invalidate_tags)
+    monkeypatch.setattr(etl, "_record_manifest", record_manifest)
+    monkeypatch.setattr(etl, "_record_changes", record_changes)
+    monkeypatch.setattr(etl, "CHANGE_LOG_TABLES", ("schedules",))
+
+    result = asyncio.run(etl._merge("schedules", [], ["game_id"], None, None, {}))
+
+    assert result["records_updated"] == 1
+    for tag in (
+        "schedules:week:2025:1", "schedules:week:2025:2",
+        "schedules:gameday:2025-09-07", "schedules:gameday:2025-09-14", "schedules:game:g1",
+    ):
+        assert tag in invalidated
+    assert sorted(logged) == [(2025, 1), (2025, 2)]
+
+
+def test_unchanged_teams_invalidate_nothing(monkeypatch):
+    merged, invalidated = [], []
+
+    async def copy_merge(table, columns, conflict_columns, chunks, **options):
+        merged.append((table, list(columns), list(conflict_columns)))
+        return {
+            "copied": 32, "inserted": 0, "updated": 0, "deleted": 0,
+            "changed": [], "previous": [], "removed": [],
+        }
+
+    async def invalidate_tags(*tags):
+        invalidated.extend(tags)
+
+    async def record_manifest(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(etl.database, "copy_merge", copy_merge)
+    monkeypatch.setattr(etl.cache_manager, "invalidate_tags", invalidate_tags)
+    monkeypatch.setattr(etl, "_record_manifest", record_manifest)
+
+    result = asyncio.run(etl.load_teams())
+
+    assert result["status"] == "success" and result["records_read"] == 32
+    assert merged == [("teams", ["team", "team_name", "location"], ["team"])]
+    assert invalidated == []
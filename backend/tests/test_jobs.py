@@ -0,0 +1,92 @@
+"""In-flight job claims under concurrent submits"""
+
+import asyncio
+
+import pytest
+
+from services.cache import cache_manager
+from services.jobs import INFLIGHT_PREFIX, JOB_PREFIX, LEASE_PREFIX, JobManager
+
+
+class FakeRedis:
+    """The Redis commands JobStore uses - every call yields, so submits interleave"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        await asyncio.sleep(0)
+        if nx and key in self.values:
+            return None
+        self.values[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    async def get(self, key):
+        await asyncio.sleep(0)
+        return self.values.get(key)
+
+    async def delete(self, key):
+        await asyncio.sleep(0)
+        return int(self.values.pop(key, None) is not None)
+
+    async def exists(self, key):
+        await asyncio.sleep(0)
+        return int(key in self.values)
+
+    async def eval(self, script, numkeys, key, holder, job_id, ttl):
+        # REPLACE_CLAIM_SCRIPT, atomically
+        await asyncio.sleep(0)
+        current = self.values.get(key)
+        if current is not None and current.decode() != holder:
+            return current
+        self.values[key] = job_id.encode()
+        return None
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(cache_manager, "redis_client", FakeRedis())
+    manager = JobManager()
+    started = []
+
+    async def run(job, inflight_key):
+        started.append(job["job_id"])
+
+    monkeypatch.setattr(manager, "_run", run)
+    manager.started = started
+    return manager
+
+
+async def submit_twice(manager):
+    results = await asyncio.gather(
+        manager.submit("load_injuries", {"season": 2025}),
+        manager.submit("load_injuries", {"season": 2025}),
+    )
+    await asyncio.sleep(0)
+    return results
+
+
+def test_concurrent_submits_run_once(manager):
+    (first, first_dup), (second, second_dup) = asyncio.run(submit_twice(manager))
+    assert sorted([first_dup, second_dup]) == [False, True]
+    assert first["job_id"] == second["job_id"]
+    assert manager.started == [first["job_id"]]
+    # The losing submit leaves no record or lease behind
+    keys = set(cache_manager.redis_client.values)
+    assert {key for key in keys if key.count(":") == 1} == {f"{JOB_PREFIX}{first['job_id']}"}
+    assert {key for key in keys if key.startswith(LEASE_PREFIX)} == {f"{LEASE_PREFIX}{first['job_id']}"}
+
+
+def test_stale_claim_is_taken_over_once(manager):
+    redis = cache_manager.redis_client
+    # A job whose worker died: still "running", claim held, lease gone
+    redis.values[f"{INFLIGHT_PREFIX}load_injuries:2025:0"] = b"dead"
+    redis.values[f"{JOB_PREFIX}dead"] = b'{"job_id": "dead", "status": "running", "stages": {"injuries": "pending"}}'
+
+    (first, first_dup), (second, second_dup) = asyncio.run(submit_twice(manager))
+    assert sorted([first_dup, second_dup]) == [False, True]
+    assert first["job_id"] == second["job_id"]
+    assert manager.started == [first["job_id"]]
+    assert redis.values[f"{INFLIGHT_PREFIX}load_injuries:2025:0"] == first["job_id"].encode()
+    assert b'"failed"' in redis.values[f"{JOB_PREFIX}dead"]
+    assert f"{LEASE_PREFIX}{first['job_id']}" in redis.values
@@ -0,0 +1,37 @@
+"""In-process L1 cache - expiry, LRU eviction, tags"""
+
+import time
+
+from services.cache import LocalCache
+
+
+def test_local_cache_expires_and_evicts_least_recently_used():
+    cache = LocalCache(max_entries=2, max_bytes=100)
+    cache.set("a", 1, ttl_seconds=60, size=10)
+    cache.set("b", 2, ttl_seconds=60, size=10)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3, ttl_seconds=60, size=10)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+    cache.set("big", 4, ttl_seconds=60, size=95)
+    assert cache.stats()["bytes"] <= 100
+    assert cache.get("big") == 4
+
+    cache.set("gone", 5, ttl_seconds=0.01, size=1)
+    time.sleep(0.02)
+    assert cache.get("gone") is None
+
+
+def test_local_cache_delete_tags():
+    cache = LocalCache(max_entries=10, max_bytes=1000)
+    cache.set("schedules:2025", 1, 60, 1, tags=["table:schedules", "schedules:season:2025"])
+    cache.set("schedules:2024", 2, 60, 1, tags=["table:schedules", "schedules:season:2024"])
+    cache.set("teams", 3, 60, 1, tags=["table:teams"])
+
+    assert cache.delete_tags(["schedules:season:2025"]) == 1
+    assert cache.get("schedules:2025") is None
+    assert cache.get("schedules:2024") == 2
+    assert cache.delete_tags(["table:schedules", "table:teams"]) == 2
+    assert cache.stats()["entries"] == 0 and cache.stats()["tags"] == 0
@@ -0,0 +1,71 @@
+"""Elo engine - incremental updates must match a full replay"""
+
+import numpy as np
+
+from services.ratings import EloEngine, EloParams
+
+
+def game(season, week, home, away, home_score, away_score):
+    return {
+        "season": season, "week": week, "home_team": home, "away_team": away,
+        "home_score": home_score, "away_score": away_score,
+    }
+
+
+GAMES = [
+    game(2024, 1, "KC", "BAL", 27, 20),
+    game(2024, 1, "PHI", "GB", 34, 29),
+    game(2024, 2, "BAL", "LV", 23, 26),
+    game(2024, 2, "GB", "KC", 10, 17),
+    game(2025, 1, "KC", "PHI", 21, 24),
+    game(2025, 1, "OAK", "BAL", 13, 30),  # Relocated - rated as LV
+]
+
+
+def replayed(rows):
+    engine = EloEngine()
+    engine.update(rows, full=True)
+    return engine
+
+
+def test_new_week_replays_only_that_week():
+    engine = EloEngine()
+    assert engine.update(GAMES[:4])["weeks_replayed"] == 2
+
+    result = engine.update(GAMES)
+    assert result["weeks"] == 3 and result["weeks_replayed"] == 1
+    assert engine.teams == replayed(GAMES).teams
+    assert np.allclose(engine.history, replayed(GAMES).history)
+
+
+def test_changed_week_replays_from_that_week():
+    engine = EloEngine()
+    engine.update(GAMES)
+    corrected = GAMES[:2] + [game(2024, 2, "BAL", "LV", 30, 26)] + GAMES[3:]
+
+    assert engine.update(corrected)["weeks_replayed"] == 2
+    assert np.allclose(engine.history, replayed(corrected).history)
+    # Row order within a week does not count as a change
+    assert engine.update(list(reversed(corrected)))["weeks_replayed"] == 0
+
+
+def test_new_team_or_params_replays_everything():
+    engine = EloEngine()
+    engine.update(GAMES[:4])
+    assert engine.update(GAMES[:4] + [game(2024, 3, "DAL", "KC", 20, 10)])["weeks_replayed"] == 3
+
+    engine.params = EloParams(k=30.0)
+    assert engine.update(GAMES[:4])["weeks_replayed"] == 2
+
+
+def test_home_field_and_season_regression():
+    engine = EloEngine(EloParams(margin_of_victory=False))
+    engine.update([game(2024, 1, "KC", "BAL", 20, 20)])
+    kc, bal = (engine.teams.index(team) for team in ("KC", "BAL"))
+    # A home tie is below expectation for the home team
+    assert engine.history[0, kc] < engine.history[0, bal]
+    assert np.isclose(engine.history[0].mean(), engine.params.mean)
+
+    engine.update([game(2024, 1, "KC", "BAL", 20, 20), game(2025, 1, "BAL", "KC", 20, 20)])
+    spread = abs(engine.history[0, kc] - engine.history[0, bal])
+    assert abs(engine.history[1, kc] - engine.history[1, bal]) < spread
@@ -0,0 +1,40 @@
+"""Game phase detection for the refresh scheduler"""
+
+from datetime import datetime, timedelta
+
+from core.config import settings
+from services.scheduler import GAMETIME_ZONE, game_phase, kickoff
+
+GAME = {"game_id": "2025_01_KC_BAL", "gameday": "2025-09-07", "gametime": "20:20", "result": None}
+KICKOFF = datetime(2025, 9, 7, 20, 20, tzinfo=GAMETIME_ZONE)
+
+
+def test_kickoff_is_eastern_time():
+    assert kickoff(GAME) == KICKOFF
+    assert kickoff({**GAME, "gametime": None}) == datetime(2025, 9, 7, tzinfo=GAMETIME_ZONE)
+    assert kickoff({"gameday": None}) is None
+
+
+def test_live_between_kickoff_and_result():
+    assert game_phase([GAME], KICKOFF) == "live"
+    assert game_phase([GAME], KICKOFF + timedelta(hours=3)) == "live"
+    # A result ends the game
+    assert game_phase([{**GAME, "result": 3}], KICKOFF + timedelta(hours=3)) != "live"
+
+
+def test_not_live_after_game_length_without_result():
+    assert game_phase([GAME], KICKOFF + timedelta(hours=6)) != "live"
+
+
+def test_gameday_within_window_of_kickoff():
+    window = timedelta(seconds=settings.SCHEDULER_GAMEDAY_WINDOW)
+    assert game_phase([GAME], KICKOFF - window + timedelta(minutes=1)) == "gameday"
+    assert game_phase([{**GAME, "result": 7}], KICKOFF + timedelta(minutes=30)) == "gameday"
+    assert game_phase([GAME], KICKOFF - window - timedelta(minutes=1)) == "idle"
+
+
+def test_idle_without_games_and_live_wins_over_gameday():
+    assert game_phase([], KICKOFF) == "idle"
+    assert game_phase([{"gameday": None}], KICKOFF) == "idle"
+    later = {**GAME, "game_id": "2025_01_DAL_PHI", "gametime": "23:00"}
+    assert game_phase([later, GAME], KICKOFF + timedelta(minutes=10)) == "live"
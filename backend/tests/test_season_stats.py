@@ -0,0 +1,100 @@
+"""Season stats aggregation on a tiny hand-checked fixture"""
+
+import pytest
+
+from services.season_stats import GAME_SCHEMA, PLAY_SCHEMA, frame, season_stats, week_totals
+
+
+def play(game_id, week, posteam, defteam, epa, success, pass_, rush, yards, interception=0, fumble_lost=0):
+    return {
+        "game_id": game_id, "season": 2025, "week": week, "posteam": posteam, "defteam": defteam,
+        "epa": epa, "success": success, "pass": pass_, "rush": rush, "yards_gained": yards,
+        "interception": interception, "fumble_lost": fumble_lost,
+    }
+
+
+PLAYS = [
+    play("g1", 1, "KC", "BAL", 0.5, 1, 1, 0, 10),
+    play("g1", 1, "KC", "BAL", 0.1, 1, 0, 1, 5),
+    play("g1", 1, "KC", "BAL", 0.0, 0, 0, 0, 40),  # Kickoff - not a scrimmage play
+    play("g1", 1, "BAL", "KC", -2.0, 0, 1, 0, 0, interception=1),
+    play("g1", 1, "BAL", "KC", -1.5, 0, 0, 1, 3, fumble_lost=1),
+    play("g2", 2, "KC", "BAL", 1.0, 1, 1, 0, 30),
+    play("g2", 2, "BAL", "KC", 0.2, 1, 0, 1, 4),
+    play("g2", None, "BAL", "KC", 9.9, 1, 0, 1, 99),  # No week - ignored
+]
+
+GAMES = [
+    # spread_line: points the home team is favored by
+    {"season": 2025, "week": 1, "home_team": "KC", "away_team": "BAL", "home_score": 27,
+     "away_score": 20, "spread_line": 3.0, "total_line": 45.0},
+    {"season": 2025, "week": 2, "home_team": "BAL", "away_team": "KC", "home_score": 24,
+     "away_score": 21, "spread_line": 3.0, "total_line": 50.0},
+    # Played, plays not loaded yet
+    {"season": 2025, "week": 3, "home_team": "KC", "away_team": "LV", "home_score": 30,
+     "away_score": 10, "spread_line": 7.0, "total_line": 40.0},
+    # Not played yet
+    {"season": 2025, "week": 4, "home_team": "LV", "away_team": "KC", "home_score": None,
+     "away_score": None, "spread_line": -3.0, "total_line": 44.0},
+]
+
+
+@pytest.fixture
+def totals():
+    return week_totals(frame(PLAYS, PLAY_SCHEMA))
+
+
+def row(df, **keys):
+    rows = [r for r in df.to_dicts() if all(r[k] == v for k, v in keys.items())]
+    assert len(rows) == 1
+    return rows[0]
+
+
+def test_week_totals_count_offense_and_defense(totals):
+    assert totals.height == 4  # KC and BAL in weeks 1 and 2
+
+    kc = row(totals, team="KC", week=1)
+    assert kc["games"] == 1
+    assert (kc["plays_off"], kc["successes_off"]) == (2, 2)
+    assert kc["epa_off"] == pytest.approx(0.6)
+    assert (kc["pass_yards"], kc["rush_yards"]) == (10, 5)
+    assert (kc["plays_def"], kc["successes_def"]) == (2, 0)
+    assert kc["epa_def"] == pytest.approx(-3.5)
+    assert (kc["turnovers"], kc["takeaways"]) == (0, 2)
+
+    bal = row(totals, team="BAL", week=1)
+    assert (bal["pass_yards"], bal["rush_yards"]) == (0, 3)
+    assert (bal["turnovers"], bal["takeaways"]) == (2, 0)
+
+
+def test_season_stats_are_cumulative_through_each_week(totals):
+    stats = season_stats(totals, frame(GAMES, GAME_SCHEMA))
+    # One row per team and week played - week 4 has no result yet
+    assert sorted((r["team"], r["week"]) for r in stats.to_dicts()) == [
+        ("BAL", 1), ("BAL", 2), ("KC", 1), ("KC", 2), ("KC", 3), ("LV", 3),
+    ]
+
+    kc = row(stats, team="KC", week=2)
+    assert (kc["wins"], kc["losses"]) == (1, 1)
+    assert kc["pass_yards_per_game"] == 20.0
+    assert kc["rush_yards_per_game"] == 2.5
+    assert kc["total_yards_per_game"] == 22.5
+    assert kc["epa_per_play_off"] == pytest.approx(0.533)
+    assert kc["success_rate_off"] == 1.0
+    assert kc["ats_record"] == "1-0-1"  # Covered week 1, pushed week 2
+    assert kc["ats_win_pct"] == 1.0
+    assert kc["over_pct"] == 0.5
+
+    bal = row(stats, team="BAL", week=2)
+    assert (bal["wins"], bal["losses"]) == (1, 1)
+    assert bal["ats_record"] == "0-1-1"
+    assert bal["turnovers"] == 2
+
+    # Week 3 has a result but no plays - record moves, per-game stats do not
+    kc = row(stats, team="KC", week=3)
+    assert (kc["wins"], kc["losses"]) == (2, 1)
+    assert kc["pass_yards_per_game"] == 20.0
+    assert kc["ats_record"] == "2-0-1"
+    assert kc["over_pct"] == 0.5  # Week 3 landed on the total
+    lv = row(stats, team="LV", week=3)
+    assert lv["pass_yards_per_game"] is None and lv["epa_per_play_off"] is None
@@ -0,0 +1,40 @@
+"""Single-flight loads - one loader call per key at a time"""
+
+import asyncio
+
+from services.cache import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_loads():
+    flight = SingleFlight()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", loader) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["value"] * 5
+    assert len(calls) == 1
+    assert flight.coalesced == 4
+    assert not flight.is_running("key")
+
+
+def test_single_flight_load_survives_a_cancelled_caller():
+    flight = SingleFlight()
+
+    async def loader():
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("key", loader))
+        second = asyncio.ensure_future(flight.do("key", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "value"
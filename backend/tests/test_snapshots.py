@@ -0,0 +1,86 @@
+"""Snapshot versions and the leader's invalidation baseline"""
+
+import asyncio
+
+import pytest
+
+from services.cache import cache_manager
+from services.snapshots import SnapshotStore, TableSnapshot, VERSION_KEY
+
+
+def game(game_id, week, home="KC", away="BAL", home_score=None):
+    return {
+        "game_id": game_id, "season": 2025, "week": week, "gameday": f"2025-09-{week + 6:02d}",
+        "gametime": "20:20", "home_team": home, "away_team": away, "home_score": home_score,
+    }
+
+
+class FakeHashes:
+    """The two Redis hash commands publish uses"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    async def hget(self, name, key):
+        value = self.hashes.get(name, {}).get(key)
+        return value.encode() if value is not None else None
+
+    async def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = value
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    calls = []
+
+    async def invalidate_tags(*tags):
+        calls.append(set(tags))
+        return 0
+
+    monkeypatch.setattr(cache_manager, "invalidate_tags", invalidate_tags)
+    monkeypatch.setattr(cache_manager, "redis_client", FakeHashes())
+    return calls
+
+
+def test_version_ignores_read_order():
+    rows = [game("g1", 1), game("g2", 1, "DAL", "PHI"), game("g3", 2)]
+    assert TableSnapshot("schedules", rows).version == TableSnapshot("schedules", rows[::-1]).version
+    assert TableSnapshot("schedules", rows).version != TableSnapshot("schedules", rows[:2]).version
+
+
+def test_changed_rows_has_both_versions_and_removed_rows():
+    before = TableSnapshot("schedules", [game("g1", 1), game("g2", 1, "DAL", "PHI")])
+    after = TableSnapshot("schedules", [game("g1", 2), game("g3", 3)])
+    changed = after.changed_rows(before)
+    assert sorted((row["game_id"], row["week"]) for row in changed) == [
+        ("g1", 1), ("g1", 2), ("g2", 1), ("g3", 3),
+    ]
+
+
+def test_leader_invalidates_changed_rows_from_the_published_version(invalidated):
+    store = SnapshotStore()
+    first = TableSnapshot("schedules", [game("g1", 1), game("g2", 1, "DAL", "PHI")])
+    second = TableSnapshot("schedules", [game("g1", 1, home_score=24), game("g2", 1, "DAL", "PHI")])
+
+    asyncio.run(store.publish(first, None))  # Nothing published yet
+    assert invalidated.pop() == {"table:schedules"}
+    assert cache_manager.redis_client.hashes[VERSION_KEY]["schedules"] == first.version
+
+    asyncio.run(store.publish(second, first))
+    assert "schedules:game:g1" in invalidated[-1]
+    assert "schedules:game:g2" not in invalidated[-1]
+
+    asyncio.run(store.publish(second, first))  # Already published
+    assert len(invalidated) == 1
+
+
+def test_new_leader_without_the_baseline_invalidates_the_table(invalidated):
+    published = TableSnapshot("schedules", [game("g1", 1)])
+    changed = TableSnapshot("schedules", [game("g1", 1, home_score=24)])
+    asyncio.run(SnapshotStore().publish(published, None))
+    invalidated.clear()
+
+    # This worker loaded the change while following - its previous snapshot
+    # already has it, so only the shared version shows the change
+    asyncio.run(SnapshotStore().publish(changed, changed))
+    assert invalidated == [{"table:schedules"}]